@@ -0,0 +1,86 @@
+"""Fixtures of the benchmarks, they run under the offscreen platform unless ``QT_QPA_PLATFORM`` is set."""
+import os
+import typing
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PySide6 import QtCore, QtWidgets
+
+from __feature__ import snake_case  # noqa: F401
+
+from snakeribbon.ribbonbar import RibbonBar
+
+#: Controls of each panel of the generated ribbons
+CONTROLS_PER_PANEL = 20
+
+#: Panels of each category of the generated ribbons
+PANELS_PER_CATEGORY = 10
+
+
+def ribbon_spec(controls: int) -> typing.Dict[str, typing.Dict]:
+    """Return the data of ``RibbonBar.add_categories_by`` for a ribbon of small buttons.
+
+    :param controls: The number of buttons.
+    :return: The data.
+    """
+    spec = {}
+    for index in range(controls):
+        panel = index // CONTROLS_PER_PANEL
+        category = spec.setdefault(f"Category {panel // PANELS_PER_CATEGORY}", {"panels": {}})
+        widgets = category["panels"].setdefault(f"Panel {panel}", {"widgets": {}})["widgets"]
+        widgets[f"button-{index}"] = {"type": "SmallButton", "args": (f"Button {index}",)}
+    return spec
+
+
+def process_events():
+    """Process the pending events, including the deferred deletions."""
+    QtWidgets.QApplication.send_posted_events(None, QtCore.QEvent.Type.DeferredDelete)
+    QtWidgets.QApplication.process_events()
+
+
+@pytest.fixture(scope="session")
+def qapp() -> QtWidgets.QApplication:
+    """Return the application."""
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+class RibbonFactory(object):
+    """Create ribbons and delete them at the end of the benchmark."""
+
+    def __init__(self):
+        self._ribbons = []  # type: typing.List[RibbonBar]
+
+    def __call__(self, controls: int = 0, show: bool = True) -> RibbonBar:
+        """Create a new ribbon.
+
+        :param controls: The number of buttons of the ribbon.
+        :param show: Whether to show the ribbon.
+        :return: The ribbon.
+        """
+        ribbon = RibbonBar()
+        ribbon.init()
+        ribbon.resize(1200, 200)
+        if controls:
+            ribbon.add_categories_by(ribbon_spec(controls))
+        if show:
+            ribbon.show()
+            process_events()
+        self._ribbons.append(ribbon)
+        return ribbon
+
+    def delete(self):
+        """Delete the ribbons created."""
+        for ribbon in self._ribbons:
+            ribbon.hide()
+            ribbon.delete_later()
+        self._ribbons.clear()
+        process_events()
+
+
+@pytest.fixture
+def ribbon_factory(qapp) -> typing.Iterator[RibbonFactory]:
+    """Return a factory of ribbons deleted after the benchmark."""
+    factory = RibbonFactory()
+    yield factory
+    factory.delete()
@@ -0,0 +1,80 @@
+import json
+
+import pytest
+
+from snakeribbon.bench import compare, load_baseline, load_results, main
+
+
+def _timings(median: float, spread: float) -> list:
+    """Return timings of the given median whose IQR is the spread, in seconds."""
+    return [median - spread, median - spread / 2, median, median + spread / 2, median + spread]
+
+
+def _write_results(path, timings: dict):
+    """Write a pytest-benchmark JSON file of the timings, given by scenario as (median, spread) in milliseconds."""
+    benchmarks = []
+    for name, (median, spread) in timings.items():
+        data = _timings(median / 1000, spread / 1000)
+        benchmarks.append({"name": name, "stats": {"data": data, "median": median / 1000, "iqr": spread / 1000}})
+    path.write_text(json.dumps({"benchmarks": benchmarks}), encoding="utf-8")
+    return str(path)
+
+
+#: Timings of the baseline, by scenario, as median and IQR in milliseconds
+BASELINE = {
+    "test_stable": (10, 0.2),
+    "test_slower": (10, 0.2),
+    "test_faster": (10, 0.2),
+    "test_noisy": (10, 5),
+    "test_removed": (10, 0.2),
+}
+
+#: Timings of the current run: within the tolerance, 30% slower, 30% faster, 30% slower within the noise, new
+CURRENT = {
+    "test_stable": (10.3, 0.2),
+    "test_slower": (13, 0.2),
+    "test_faster": (7, 0.2),
+    "test_noisy": (13, 5),
+    "test_added": (5, 0.2),
+}
+
+
+def test_compare_statuses(tmp_path):
+    """Each scenario is told regressed, improved, within the noise, new or missing."""
+    baseline = load_results([_write_results(tmp_path / "baseline.json", BASELINE)])
+    current = load_results([_write_results(tmp_path / "current.json", CURRENT)])
+    assert current["test_noisy"][:2] == pytest.approx((0.013, 0.005))
+    statuses = {comparison.name: comparison.status for comparison in compare(current, baseline, tolerance=0.1)}
+    assert statuses == {
+        "test_added": "new",
+        "test_faster": "improved",
+        "test_noisy": "ok",
+        "test_removed": "missing",
+        "test_slower": "regressed",
+        "test_stable": "ok",
+    }
+
+
+def test_baseline_of_repeated_runs(tmp_path):
+    """The timings of repeated runs are pooled in the stored baseline."""
+    runs = [
+        _write_results(tmp_path / "run1.json", {"test_stable": (10, 0.2)}),
+        _write_results(tmp_path / "run2.json", {"test_stable": (12, 0.2)}),
+    ]
+    assert main(["baseline", *runs, "-o", str(tmp_path / "baseline.json")]) == 0
+    baseline = load_baseline(tmp_path / "baseline.json")
+    assert baseline["test_stable"].samples == 10
+    assert baseline["test_stable"].median == pytest.approx(0.011)
+
+
+def test_compare_exit_code(tmp_path, capsys):
+    """The comparison exits with 1 only when a scenario regressed."""
+    baseline = _write_results(tmp_path / "baseline.json", BASELINE)
+    current = _write_results(tmp_path / "current.json", CURRENT)
+    assert main(["compare", current, "--baseline", baseline, "--tolerance", "0.1"]) == 1
+    assert "1 regressed above a tolerance of 10%: test_slower" in capsys.readouterr().out
+
+    # The same slowdown is tolerated with a higher tolerance
+    assert main(["compare", current, "--baseline", baseline, "--tolerance", "0.5"]) == 0
+    unchanged = _write_results(tmp_path / "unchanged.json", BASELINE)
+    assert main(["compare", unchanged, "--baseline", baseline]) == 0
@@ -0,0 +1,77 @@
+import copy
+from pathlib import Path
+
+from __feature__ import snake_case  # noqa: F401
+
+from snakeribbon.compile import RibbonBundle, compute_placements, scale_icons, validate_spec, write_bundle
+from snakeribbon.testing import generate_spec
+
+#: Icons of the example application
+ICONS = Path(__file__).resolve().parent.parent / "examples" / "icons"
+
+
+def _positions(ribbon):
+    """Return the cells of the widgets of a ribbon, by category and panel, in the order they were added."""
+    positions = {}
+    for category_title, category in ribbon.categories().items():
+        for panel_title, panel in category.panels().items():
+            layout = panel._actions_layout
+            positions[(category_title, panel_title)] = [
+                layout.get_item_position(layout.index_of(widget.parent_widget())) for widget in panel.widgets()
+            ]
+    return positions
+
+
+def _compile(spec, path, icons=None) -> Path:
+    """Validate a spec, compute its cells and write it as a bundle."""
+    assert validate_spec(spec) == []
+    compute_placements(spec)
+    write_bundle(RibbonBundle(spec, 6, "", icons or {}), path)
+    return path
+
+
+def test_bundle_matches_direct_build(tmp_path, ribbon_factory):
+    """A compiled bundle places the widgets in the cells the data places them in."""
+    spec = generate_spec(categories=3, panels=4, widgets=10, seed=0)
+    bundle = _compile(copy.deepcopy(spec), tmp_path / "ribbon.bundle")
+
+    loaded = ribbon_factory(show=False)
+    loaded.load_bundle(bundle)
+    direct = ribbon_factory(show=False)
+    direct.add_categories_by(spec)
+    assert _positions(loaded) == _positions(direct)
+
+
+def test_bundle_of_legacy_arguments(tmp_path, ribbon_factory):
+    """The former ``arguments`` key of the widgets is compiled, with its icons scaled."""
+    widgets = {
+        "paste": {"type": "LargeButton", "args": ["Paste"], "arguments": {"icon": "paste.png"}},
+        "cut": {"type": "SmallButton", "args": ["Cut"], "arguments": {"icon": "cut.png"}},
+        "copy": {"type": "SmallButton", "args": ["Copy"], "arguments": {"icon": "copy.png"}},
+    }
+    spec = {"Home": {"panels": {"Clipboard": {"widgets": widgets}}}}
+    icons = scale_icons(spec, ICONS, jobs=1)
+    assert sorted(icons) == ["copy.png", "cut.png", "paste.png"]
+    bundle = _compile(copy.deepcopy(spec), tmp_path / "ribbon.bundle", icons)
+
+    loaded = ribbon_factory(show=False)
+    loaded.load_bundle(bundle)
+    panel = loaded.categories()["Home"].panels()["Clipboard"]
+    assert [button.text() for button in panel.widgets()] == ["Paste", "Cut", "Copy"]
+    assert all(not button.icon().is_null() for button in panel.widgets())
+
+    for widget in widgets.values():
+        del widget["arguments"]
+    direct = ribbon_factory(show=False)
+    direct.add_categories_by(spec)
+    assert _positions(loaded) == _positions(direct)
+
+
+def test_validate_spec_reports_invalid_kwargs():
+    """Keyword arguments the method of a widget does not take are reported with the path of the widget."""
+    widgets = {"gallery": {"type": "Gallery", "kwargs": {"min_width": 200}}}
+    spec = {"Home": {"panels": {"Gallery": {"widgets": widgets}}}}
+    errors = validate_spec(spec)
+    assert len(errors) == 1
+    assert errors[0].startswith("Home / Gallery / gallery: ")
+    assert "min_width" in errors[0]
@@ -0,0 +1,52 @@
+import pytest
+
+from __feature__ import snake_case  # noqa: F401
+
+from snakeribbon.constants import Small
+from snakeribbon.panel import RibbonGridLayoutManager
+from snakeribbon.testing import generate_spec
+
+from conftest import ribbon_spec
+
+#: Rounds of each size, so the large ribbons are still built several times
+ROUNDS = {100: 20, 1000: 5, 10000: 3}
+
+
+@pytest.mark.parametrize("controls", [100, 1000, 10000])
+def test_add_categories_by(benchmark, ribbon_factory, controls):
+    """Build a ribbon from data."""
+
+    def setup():
+        ribbon_factory.delete()
+        return (ribbon_factory(show=False), ribbon_spec(controls)), {}
+
+    def build(ribbon, spec):
+        ribbon.add_categories_by(spec)
+
+    benchmark.pedantic(build, setup=setup, rounds=ROUNDS[controls])
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_add_generated_categories(benchmark, ribbon_factory, seed):
+    """Build a ribbon of 1k mixed widgets, with galleries, combo boxes and context categories."""
+
+    def setup():
+        ribbon_factory.delete()
+        return (ribbon_factory(show=False), generate_spec(categories=5, panels=10, widgets=20, seed=seed)), {}
+
+    def build(ribbon, spec):
+        ribbon.add_categories_by(spec)
+
+    benchmark.pedantic(build, setup=setup, rounds=5)
+
+
+@pytest.mark.parametrize("cells", [100, 1000, 10000])
+def test_request_cells(benchmark, cells):
+    """Place cells in the grid of a panel."""
+
+    def place():
+        grid = RibbonGridLayoutManager(6)
+        for _ in range(cells):
+            grid.request_cells(Small)
+
+    benchmark.pedantic(place, rounds=ROUNDS[cells])
@@ -0,0 +1,54 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def _imported(code: str, modules: tuple) -> list:
+    """Run code in a new interpreter and return the modules it imported among the ones given."""
+    check = f"import sys\n{code}\nprint(' '.join(name for name in {modules!r} if name in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+def test_constants_import_is_light():
+    """Importing the package and its constants must not load the widgets, the galleries or NumPy."""
+    code = "import snakeribbon\nsnakeribbon.RibbonVisibilityState"
+    assert _imported(code, ("numpy", "snakeribbon.gallery", "PySide6.QtWidgets")) == []
+
+
+#: Modules imported on first use by the widgets
+LAZY_MODULES = (
+    "asyncio",
+    "concurrent.futures",
+    "numpy",
+    "snakeribbon.asyncslots",
+    "snakeribbon.compile",
+    "snakeribbon.gallery",
+    "snakeribbon.menu",
+)
+
+#: Modules of the optional features of the ribbon bar, imported once enabled or requested
+OPTIONAL_MODULES = (
+    "snakeribbon.backstage",
+    "snakeribbon.heatmap",
+    "snakeribbon.keytips",
+    "snakeribbon.memory",
+    "snakeribbon.search",
+    "snakeribbon.updates",
+    "snakeribbon.watchdog",
+    "tracemalloc",
+)
+
+
+@pytest.mark.parametrize(
+    "module, modules",
+    [
+        ("snakeribbon.panel", LAZY_MODULES),
+        ("snakeribbon.ribbonbar", LAZY_MODULES + OPTIONAL_MODULES),
+    ],
+)
+def test_widgets_import_is_light(module, modules):
+    """Importing the widgets must not load asyncio, the compiler, NumPy, the galleries nor the optional features."""
+    # The modules of the widgets enable the snake_case feature, which needs PySide6 imported first
+    assert _imported(f"import PySide6\nimport {module}", modules) == []
@@ -0,0 +1,91 @@
+from pathlib import Path
+
+import pytest
+from PySide6 import QtCore, QtWidgets
+
+from __feature__ import snake_case  # noqa: F401
+
+from snakeribbon.utils import ThemeFile
+
+from conftest import process_events
+
+#: Style sheets of the example application
+THEMES = [Path(__file__).resolve().parent.parent / "examples" / "themes" / name for name in ("base.qss", "default.qss")]
+
+
+def test_tab_switch(benchmark, ribbon_factory):
+    """Show each category of a ribbon of 1k controls, until it is painted."""
+    ribbon = ribbon_factory(1000)
+    tab_count = ribbon.tab_bar().count()
+
+    def switch():
+        for index in range(tab_count):
+            ribbon.show_category_by_index(index)
+            process_events()
+
+    benchmark(switch)
+
+
+def test_resize_storm(benchmark, ribbon_factory):
+    """Resize a category of 200 controls to 50 widths, laying it out each time."""
+    ribbon = ribbon_factory(200)
+    category = ribbon.current_category()
+    widths = [400 + 20 * step for step in range(50)]
+
+    def resize():
+        for width in widths:
+            category.resize(width, category.height())
+            process_events()
+
+    benchmark(resize)
+
+
+@pytest.mark.parametrize("items", [1000, 10000])
+def test_gallery_fill(benchmark, ribbon_factory, items):
+    """Add buttons to a gallery."""
+
+    def setup():
+        ribbon_factory.delete()
+        ribbon = ribbon_factory(show=False)
+        return (ribbon.add_category("Gallery").add_panel("Gallery").add_gallery(),), {}
+
+    def fill(gallery):
+        for index in range(items):
+            gallery.add_button(f"Item {index}")
+
+    benchmark.pedantic(fill, setup=setup, rounds=3 if items > 1000 else 5)
+
+
+def test_theme(benchmark, ribbon_factory):
+    """Apply the style sheets of the example application to a ribbon of 1k controls."""
+    ribbon = ribbon_factory(1000)
+
+    def setup():
+        ribbon.set_style_sheet("")
+        process_events()
+        return (type(ThemeFile)(),), {}
+
+    def apply(theme_file):
+        for path in THEMES:
+            theme_file.update_registry_data(ribbon, path)
+        process_events()
+
+    benchmark.pedantic(apply, setup=setup, rounds=5)
+
+
+def test_context_categories_toggle(benchmark, ribbon_factory):
+    """Show and hide a group of context categories next to a ribbon of 1k controls."""
+    ribbon = ribbon_factory(1000)
+    contexts = ribbon.add_context_categories("Tools", [f"Tools {index}" for index in range(3)], QtCore.Qt.GlobalColor.red)
+    for category in contexts.values():
+        category.add_panel("Panel").add_small_button("Button")
+    ribbon.hide_context_category(contexts)
+    process_events()
+
+    def toggle():
+        ribbon.show_context_category(contexts)
+        process_events()
+        ribbon.hide_context_category(contexts)
+        process_events()
+
+    benchmark(toggle)
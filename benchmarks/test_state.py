@@ -0,0 +1,83 @@
+import time
+
+from __feature__ import snake_case  # noqa: F401
+
+from snakeribbon.constants import Collapsed, Expanded, RibbonVisibilityState
+
+from conftest import process_events
+
+#: Time budget of a save and a restore of the state of a ribbon of 2k controls, in seconds
+STATE_BUDGET = 0.05
+
+#: Margin of the single timed round trip, the budget is checked on the median of the benchmark
+SINGLE_SHOT_MARGIN = 5
+
+
+def _state_ribbon(ribbon_factory):
+    """Return a hidden ribbon of 2k controls with a gallery of 200 checkable buttons in each category."""
+    ribbon = ribbon_factory(2000, show=False)
+    for category in ribbon.categories().values():
+        gallery = category.add_panel("Gallery").add_gallery(minimum_width=300)
+        for index in range(200):
+            gallery.add_button(f"Item {index}", checkable=True)
+    return ribbon
+
+
+def _snapshot(ribbon):
+    """Return the state of a ribbon restored by ``restore_state``."""
+    galleries = ribbon._galleries()
+    return {
+        "category": ribbon.current_category().title(),
+        "state": ribbon.ribbon_state(),
+        "scroll": {title: category.scroll_position() for title, category in ribbon.categories().items()},
+        "galleries": {
+            path: (
+                gallery.scroll_position(),
+                [row for row, button in enumerate(gallery.buttons()) if button.is_checked()],
+            )
+            for path, gallery in galleries.items()
+        },
+    }
+
+
+def test_state_round_trip(benchmark, ribbon_factory):
+    """Save the state of a ribbon of 2k controls and restore it in a new one, within the time budget."""
+    ribbon = _state_ribbon(ribbon_factory)
+    ribbon.show()
+    process_events()
+    categories = list(ribbon.categories().values())
+    ribbon.set_current_category(categories[-1])
+    for category in categories:
+        scroll_bar = category._category_scroll_area.horizontal_scroll_bar()
+        category.set_scroll_position(scroll_bar.maximum() // 2)
+    for gallery in ribbon._galleries().values():
+        gallery.buttons()[3].set_checked(True)
+        gallery.buttons()[150].set_checked(True)
+        gallery.set_scroll_position(gallery._list_widget.vertical_scroll_bar().maximum())
+    ribbon.set_ribbon_state(Collapsed)
+    process_events()
+    expected = _snapshot(ribbon)
+    assert expected["category"] != categories[0].title()
+    assert any(expected["scroll"].values())
+    assert any(position for position, _ in expected["galleries"].values())
+
+    restored = _state_ribbon(ribbon_factory)
+    start = time.perf_counter()
+    assert restored.restore_state(ribbon.save_state())
+    elapsed = time.perf_counter() - start
+    restored.show()
+    process_events()
+    assert _snapshot(restored) == expected
+    assert restored.ribbon_state() == RibbonVisibilityState.Collapsed
+    assert elapsed < STATE_BUDGET * SINGLE_SHOT_MARGIN, f"The state round trip took {elapsed * 1000:.1f} ms"
+    # The positions of the categories not laid out yet are applied once they are shown
+    restored.set_ribbon_state(Expanded)
+    restored.set_current_category(restored.categories()[categories[0].title()])
+    process_events()
+    scroll_bar = restored.current_category()._category_scroll_area.horizontal_scroll_bar()
+    assert scroll_bar.value() == expected["scroll"][categories[0].title()]
+
+    benchmark(lambda: restored.restore_state(ribbon.save_state()))
+    if not benchmark.disabled:
+        median = benchmark.stats.stats.median
+        assert median < STATE_BUDGET, f"The median state round trip took {median * 1000:.1f} ms"
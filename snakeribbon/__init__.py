@@ -0,0 +1,91 @@
+"""Ribbon bar for PySide6 applications.
+
+The public classes are importable from the package, their modules are only imported on first use, so importing
+:mod:`snakeribbon` or the constants does not load the widgets, the galleries, the menus or NumPy.
+
+.. code-block:: python
+
+    from snakeribbon import RibbonBar, RibbonButtonStyle
+"""
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from .backstage import RibbonBackstageView  # noqa: F401
+    from .category import (  # noqa: F401
+        RibbonCategory,
+        RibbonContextCategories,
+        RibbonContextCategory,
+        RibbonNormalCategory,
+    )
+    from .constants import (  # noqa: F401
+        RibbonAsyncPolicy,
+        RibbonButtonStyle,
+        RibbonCategoryStyle,
+        RibbonIcon,
+        RibbonSpaceFindMode,
+        RibbonVisibilityState,
+    )
+    from .gallery import RibbonGallery  # noqa: F401
+    from .keytips import RibbonKeyTips  # noqa: F401
+    from .layoutcache import RibbonLayoutCache  # noqa: F401
+    from .menu import RibbonActionList, RibbonMenu, RibbonPermanentMenu  # noqa: F401
+    from .panel import RibbonPanel  # noqa: F401
+    from .ribbonbar import RibbonBar  # noqa: F401
+    from .search import RibbonCommandIndex, RibbonCommandSearch  # noqa: F401
+    from .separator import RibbonHorizontalSeparator, RibbonSeparator, RibbonVerticalSeparator  # noqa: F401
+    from .shortcuts import RibbonShortcutRegistry  # noqa: F401
+    from .tabbar import RibbonTabBar  # noqa: F401
+    from .toolbutton import RibbonToolButton  # noqa: F401
+    from .utils import DataFile, ThemeFile  # noqa: F401
+
+#: Module of each public name, imported on first access
+_exports = {
+    "RibbonBackstageView": "backstage",
+    "RibbonCategory": "category",
+    "RibbonContextCategories": "category",
+    "RibbonContextCategory": "category",
+    "RibbonNormalCategory": "category",
+    "RibbonAsyncPolicy": "constants",
+    "RibbonButtonStyle": "constants",
+    "RibbonCategoryStyle": "constants",
+    "RibbonIcon": "constants",
+    "RibbonSpaceFindMode": "constants",
+    "RibbonVisibilityState": "constants",
+    "RibbonGallery": "gallery",
+    "RibbonKeyTips": "keytips",
+    "RibbonLayoutCache": "layoutcache",
+    "RibbonActionList": "menu",
+    "RibbonMenu": "menu",
+    "RibbonPermanentMenu": "menu",
+    "RibbonPanel": "panel",
+    "RibbonBar": "ribbonbar",
+    "RibbonCommandIndex": "search",
+    "RibbonCommandSearch": "search",
+    "RibbonHorizontalSeparator": "separator",
+    "RibbonSeparator": "separator",
+    "RibbonVerticalSeparator": "separator",
+    "RibbonShortcutRegistry": "shortcuts",
+    "RibbonTabBar": "tabbar",
+    "RibbonToolButton": "toolbutton",
+    "DataFile": "utils",
+    "ThemeFile": "utils",
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name: str) -> typing.Any:
+    """Import the module of a public name on first access."""
+    module = _exports.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # PySide6 provides the __feature__ module the submodules enable snake_case with
+    importlib.import_module("PySide6")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(__all__))
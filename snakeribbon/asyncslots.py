@@ -0,0 +1,187 @@
+from __feature__ import snake_case
+
+import asyncio
+import concurrent.futures
+import inspect
+import sys
+import threading
+import typing
+
+import shiboken6
+from PySide6 import QtCore, QtWidgets
+
+from snakeribbon.constants import Cancel, Ignore, Queue, RibbonAsyncPolicy
+
+_background_loop = None  # type: typing.Optional[asyncio.AbstractEventLoop]
+_background_lock = threading.Lock()
+
+
+def background_loop() -> asyncio.AbstractEventLoop:
+    """Return the asyncio event loop running the coroutines of the slots when the GUI thread runs none.
+
+    The loop runs in a daemon thread started on first use, its coroutines must not call the widgets, they can
+    update them through :meth:`RibbonBar.update_queue`.
+
+    :return: The event loop.
+    """
+    global _background_loop
+    with _background_lock:
+        if _background_loop is None:
+            _background_loop = asyncio.new_event_loop()
+            threading.Thread(target=_background_loop.run_forever, name="snakeribbon-asyncio", daemon=True).start()
+    return _background_loop
+
+
+def _accepts_argument(slot: typing.Callable) -> bool:
+    """Return whether a slot takes the checked state of the button, as Qt passes it."""
+    try:
+        parameters = inspect.signature(slot).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(
+        parameter.kind
+        in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            inspect.Parameter.VAR_POSITIONAL,
+        )
+        for parameter in parameters
+    )
+
+
+class RibbonAsyncCommand(QtCore.QObject):
+    """Run the asynchronous slot of buttons, a coroutine function or a callable returning a future, without blocking.
+
+    Coroutines run on the asyncio loop of the GUI thread if one is running, e.g. with ``QtAsyncio`` or qasync,
+    otherwise on :func:`background_loop`. Callables returning a :class:`concurrent.futures.Future`, e.g. from
+    ``executor.submit``, or an asyncio future are watched the same way. While a slot runs, its buttons have the
+    ``busy`` property, for style sheets, and the busy cursor, and a click on them follows the policy.
+    :func:`snakeribbon.utils.connect_slot` creates the commands of the asynchronous slots only.
+    """
+
+    #: Emitted on the GUI thread when an asynchronous run of the slot is done, with its future
+    finished = QtCore.Signal(object)
+
+    #: Emitted from any thread when a future is done
+    _done = QtCore.Signal(object)
+
+    def __init__(
+        self,
+        buttons: typing.Sequence[QtWidgets.QAbstractButton],
+        slot: typing.Callable,
+        policy: RibbonAsyncPolicy = Cancel,
+    ):
+        """Create a new command and connect it to the buttons, it is a child of the first button.
+
+        :param buttons: The buttons running the slot, e.g. a gallery button and its popup button.
+        :param slot: The slot.
+        :param policy: What a click does while the slot is running.
+        """
+        super().__init__(buttons[0])
+        self._buttons = list(buttons)
+        self._slot = slot
+        self._policy = policy
+        self._accepts_checked = _accepts_argument(slot)
+        self._future = None  # type: typing.Optional[typing.Union[asyncio.Future, concurrent.futures.Future]]
+        self._queued = 0
+        self._done.connect(self._on_done, QtCore.Qt.ConnectionType.QueuedConnection)  # type: ignore
+        for button in self._buttons:
+            button.clicked.connect(self.run)  # type: ignore
+
+    def policy(self) -> RibbonAsyncPolicy:
+        """Return what a click does while the slot is running.
+
+        :return: The policy.
+        """
+        return self._policy
+
+    def set_policy(self, policy: RibbonAsyncPolicy):
+        """Set what a click does while the slot is running.
+
+        :param policy: The policy.
+        """
+        self._policy = policy
+
+    def is_running(self) -> bool:
+        """Return whether an asynchronous run of the slot is not done.
+
+        :return: Whether the slot is running.
+        """
+        return self._future is not None
+
+    def cancel(self) -> bool:
+        """Cancel the running slot and the queued runs.
+
+        :return: Whether the slot was cancelled, a function already running on a thread cannot be.
+        """
+        self._queued = 0
+        if self._future is None:
+            return False
+        future = self._future
+        if asyncio.isfuture(future) and future.get_loop() is not _running_loop():
+            future.get_loop().call_soon_threadsafe(future.cancel)
+            return True
+        return future.cancel()
+
+    def run(self, checked: bool = False):
+        """Run the slot, or follow the policy if it is running.
+
+        :param checked: The checked state of the button.
+        """
+        if self._future is not None:
+            if self._policy == Queue:
+                self._queued += 1
+            elif self._policy == Cancel:
+                self.cancel()
+            return
+        result = self._slot(checked) if self._accepts_checked else self._slot()
+        if inspect.iscoroutine(result):
+            loop = _running_loop()
+            if loop is not None:
+                result = loop.create_task(result)
+            else:
+                result = asyncio.run_coroutine_threadsafe(result, background_loop())
+        if not asyncio.isfuture(result) and not isinstance(result, concurrent.futures.Future):
+            return
+        self._future = result
+        self._set_busy(True)
+        result.add_done_callback(self._done.emit)
+
+    def _on_done(self, future: typing.Union[asyncio.Future, concurrent.futures.Future]):
+        """Restore the buttons, report the error of the slot and run the queued clicks."""
+        if future is not self._future:
+            return
+        self._future = None
+        self._set_busy(False)
+        if not future.cancelled():
+            error = future.exception()
+            if error is not None:
+                sys.excepthook(type(error), error, error.__traceback__)
+        self.finished.emit(future)
+        if self._queued:
+            self._queued -= 1
+            self.run(self._buttons[0].is_checked())
+
+    def _set_busy(self, busy: bool):
+        """Show or hide the busy state of the buttons."""
+        for button in self._buttons:
+            if not shiboken6.isValid(button):
+                continue
+            button.set_property("busy", busy)
+            button.style().unpolish(button)
+            button.style().polish(button)
+            if busy:
+                button.set_cursor(QtCore.Qt.CursorShape.BusyCursor)
+            else:
+                button.unset_cursor()
+            if self._policy == Ignore:
+                button.set_enabled(not busy)
+
+
+def _running_loop() -> typing.Optional[asyncio.AbstractEventLoop]:
+    """Return the asyncio event loop running in the current thread, if any."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
@@ -0,0 +1,282 @@
+from __feature__ import snake_case
+
+import collections
+import typing
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+from snakeribbon.constants import RibbonIcon
+from snakeribbon.utils import DataFile
+
+#: A callable building the widget of a backstage page
+RibbonBackstagePageFactory = typing.Callable[[], QtWidgets.QWidget]
+
+
+class RibbonBackstageBackButton(QtWidgets.QToolButton):
+    """Button closing the backstage view."""
+
+
+class RibbonBackstageNavigation(QtWidgets.QListWidget):
+    """List of the pages of the backstage view."""
+
+
+class RibbonBackstagePages(QtWidgets.QStackedWidget):
+    """Stack of the built pages of the backstage view."""
+
+
+class RibbonBackstageView(QtWidgets.QFrame):
+    """Full-window view opened from the application button, with file, info, print, export... pages.
+
+    Pages are registered as factories and built the first time they are shown. Built pages are kept in a least
+    recently used cache, the oldest pages beyond the cache size are deleted and built again when shown.
+    """
+
+    #: Signal, a page was built.
+    page_created = QtCore.Signal(str)
+
+    #: Signal, the backstage view was closed.
+    closed = QtCore.Signal()
+
+    #: Maximum number of built pages kept, pinned pages are not counted
+    _maximum_cached_pages = 3
+
+    #: Duration of the slide-in animation in milliseconds, 0 to disable it
+    _animation_duration = 150
+
+    #: Width of the navigation list
+    _navigation_width = 160
+
+    def __init__(self, parent=None):
+        """Create a new backstage view.
+
+        :param parent: The parent widget, the view is moved to its window when shown.
+        """
+        super().__init__(parent)
+        self._factories = {}  # type: typing.Dict[str, RibbonBackstagePageFactory]
+        self._pinned = set()  # type: typing.Set[str]
+        self._built_pages = collections.OrderedDict()  # type: typing.OrderedDict[str, QtWidgets.QWidget]
+        self.set_auto_fill_background(True)
+        self.hide()
+
+        self._back_button = RibbonBackstageBackButton(self)
+        self._back_button.set_icon(QtGui.QIcon(DataFile(RibbonIcon.Backward)))
+        self._back_button.set_text("Back")
+        self._back_button.set_tool_button_style(QtCore.Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
+        self._back_button.set_auto_raise(True)
+        self._back_button.set_tool_tip("Back")
+        self._back_button.clicked.connect(self.hide_backstage)  # type: ignore
+
+        self._navigation = RibbonBackstageNavigation(self)
+        self._navigation.set_fixed_width(self._navigation_width)
+        self._navigation.currentTextChanged.connect(self._show_page)  # type: ignore
+
+        self._pages = RibbonBackstagePages(self)
+
+        self._navigation_layout = QtWidgets.QVBoxLayout()
+        self._navigation_layout.set_contents_margins(0, 0, 0, 0)
+        self._navigation_layout.set_spacing(0)
+        self._navigation_layout.add_widget(self._back_button, 0, QtCore.Qt.AlignmentFlag.AlignLeft)
+        self._navigation_layout.add_widget(self._navigation, 1)
+
+        self._main_layout = QtWidgets.QHBoxLayout(self)
+        self._main_layout.set_contents_margins(0, 0, 0, 0)
+        self._main_layout.set_spacing(0)
+        self._main_layout.add_layout(self._navigation_layout, 0)
+        self._main_layout.add_widget(self._pages, 1)
+
+        self._animation = QtCore.QPropertyAnimation(self, b"pos", self)
+        self._animation.set_easing_curve(QtCore.QEasingCurve.Type.OutCubic)
+
+    def add_page(
+        self,
+        title: str,
+        factory: RibbonBackstagePageFactory,
+        icon: QtGui.QIcon = None,
+        keep_alive: bool = False,
+    ):
+        """Register a page, it is built by the factory the first time it is shown.
+
+        :param title: The title of the page.
+        :param factory: A callable returning the widget of the page.
+        :param icon: The icon of the page.
+        :param keep_alive: Whether the page is never evicted from the cache once built.
+        """
+        if title in self._factories:
+            raise ValueError(f"Page with title {title} already exists.")
+        self._factories[title] = factory
+        if keep_alive:
+            self._pinned.add(title)
+        item = QtWidgets.QListWidgetItem(title)
+        if icon is not None:
+            item.set_icon(icon)
+        self._navigation.add_item(item)
+
+    def remove_page(self, title: str):
+        """Remove a page.
+
+        :param title: The title of the page.
+        """
+        self._factories.pop(title)
+        self._pinned.discard(title)
+        self._evict(title)
+        for item in self._navigation.find_items(title, QtCore.Qt.MatchFlag.MatchExactly):
+            self._navigation.take_item(self._navigation.row(item))
+
+    def pages(self) -> typing.List[str]:
+        """Return the titles of the pages.
+
+        :return: The titles of the pages.
+        """
+        return list(self._factories)
+
+    def page(self, title: str) -> typing.Optional[QtWidgets.QWidget]:
+        """Return the widget of a page if it is built.
+
+        :param title: The title of the page.
+        :return: The widget of the page, None if it is not built.
+        """
+        return self._built_pages.get(title)
+
+    def current_page(self) -> str:
+        """Return the title of the current page.
+
+        :return: The title of the current page, empty if there is none.
+        """
+        item = self._navigation.current_item()
+        return item.text() if item is not None else ""
+
+    def set_current_page(self, title: str):
+        """Select a page, it is built if needed.
+
+        :param title: The title of the page.
+        """
+        if title not in self._factories:
+            raise ValueError(f"Page with title {title} does not exist.")
+        items = self._navigation.find_items(title, QtCore.Qt.MatchFlag.MatchExactly)
+        self._navigation.set_current_item(items[0])
+
+    def maximum_cached_pages(self) -> int:
+        """Return the maximum number of built pages kept.
+
+        :return: The maximum number of built pages.
+        """
+        return self._maximum_cached_pages
+
+    def set_maximum_cached_pages(self, count: int):
+        """Set the maximum number of built pages kept, pinned pages are not counted.
+
+        :param count: The maximum number of built pages.
+        """
+        self._maximum_cached_pages = max(count, 1)
+        self._evict_least_recently_used()
+
+    def animation_duration(self) -> int:
+        """Return the duration of the slide-in animation.
+
+        :return: The duration in milliseconds.
+        """
+        return self._animation_duration
+
+    def set_animation_duration(self, duration: int):
+        """Set the duration of the slide-in animation.
+
+        :param duration: The duration in milliseconds, 0 to disable the animation.
+        """
+        self._animation_duration = duration
+
+    def is_open(self) -> bool:
+        """Return whether the backstage view is shown.
+
+        :return: Whether the backstage view is shown.
+        """
+        return self.is_visible()
+
+    def show_backstage(self, title: str = None):
+        """Show the backstage view over the whole window.
+
+        :param title: The title of the page to show, the current or the first page if None.
+        """
+        window = self.parent_widget().window() if self.parent_widget() is not None else self
+        if window is not self and self.parent_widget() is not window:
+            self.set_parent(window)
+        if title is not None:
+            self.set_current_page(title)
+        elif self._navigation.current_item() is None and self._navigation.count() > 0:
+            self._navigation.set_current_row(0)
+        geometry = window.rect() if window is not self else self.geometry()
+        if self.parent_widget() is not None:
+            self.parent_widget().install_event_filter(self)
+        self.set_geometry(geometry)
+        self.raise_()
+        self.show()
+        self.set_focus()
+        if self._animation_duration > 0:
+            # Only the position is animated, the view is laid out once at its final size
+            self._animation.stop()
+            self._animation.set_duration(self._animation_duration)
+            self._animation.set_start_value(QtCore.QPoint(geometry.left() - geometry.width(), geometry.top()))
+            self._animation.set_end_value(geometry.top_left())
+            self._animation.start()
+
+    def hide_backstage(self):
+        """Hide the backstage view."""
+        if not self.is_visible():
+            return
+        self._animation.stop()
+        if self.parent_widget() is not None:
+            self.parent_widget().remove_event_filter(self)
+        self.hide()
+        self.closed.emit()
+
+    def event_filter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        """Follow the size of the window while shown."""
+        if watched is self.parent_widget() and event.type() == QtCore.QEvent.Type.Resize:
+            self._animation.stop()
+            self.set_geometry(watched.rect())
+        return super().event_filter(watched, event)
+
+    def key_press_event(self, event: QtGui.QKeyEvent) -> None:
+        """Close the backstage view on escape."""
+        if event.key() == QtCore.Qt.Key.Key_Escape:
+            self.hide_backstage()
+        else:
+            super().key_press_event(event)
+
+    def _show_page(self, title: str):
+        """Show a page, building it on first use.
+
+        :param title: The title of the page.
+        """
+        if title not in self._factories:
+            return
+        page = self._built_pages.get(title)
+        if page is None:
+            page = self._factories[title]()
+            self._built_pages[title] = page
+            self._pages.add_widget(page)
+            self.page_created.emit(title)
+        else:
+            self._built_pages.move_to_end(title)
+        self._pages.set_current_widget(page)
+        self._evict_least_recently_used()
+
+    def _evict_least_recently_used(self):
+        """Delete the least recently used pages beyond the cache size."""
+        current = self.current_page()
+        evictable = [title for title in self._built_pages if title not in self._pinned and title != current]
+        count = len([title for title in self._built_pages if title not in self._pinned])
+        for title in evictable:
+            if count <= self._maximum_cached_pages:
+                break
+            self._evict(title)
+            count -= 1
+
+    def _evict(self, title: str):
+        """Delete the widget of a page.
+
+        :param title: The title of the page.
+        """
+        page = self._built_pages.pop(title, None)
+        if page is not None:
+            self._pages.remove_widget(page)
+            page.delete_later()
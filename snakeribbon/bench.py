@@ -0,0 +1,260 @@
+"""Compare benchmark results with a stored baseline and fail on regressions.
+
+Results are the JSON files written by ``pytest --benchmark-json`` on the suite of the ``benchmarks`` directory.
+Store a baseline once, then gate each later run against it:
+
+.. code-block:: shell
+
+    pytest --benchmark-json=run1.json && pytest --benchmark-json=run2.json
+    python -m snakeribbon.bench baseline run1.json run2.json -o baseline.json
+    ...
+    pytest --benchmark-json=current.json
+    python -m snakeribbon.bench compare current.json --baseline baseline.json --tolerance 0.1
+
+Several files of the same scenarios are treated as repeated runs. Each scenario is summarized by the median and
+the interquartile range (IQR) of its timings: the raw timings when the files hold them, as the ones of
+``--benchmark-json`` do, otherwise the medians and IQRs of the runs. A scenario regresses when its median
+grows by more than the tolerance, a fraction of the baseline median, and by more than the noise, a multiple of
+the IQRs. ``compare`` exits with 1 if any scenario regressed.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import typing
+
+#: Version of the baseline format
+BASELINE_VERSION = 1
+
+#: Default tolerated growth of the median, as a fraction of the baseline median
+DEFAULT_TOLERANCE = 0.1
+
+#: Default number of IQRs the median must grow by to be told apart from noise
+DEFAULT_IQR_FACTOR = 1.5
+
+
+class Summary(typing.NamedTuple):
+    """Timings of a scenario, in seconds."""
+
+    #: Median of the timings
+    median: float
+    #: Interquartile range of the timings
+    iqr: float
+    #: Number of timings, or of runs when the raw timings were not saved
+    samples: int
+
+
+class Comparison(typing.NamedTuple):
+    """Comparison of a scenario with its baseline."""
+
+    #: Name of the scenario
+    name: str
+    #: Timings of the baseline, None if the scenario is new
+    baseline: typing.Optional[Summary]
+    #: Timings of the current run, None if the scenario is missing
+    current: typing.Optional[Summary]
+    #: One of "ok", "regressed", "improved", "new" or "missing"
+    status: str
+
+    def change(self) -> typing.Optional[float]:
+        """Return the change of the median, as a fraction of the baseline median.
+
+        :return: The change, None if the scenario is new or missing.
+        """
+        if self.baseline is None or self.current is None or not self.baseline.median:
+            return None
+        return self.current.median / self.baseline.median - 1
+
+
+def summarize(samples: typing.Sequence[float]) -> Summary:
+    """Return the median and IQR of timings.
+
+    :param samples: The timings.
+    :return: The summary.
+    """
+    if len(samples) < 2:
+        return Summary(samples[0], 0.0, len(samples))
+    q1, median, q3 = statistics.quantiles(samples, n=4, method="inclusive")
+    return Summary(statistics.median(samples), q3 - q1, len(samples))
+
+
+def _load(path: typing.Union[str, os.PathLike]) -> typing.Dict[str, typing.Any]:
+    """Return the content of a JSON file."""
+    with open(path, "r", encoding="utf-8") as results_file:
+        return json.load(results_file)
+
+
+def load_results(paths: typing.Sequence[typing.Union[str, os.PathLike]]) -> typing.Dict[str, Summary]:
+    """Load the results of pytest-benchmark runs, several files are repeated runs of the same scenarios.
+
+    :param paths: The JSON files written by ``pytest --benchmark-json``.
+    :return: The summaries, by scenario name.
+    """
+    runs = {}  # type: typing.Dict[str, typing.List[typing.Dict[str, typing.Any]]]
+    for path in paths:
+        results = _load(path)
+        if "benchmarks" not in results or not isinstance(results["benchmarks"], list):
+            raise ValueError(f"{path} is not a pytest-benchmark JSON file")
+        for benchmark in results["benchmarks"]:
+            runs.setdefault(benchmark["name"], []).append(benchmark["stats"])
+    summaries = {}
+    for name, stats in runs.items():
+        if all(stat.get("data") for stat in stats):
+            summaries[name] = summarize([sample for stat in stats for sample in stat["data"]])
+        else:
+            summaries[name] = Summary(
+                statistics.median(stat["median"] for stat in stats),
+                statistics.median(stat["iqr"] for stat in stats),
+                len(stats),
+            )
+    return summaries
+
+
+def save_baseline(summaries: typing.Dict[str, Summary], path: typing.Union[str, os.PathLike]):
+    """Write a baseline.
+
+    :param summaries: The summaries, by scenario name.
+    :param path: The file to write.
+    """
+    baseline = {
+        "version": BASELINE_VERSION,
+        "benchmarks": {name: summary._asdict() for name, summary in sorted(summaries.items())},
+    }
+    with open(path, "w", encoding="utf-8") as baseline_file:
+        json.dump(baseline, baseline_file, indent=2)
+        baseline_file.write("\n")
+
+
+def load_baseline(path: typing.Union[str, os.PathLike]) -> typing.Dict[str, Summary]:
+    """Read a baseline, a pytest-benchmark JSON file is also accepted.
+
+    :param path: The baseline file.
+    :return: The summaries, by scenario name.
+    """
+    baseline = _load(path)
+    if isinstance(baseline.get("benchmarks"), list):
+        return load_results([path])
+    if baseline.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version {baseline.get('version')!r} in {path}")
+    return {name: Summary(**summary) for name, summary in baseline["benchmarks"].items()}
+
+
+def compare(
+    current: typing.Dict[str, Summary],
+    baseline: typing.Dict[str, Summary],
+    tolerance: float = DEFAULT_TOLERANCE,
+    iqr_factor: float = DEFAULT_IQR_FACTOR,
+) -> typing.List[Comparison]:
+    """Compare the scenarios of a run with a baseline.
+
+    :param current: The summaries of the run, by scenario name.
+    :param baseline: The summaries of the baseline, by scenario name.
+    :param tolerance: The tolerated growth of the median, as a fraction of the baseline median.
+    :param iqr_factor: The number of IQRs, the mean of the baseline and current IQRs, a change of the median must
+                       exceed to be told apart from noise.
+    :return: The comparisons, sorted by scenario name.
+    """
+    comparisons = []
+    for name in sorted(set(current) | set(baseline)):
+        before, after = baseline.get(name), current.get(name)
+        if before is None:
+            status = "new"
+        elif after is None:
+            status = "missing"
+        else:
+            delta = after.median - before.median
+            noise = iqr_factor * (before.iqr + after.iqr) / 2
+            if delta > tolerance * before.median and delta > noise:
+                status = "regressed"
+            elif -delta > tolerance * before.median and -delta > noise:
+                status = "improved"
+            else:
+                status = "ok"
+        comparisons.append(Comparison(name, before, after, status))
+    return comparisons
+
+
+def _format_time(seconds: typing.Optional[float]) -> str:
+    """Format a time in milliseconds."""
+    return "-" if seconds is None else f"{seconds * 1000:.3f}"
+
+
+def format_report(comparisons: typing.Sequence[Comparison]) -> str:
+    """Return the comparisons as a table.
+
+    :param comparisons: The comparisons.
+    :return: The table.
+    """
+    rows = [("scenario", "baseline ms", "iqr", "current ms", "iqr", "change", "status")]
+    for comparison in comparisons:
+        change = comparison.change()
+        rows.append(
+            (
+                comparison.name,
+                _format_time(comparison.baseline and comparison.baseline.median),
+                _format_time(comparison.baseline and comparison.baseline.iqr),
+                _format_time(comparison.current and comparison.current.median),
+                _format_time(comparison.current and comparison.current.iqr),
+                "-" if change is None else f"{change:+.1%}",
+                comparison.status,
+            )
+        )
+    widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join(cell.ljust(width) if column == 0 else cell.rjust(width) for column, (cell, width) in
+                  enumerate(zip(row, widths)))
+        for row in rows
+    )
+
+
+def main(argv: typing.Sequence[str] = None) -> int:
+    """Run the command line interface.
+
+    :param argv: The arguments, the ones of the process by default.
+    :return: The exit code, 1 if a scenario regressed.
+    """
+    parser = argparse.ArgumentParser(prog="python -m snakeribbon.bench", description=__doc__.split("\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    baseline_parser = commands.add_parser("baseline", help="Store the results of runs as a baseline.")
+    baseline_parser.add_argument("results", nargs="+", help="pytest-benchmark JSON files of repeated runs.")
+    baseline_parser.add_argument("-o", "--output", required=True, help="Baseline file to write.")
+
+    compare_parser = commands.add_parser("compare", help="Compare the results of runs with a baseline.")
+    compare_parser.add_argument("results", nargs="+", help="pytest-benchmark JSON files of repeated runs.")
+    compare_parser.add_argument("-b", "--baseline", required=True, help="Baseline file.")
+    compare_parser.add_argument(
+        "-t",
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help=f"Tolerated growth of the median, as a fraction (default {DEFAULT_TOLERANCE}).",
+    )
+    compare_parser.add_argument(
+        "--iqr-factor",
+        type=float,
+        default=DEFAULT_IQR_FACTOR,
+        help=f"IQRs a change must exceed to be told apart from noise (default {DEFAULT_IQR_FACTOR}).",
+    )
+
+    arguments = parser.parse_args(argv)
+    try:
+        current = load_results(arguments.results)
+        if arguments.command == "baseline":
+            save_baseline(current, arguments.output)
+            print(f"Stored {len(current)} scenarios in {arguments.output}")
+            return 0
+        comparisons = compare(current, load_baseline(arguments.baseline), arguments.tolerance, arguments.iqr_factor)
+    except (OSError, ValueError, KeyError) as error:
+        parser.error(str(error))
+    print(format_report(comparisons))
+    regressions = [comparison.name for comparison in comparisons if comparison.status == "regressed"]
+    if regressions:
+        print(f"\n{len(regressions)} regressed above a tolerance of {arguments.tolerance:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
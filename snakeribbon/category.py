@@ -7,10 +7,12 @@ from PySide6 import QtCore, QtGui, QtWidgets
 from snakeribbon.constants import RibbonCategoryStyle, RibbonIcon
 from snakeribbon.panel import RibbonPanel
 from snakeribbon.separator import RibbonSeparator
-from snakeribbon.utils import DataFile
+from snakeribbon.tracing import traced
+from snakeribbon.utils import DataFile, scroll_value, set_scroll_value
 
 if typing.TYPE_CHECKING:
     from .ribbonbar import RibbonBar  # noqa: F401
+    from .shortcuts import RibbonShortcutRegistry  # noqa: F401
 
 
 class RibbonCategoryLayoutButton(QtWidgets.QToolButton):
@@ -113,6 +115,20 @@ class RibbonCategoryLayoutWidget(QtWidgets.QFrame):
         )
         self.auto_set_scroll_buttons_visible()
 
+    def scroll_position(self) -> int:
+        """Return the horizontal scroll position of the category, the one set if it is not laid out yet.
+
+        :return: The scroll position.
+        """
+        return scroll_value(self._category_scroll_area.horizontal_scroll_bar())
+
+    def set_scroll_position(self, position: int):
+        """Set the horizontal scroll position of the category, it is applied once laid out.
+
+        :param position: The scroll position.
+        """
+        set_scroll_value(self._category_scroll_area.horizontal_scroll_bar(), position)
+
     def add_widget(self, widget: QtWidgets.QWidget):
         """Add a widget to the category layout.
 
@@ -151,6 +167,9 @@ class RibbonCategory(RibbonCategoryLayoutWidget):
     #: Maximum rows
     _max_rows: int = 6
 
+    #: Signal, a panel was added to the category.
+    panel_added = QtCore.Signal(RibbonPanel)
+
     @typing.overload
     def __init__(
         self,
@@ -229,7 +248,8 @@ class RibbonCategory(RibbonCategoryLayoutWidget):
 
         :param data: The dictionary. The keys are the titles of the panels. The value is a dictionary of
                      arguments. the argument showPanelOptionButton is a boolean to decide whether to show
-                     the panel option button, the rest arguments are passed to the RibbonPanel.add_widgetsBy() method.
+                     the panel option button, the optional placements are passed to RibbonPanel.set_placements(),
+                     the rest arguments are passed to the RibbonPanel.add_widgetsBy() method.
                      The dict is of the form:
 
                      .. code-block:: python
@@ -255,9 +275,12 @@ class RibbonCategory(RibbonCategoryLayoutWidget):
         for title, panel_data in data.items():
             show_panel_option_button = panel_data.get("show_panel_option_button", True)
             panels[title] = self.add_panel(title, show_panel_option_button)
+            if "placements" in panel_data:
+                panels[title].set_placements(panel_data["placements"])
             panels[title].add_widgets_by(panel_data.get("widgets", {}))
         return panels
 
+    @traced("RibbonCategory.add_panel")
     def add_panel(self, title: str, show_panel_option_button=True) -> RibbonPanel:
         """Add a new panel to the category.
 
@@ -272,9 +295,12 @@ class RibbonCategory(RibbonCategoryLayoutWidget):
             - self._main_layout.contents_margins().top()
             - self._main_layout.contents_margins().bottom()
         )
+        if hasattr(self._ribbon, "layout_cache"):
+            panel.set_layout_cache(self._ribbon.layout_cache())
         self._panels[title] = panel
         self.add_widget(panel)  # type: ignore
         self.add_widget(RibbonSeparator(width=10))  # type: ignore
+        self.panel_added.emit(panel)
         return panel
 
     def remove_panel(self, title: str):
@@ -311,6 +337,13 @@ class RibbonCategory(RibbonCategoryLayoutWidget):
         """
         return self._panels
 
+    def shortcut_registry(self) -> typing.Optional["RibbonShortcutRegistry"]:
+        """Return the registry the shortcuts of the category controls are registered in.
+
+        :return: The shortcut registry of the ribbon, None if the category is not in a ribbon.
+        """
+        return self._ribbon.shortcut_registry() if hasattr(self._ribbon, "shortcut_registry") else None
+
 
 class RibbonNormalCategory(RibbonCategory):
     """A normal category."""
@@ -363,7 +396,7 @@ class RibbonContextCategory(RibbonCategory):
         :param color: The color of the context category.
         """
         self._color = color
-        self._ribbon.repaint()
+        self._ribbon.tab_bar().set_tab_color(self._title, color)
 
     def show_context_category(self):
         """Show the given category, if it is not a context category, nothing happens."""
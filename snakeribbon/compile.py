@@ -0,0 +1,351 @@
+"""Compile the data of a ribbon into a bundle :meth:`RibbonBar.load_bundle` adds with almost no work.
+
+.. code-block:: shell
+
+    python -m snakeribbon.compile spec.json -o ribbon.bundle --theme base.qss --theme default.qss
+
+The spec is the JSON data of :meth:`RibbonBar.add_categories_by`, it is validated once here instead of at each
+start. Icons given as file paths in the ``icon`` argument of the widgets, relative to the spec, are loaded and
+scaled in a process pool and stored as PNG, the cells of the widgets are computed with
+:class:`RibbonGridLayoutManager` and the themes are minified.
+"""
+import argparse
+import concurrent.futures
+import functools
+import inspect
+import json
+import os
+import re
+import sys
+import typing
+from pathlib import Path
+
+from PySide6 import QtCore, QtGui
+
+from __feature__ import snake_case  # noqa: F401
+
+from snakeribbon.constants import ColumnWise, Large, Medium, RibbonButtonStyle, RibbonSpaceFindMode, Small
+from snakeribbon.panel import RibbonGridLayoutManager, RibbonPanel, row_counts, widget_method_name
+
+#: Magic number of the bundles
+BUNDLE_MAGIC = 0x52424E44
+
+#: Version of the bundle format
+BUNDLE_VERSION = 1
+
+#: Sizes the icons are scaled to, in pixels
+DEFAULT_ICON_SIZES = (16, 32, 48)
+
+#: Methods passing the keyword arguments they do not take to :meth:`RibbonPanel.add_widget`
+_add_widget_callers = ("add_button", "add_separator", "add_gallery")
+
+
+class RibbonBundle(typing.NamedTuple):
+    """Content of a bundle."""
+
+    #: Data of the categories, with the cells of the widgets of each panel
+    spec: typing.Dict[str, typing.Dict]
+    #: Maximal number of rows of the panels the cells were computed for
+    max_rows: int
+    #: Minified style sheet, empty if no theme was compiled
+    style_sheet: str
+    #: PNG data of the icons, by path in the spec and size
+    icons: typing.Dict[str, typing.Dict[int, bytes]]
+
+
+def _method(widget_type: str) -> typing.Tuple[typing.Optional[typing.Callable], typing.Dict[str, typing.Any]]:
+    """Return the function of the method adding a widget type and the arguments its partial methods set."""
+    attribute = inspect.getattr_static(RibbonPanel, widget_method_name(widget_type), None)
+    keywords = {}
+    while isinstance(attribute, functools.partialmethod):
+        keywords = {**attribute.keywords, **keywords}
+        attribute = attribute.func
+    return (attribute if callable(attribute) else None), keywords
+
+
+def _call_error(
+    function: typing.Callable, keywords: typing.Dict[str, typing.Any], args: list, kwargs: typing.Dict[str, typing.Any]
+) -> typing.Optional[str]:
+    """Return why the method adding a widget cannot be called with its arguments, None if it can."""
+    signature = inspect.signature(function)
+    try:
+        bound = signature.bind(None, *args, **{**keywords, **kwargs})
+        # The keyword arguments collected by **kwargs, they are passed on by some methods
+        extra = next(
+            (value for name, value in bound.arguments.items()
+             if signature.parameters[name].kind == inspect.Parameter.VAR_KEYWORD),
+            {},
+        )
+        if function.__name__ in _add_widget_callers:
+            inspect.signature(inspect.getattr_static(RibbonPanel, "add_widget")).bind(None, None, **extra)
+        elif function is inspect.getattr_static(RibbonPanel, "add_ribbon_widget"):
+            # Without an initializer, add_ribbon_widget raises a ValueError for any argument
+            if bound.arguments.get("initializer") is None and (bound.arguments.get("args") or extra):
+                return "the widget takes no arguments"
+    except TypeError as error:
+        return str(error)
+    return None
+
+
+def _widget_kwargs(widget: typing.Dict[str, typing.Any]) -> typing.Any:
+    """Return the keyword arguments of a widget of the data, under ``kwargs`` or the former ``arguments``."""
+    return widget.get("kwargs", widget.get("arguments", {}))
+
+
+def widget_span(widget_type: str, kwargs: typing.Dict[str, typing.Any], max_rows: int) -> typing.Tuple[int, int, int]:
+    """Return the cells a widget of the data spans, as :meth:`RibbonPanel.add_widget` requests them.
+
+    :param widget_type: The type of the widget.
+    :param kwargs: The keyword arguments of the widget.
+    :param max_rows: The maximal number of rows of the panel.
+    :return: The row span, the column span and the mode.
+    """
+    function, keywords = _method(widget_type)
+    values = {**keywords, **kwargs}
+    # Buttons, separators and galleries span the whole panel unless told otherwise
+    large_default = any(
+        function is inspect.getattr_static(RibbonPanel, name) for name in ("add_button", "add_separator", "add_gallery")
+    )
+    row_span = values.get("row_span", Large if large_default else Small)
+    if isinstance(row_span, RibbonButtonStyle):
+        large, medium, small = row_counts(max_rows)
+        row_span = large if row_span == Large else medium if row_span == Medium else small
+    return int(row_span), int(values.get("col_span", 1)), int(values.get("mode", ColumnWise))
+
+
+def validate_spec(spec: typing.Any, max_rows: int = 6) -> typing.List[str]:
+    """Validate the data of :meth:`RibbonBar.add_categories_by`.
+
+    :param spec: The data.
+    :param max_rows: The maximal number of rows of the panels.
+    :return: The errors, with the path of the invalid entry, empty if the data is valid.
+    """
+    if not isinstance(spec, dict):
+        return ["the spec must be an object of categories"]
+    errors = []
+    modes = [int(mode) for mode in RibbonSpaceFindMode]
+    for category_title, category in spec.items():
+        if not isinstance(category, dict):
+            errors.append(f"{category_title}: the category must be an object")
+            continue
+        if category.get("style", 0) not in (0, 1):
+            errors.append(f"{category_title}: the style must be 0 (normal) or 1 (context)")
+        if not isinstance(category.get("color"), (str, type(None))):
+            errors.append(f"{category_title}: the color must be a color name")
+        panels = category.get("panels", {})
+        if not isinstance(panels, dict):
+            errors.append(f"{category_title}: the panels must be an object")
+            continue
+        for panel_title, panel in panels.items():
+            path = f"{category_title} / {panel_title}"
+            if not isinstance(panel, dict):
+                errors.append(f"{path}: the panel must be an object")
+                continue
+            if not isinstance(panel.get("show_panel_option_button", True), bool):
+                errors.append(f"{path}: show_panel_option_button must be a boolean")
+            widgets = panel.get("widgets", {})
+            if not isinstance(widgets, dict):
+                errors.append(f"{path}: the widgets must be an object")
+                continue
+            for name, widget in widgets.items():
+                widget_path = f"{path} / {name}"
+                if not isinstance(widget, dict) or not isinstance(widget.get("type"), str):
+                    errors.append(f"{widget_path}: the widget must be an object with a type")
+                    continue
+                function, keywords = _method(widget["type"])
+                if function is None:
+                    errors.append(f"{widget_path}: unknown type {widget['type']!r}")
+                    continue
+                args = widget.get("args", [])
+                kwargs = _widget_kwargs(widget)
+                if not isinstance(args, list) or not isinstance(kwargs, dict):
+                    errors.append(f"{widget_path}: args must be an array and kwargs an object")
+                    continue
+                error = _call_error(function, keywords, args, kwargs)
+                if error is not None:
+                    errors.append(f"{widget_path}: {error}")
+                    continue
+                if "row_span" in kwargs and function is inspect.getattr_static(RibbonPanel, "add_button"):
+                    errors.append(f"{widget_path}: the row span of a button is set by its type, e.g. SmallButton")
+                    continue
+                if not isinstance(kwargs.get("icon", ""), str):
+                    errors.append(f"{widget_path}: the icon must be a file path")
+                row_span, col_span, mode = widget_span(widget["type"], kwargs, max_rows)
+                if not 0 < row_span <= max_rows or col_span < 1 or mode not in modes:
+                    errors.append(f"{widget_path}: invalid row span, column span or mode")
+    return errors
+
+
+def compute_placements(spec: typing.Dict[str, typing.Dict], max_rows: int = 6):
+    """Compute the cells of the widgets of each panel, they are stored in the ``placements`` of the panels.
+
+    :param spec: The validated data.
+    :param max_rows: The maximal number of rows of the panels.
+    """
+    for category in spec.values():
+        for panel in category.get("panels", {}).values():
+            grid = RibbonGridLayoutManager(max_rows)
+            panel["placements"] = [
+                list(grid.request_cells(*widget_span(widget["type"], _widget_kwargs(widget), max_rows)))
+                for widget in panel.get("widgets", {}).values()
+            ]
+
+
+def minify_style_sheet(style_sheet: str) -> str:
+    """Remove the comments and the spaces a style sheet does not need.
+
+    :param style_sheet: The style sheet.
+    :return: The minified style sheet.
+    """
+    style_sheet = re.sub(r"/\*.*?\*/", "", style_sheet, flags=re.DOTALL)
+    style_sheet = re.sub(r"\s+", " ", style_sheet)
+    style_sheet = re.sub(r"\s*([{};,>])\s*", r"\1", style_sheet)
+    # Spaces around colons are only dropped in the declarations, in selectors they separate pseudo-states
+    style_sheet = re.sub(r"{([^}]*)}", lambda match: "{" + re.sub(r"\s*:\s*", ":", match.group(1)) + "}", style_sheet)
+    return style_sheet.replace(";}", "}").strip()
+
+
+def _scale_icon(path: str, sizes: typing.Sequence[int]) -> typing.Dict[int, bytes]:
+    """Load an icon and return it as PNG at each size, it runs in the process pool."""
+    image = QtGui.QImage(path)
+    if image.is_null():
+        raise ValueError(f"Cannot read the icon {path}")
+    scaled = {}
+    for size in sizes:
+        data = QtCore.QByteArray()
+        buffer = QtCore.QBuffer(data)
+        buffer.open(QtCore.QIODevice.OpenModeFlag.WriteOnly)
+        image.scaled(
+            size, size, QtCore.Qt.AspectRatioMode.KeepAspectRatio, QtCore.Qt.TransformationMode.SmoothTransformation
+        ).save(buffer, "PNG")
+        scaled[size] = data.data()
+    return scaled
+
+
+def scale_icons(
+    spec: typing.Dict[str, typing.Dict],
+    base: typing.Union[str, os.PathLike],
+    sizes: typing.Sequence[int] = DEFAULT_ICON_SIZES,
+    jobs: typing.Optional[int] = None,
+) -> typing.Dict[str, typing.Dict[int, bytes]]:
+    """Load and scale the icons of the widgets in a process pool.
+
+    :param spec: The validated data.
+    :param base: The directory the relative icon paths are resolved from.
+    :param sizes: The sizes of the icons, in pixels.
+    :param jobs: The number of processes, the number of processors by default, 1 to scale them in this process.
+    :return: The PNG data of the icons, by path in the spec and size.
+    """
+    paths = sorted({
+        kwargs["icon"]
+        for category in spec.values()
+        for panel in category.get("panels", {}).values()
+        for kwargs in map(_widget_kwargs, panel.get("widgets", {}).values())
+        if isinstance(kwargs, dict) and kwargs.get("icon")
+    })
+    files = [str(Path(base, path)) for path in paths]
+    if jobs == 1 or len(paths) < 2:
+        return {path: _scale_icon(file, sizes) for path, file in zip(paths, files)}
+    with concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+        return dict(zip(paths, executor.map(_scale_icon, files, [sizes] * len(files))))
+
+
+def write_bundle(bundle: RibbonBundle, path: typing.Union[str, os.PathLike]):
+    """Write a bundle.
+
+    :param bundle: The bundle.
+    :param path: The file to write.
+    """
+    data = QtCore.QByteArray()
+    stream = QtCore.QDataStream(data, QtCore.QIODevice.OpenModeFlag.WriteOnly)
+    stream.set_version(QtCore.QDataStream.Version.Qt_6_0)
+    stream.writeUInt32(BUNDLE_MAGIC)
+    stream.writeUInt16(BUNDLE_VERSION)
+    stream.writeUInt16(bundle.max_rows)
+    stream.writeQString(json.dumps(bundle.spec, separators=(",", ":")))
+    stream.writeQString(bundle.style_sheet)
+    stream.writeUInt32(len(bundle.icons))
+    for icon, pixmaps in bundle.icons.items():
+        stream.writeQString(icon)
+        stream.writeUInt16(len(pixmaps))
+        for size, png in pixmaps.items():
+            stream.writeUInt16(size)
+            stream.writeUInt32(len(png))
+            stream.write_raw_data(png)
+    with open(path, "wb") as bundle_file:
+        bundle_file.write(data.data())
+
+
+def read_bundle(path: typing.Union[str, os.PathLike]) -> RibbonBundle:
+    """Read a bundle.
+
+    :param path: The bundle file.
+    :return: The bundle.
+    """
+    with open(path, "rb") as bundle_file:
+        stream = QtCore.QDataStream(QtCore.QByteArray(bundle_file.read()))
+    stream.set_version(QtCore.QDataStream.Version.Qt_6_0)
+    if stream.readUInt32() != BUNDLE_MAGIC:
+        raise ValueError(f"{path} is not a ribbon bundle")
+    version = stream.readUInt16()
+    if not 0 < version <= BUNDLE_VERSION:
+        raise ValueError(f"{path} is a bundle of an unsupported version {version}")
+    max_rows = stream.readUInt16()
+    spec = json.loads(stream.readQString())
+    style_sheet = stream.readQString()
+    icons = {}
+    for _ in range(stream.readUInt32()):
+        icon = stream.readQString()
+        pixmaps = icons[icon] = {}
+        for _ in range(stream.readUInt16()):
+            size = stream.readUInt16()
+            pixmaps[size] = stream.read_raw_data(stream.readUInt32())
+    if stream.status() != QtCore.QDataStream.Status.Ok:
+        raise ValueError(f"{path} is a truncated ribbon bundle")
+    return RibbonBundle(spec, max_rows, style_sheet, icons)
+
+
+def main(argv: typing.Sequence[str] = None) -> int:
+    """Compile the data of a ribbon into a bundle.
+
+    :param argv: The arguments, the ones of the process by default.
+    :return: The exit code, 1 if the data is invalid.
+    """
+    parser = argparse.ArgumentParser(prog="python -m snakeribbon.compile", description=main.__doc__.split("\n")[0])
+    parser.add_argument("spec", help="JSON data of RibbonBar.add_categories_by.")
+    parser.add_argument("-o", "--output", required=True, help="Bundle file to write.")
+    parser.add_argument("--theme", action="append", default=[], help="Style sheet applied by the bundle, repeatable.")
+    parser.add_argument("--max-rows", type=int, default=6, help="Maximal number of rows of the panels (default 6).")
+    parser.add_argument(
+        "--icon-size",
+        type=int,
+        action="append",
+        help=f"Size the icons are scaled to, repeatable (default {', '.join(map(str, DEFAULT_ICON_SIZES))}).",
+    )
+    parser.add_argument("--jobs", type=int, help="Processes scaling the icons (default the number of processors).")
+    arguments = parser.parse_args(argv)
+
+    try:
+        with open(arguments.spec, "r", encoding="utf-8") as spec_file:
+            spec = json.load(spec_file)
+        errors = validate_spec(spec, arguments.max_rows)
+        if errors:
+            print("\n".join(f"{arguments.spec}: {error}" for error in errors), file=sys.stderr)
+            return 1
+        compute_placements(spec, arguments.max_rows)
+        icons = scale_icons(
+            spec, Path(arguments.spec).resolve().parent, arguments.icon_size or DEFAULT_ICON_SIZES, arguments.jobs
+        )
+        style_sheet = ""
+        for theme in arguments.theme:
+            with open(theme, "r", encoding="utf-8") as theme_file:
+                style_sheet += theme_file.read() + "\n"
+        write_bundle(RibbonBundle(spec, arguments.max_rows, minify_style_sheet(style_sheet), icons), arguments.output)
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+    print(f"Compiled {len(spec)} categories and {len(icons)} icons into {arguments.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -51,6 +51,38 @@ Medium = RibbonButtonStyle.Medium
 Large = RibbonButtonStyle.Large
 
 
+class RibbonVisibilityState(IntEnum):
+    """Visibility state of the ribbon categories, Expanded, Collapsed, or AutoHide."""
+
+    #: the categories are always shown under the tab bar
+    Expanded = 0
+    #: only the tab bar is shown, clicking a tab shows the categories over the window contents
+    Collapsed = 1
+    #: like Collapsed, and hovering the tab bar shows the categories too
+    AutoHide = 2
+
+
+Expanded = RibbonVisibilityState.Expanded
+Collapsed = RibbonVisibilityState.Collapsed
+AutoHide = RibbonVisibilityState.AutoHide
+
+
+class RibbonAsyncPolicy(IntEnum):
+    """What clicking a button whose asynchronous slot is still running does, Cancel, Queue, or Ignore."""
+
+    #: the running slot is cancelled
+    Cancel = 0
+    #: the slot runs again once the running one is done
+    Queue = 1
+    #: the click is ignored, the button is disabled while the slot runs
+    Ignore = 2
+
+
+Cancel = RibbonAsyncPolicy.Cancel
+Queue = RibbonAsyncPolicy.Queue
+Ignore = RibbonAsyncPolicy.Ignore
+
+
 class RibbonIcon:
     """
     Internal icons
@@ -4,11 +4,12 @@ import typing
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
-from snakeribbon.constants import RibbonIcon
-from snakeribbon.menu import RibbonPermanentMenu
+from snakeribbon.constants import Cancel, RibbonAsyncPolicy, RibbonIcon
+from snakeribbon.menu import RibbonActionList
 from snakeribbon.separator import RibbonHorizontalSeparator
+from snakeribbon.shortcuts import register_shortcut
 from snakeribbon.toolbutton import RibbonToolButton
-from snakeribbon.utils import DataFile
+from snakeribbon.utils import DataFile, connect_slot, scroll_value, set_scroll_value
 
 
 class RibbonPopupWidget(QtWidgets.QFrame):
@@ -55,9 +56,12 @@ class RibbonGalleryPopupListWidget(RibbonGalleryListWidget):
 class RibbonGallery(QtWidgets.QFrame):
     """A widget that displays a gallery of buttons."""
 
+    #: Signal, a button was added to the gallery.
+    button_added = QtCore.Signal(RibbonToolButton)
+
     _popup_window_size = QtCore.QSize(500, 500)
-    _buttons: typing.List[RibbonToolButton] = []
-    _popup_buttons: typing.List[RibbonToolButton] = []
+    _buttons: typing.List[RibbonToolButton]
+    _popup_buttons: typing.List[RibbonToolButton]
     _popup_hide_on_click = False
 
     @typing.overload
@@ -88,6 +92,8 @@ class RibbonGallery(QtWidgets.QFrame):
         super().__init__(parent)
         self.set_minimum_width(minimum_width)
         self._popup_hide_on_click = popup_hide_on_click
+        self._buttons = []
+        self._popup_buttons = []
 
         self._main_layout = QtWidgets.QHBoxLayout(self)
         self._main_layout.set_contents_margins(5, 5, 5, 5)
@@ -133,8 +139,7 @@ class RibbonGallery(QtWidgets.QFrame):
         self._popup_layout.add_widget(self._popup_list_widget)
         self._popup_layout.add_widget(RibbonHorizontalSeparator())
 
-        self._popup_menu = RibbonPermanentMenu()
-        self._popup_menu.set_size_policy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)  # type: ignore
+        self._popup_menu = RibbonActionList()
         self._popup_menu.action_added.connect(self._handle_popup_action)
         self._popup_layout.add_widget(self._popup_menu)
 
@@ -144,6 +149,8 @@ class RibbonGallery(QtWidgets.QFrame):
         """Handle a popup action."""
         if isinstance(action, QtGui.QAction):
             action.triggered.connect(self.hide_popup_widget)  # type: ignore
+            if action.menu() is not None:
+                action.menu().triggered.connect(self.hide_popup_widget)  # type: ignore
 
     def resize_event(self, a0: QtGui.QResizeEvent) -> None:
         """Resize the gallery."""
@@ -153,23 +160,56 @@ class RibbonGallery(QtWidgets.QFrame):
         self._more_button.set_fixed_size(height // 4, height // 3)  # type: ignore
         super().resize_event(a0)
 
-    def popup_menu(self) -> RibbonPermanentMenu:
-        """Return the popup menu."""
+    def buttons(self) -> typing.List[RibbonToolButton]:
+        """Return the buttons of the gallery.
+
+        :return: The buttons of the gallery.
+        """
+        return self._buttons
+
+    def popup_buttons(self) -> typing.List[RibbonToolButton]:
+        """Return the buttons of the popup gallery.
+
+        :return: The buttons of the popup gallery.
+        """
+        return self._popup_buttons
+
+    def scroll_position(self) -> int:
+        """Return the scroll position of the gallery, the one set if it is not laid out yet.
+
+        :return: The scroll position.
+        """
+        return scroll_value(self._list_widget.vertical_scroll_bar())
+
+    def set_scroll_position(self, position: int):
+        """Set the scroll position of the gallery, it is applied once laid out.
+
+        :param position: The scroll position.
+        """
+        set_scroll_value(self._list_widget.vertical_scroll_bar(), position)
+
+    def popup_menu(self) -> RibbonActionList:
+        """Return the list of actions under the items of the popup.
+
+        It is a :class:`RibbonActionList` and no longer a menu, it has the methods of :class:`RibbonMenu` to add
+        actions, sub menus, widgets, labels and layout widgets, but not the other methods of :class:`QMenu`.
+
+        :return: The list of actions.
+        """
         return self._popup_menu
 
     def show_popup(self):
         """Show the popup window"""
-        self._popup_widget.move(self.map_to_global(self.geometry().top_left()))
-        self._popup_widget.resize(
-            QtCore.QSize(
-                max(self.popup_window_size().width(), self.width()), max(self.popup_window_size().height(), self.height())
+        # Position and size are applied at once so the popup is laid out a single time
+        self._popup_widget.set_geometry(
+            QtCore.QRect(
+                self.map_to_global(self.geometry().top_left()),
+                QtCore.QSize(
+                    max(self.popup_window_size().width(), self.width()),
+                    max(self.popup_window_size().height(), self.height()),
+                ),
             )
         )
-        self._popup_menu.set_fixed_height(
-            self._popup_widget.width()
-            - self._popup_layout.contents_margins().left()
-            - self._popup_layout.contents_margins().right()
-        )
         self._popup_widget.show()
 
     def hide_popup_widget(self):
@@ -239,16 +279,19 @@ class RibbonGallery(QtWidgets.QFrame):
         tooltip=None,
         statusTip=None,
         checkable=False,
+        async_policy: RibbonAsyncPolicy = Cancel,
     ) -> typing.Tuple[RibbonToolButton, RibbonToolButton]:
         """Add a button to the gallery
 
         :param text: text of the button
         :param icon: icon of the button
-        :param slot: slot to call when the button is clicked
+        :param slot: slot to call when the button is clicked, a coroutine function or a callable annotated as
+                     returning a future runs without blocking, both buttons are busy until it is done
         :param shortcut: shortcut of the button
         :param tooltip: tooltip of the button
         :param statusTip: status tip of the button
         :param checkable: checkable flag of the button.
+        :param async_policy: what clicking the buttons does while their asynchronous slot is running
         :return: the button and the popup button added
         """
         button = RibbonToolButton(self)
@@ -260,11 +303,10 @@ class RibbonGallery(QtWidgets.QFrame):
             button.set_icon(icon)
             popup_button.set_icon(icon)
         if slot is not None:
-            button.clicked.connect(slot)  # type: ignore
-            popup_button.clicked.connect(slot)  # type: ignore
+            connect_slot([button, popup_button], slot, async_policy)
         if shortcut is not None:
-            button.set_shortcut(shortcut)
-            popup_button.set_shortcut(shortcut)
+            # Registered once, the popup button mirrors the inline one
+            register_shortcut(button, shortcut)
         if tooltip is not None:
             button.set_tool_tip(tooltip)
             popup_button.set_tool_tip(tooltip)
@@ -289,6 +331,7 @@ class RibbonGallery(QtWidgets.QFrame):
             popup_button.set_tool_button_style(QtCore.Qt.ToolButtonStyle.ToolButtonTextUnderIcon)
         self._add_widget(button)  # noqa
         self._add_popup_widget(popup_button)  # noqa
+        self.button_added.emit(button)
         return button, popup_button
 
     def addToggleButton(
@@ -0,0 +1,150 @@
+from __feature__ import snake_case
+
+import collections
+import time
+import typing
+
+import shiboken6
+from PySide6 import QtCore, QtGui, QtWidgets
+
+
+class RibbonRepaintHeatMap(QtWidgets.QWidget):
+    """Debug overlay showing how often the ribbon widgets repainted.
+
+    Paint events of the ribbon widgets are counted by one application event filter. A transparent top-level
+    window over the ribbon window tints each widget that repainted in the last seconds, the more repaints the
+    more opaque, and outlines the rects repainted in the last second. Widgets repainting while the application
+    is idle stand out.
+    """
+
+    #: Interval between two refreshes of the overlay, in milliseconds
+    _refresh_interval = 250
+
+    #: Duration the repainted rects are outlined, in seconds
+    _rect_duration = 1.0
+
+    def __init__(self, roots: typing.Sequence[QtWidgets.QWidget], duration: float = 5.0):
+        """Create a new heat map, it is shown with :meth:`start`.
+
+        :param roots: The widgets whose repaints, and the repaints of their children, are counted, e.g. the
+                      ribbon and the overlay of its categories; the heat map covers the window of the first one.
+        :param duration: The number of seconds the repaints are counted over.
+        """
+        super().__init__(
+            None,
+            QtCore.Qt.WindowType.Tool
+            | QtCore.Qt.WindowType.FramelessWindowHint
+            | QtCore.Qt.WindowType.WindowStaysOnTopHint
+            | QtCore.Qt.WindowType.WindowTransparentForInput
+            | QtCore.Qt.WindowType.WindowDoesNotAcceptFocus,
+        )
+        self.set_attribute(QtCore.Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.set_attribute(QtCore.Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.set_attribute(QtCore.Qt.WidgetAttribute.WA_ShowWithoutActivating)
+        self._roots = tuple(roots)
+        self._duration = duration
+        self._repaints = {}  # type: typing.Dict[QtWidgets.QWidget, typing.Deque[float]]
+        self._rects = collections.deque(maxlen=500)  # type: typing.Deque[typing.Tuple[float, QtCore.QRect]]
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.set_interval(self._refresh_interval)
+        self._refresh_timer.timeout.connect(self._refresh)  # type: ignore
+
+    def duration(self) -> float:
+        """Return the number of seconds the repaints are counted over.
+
+        :return: The duration in seconds.
+        """
+        return self._duration
+
+    def set_duration(self, duration: float):
+        """Set the number of seconds the repaints are counted over.
+
+        :param duration: The duration in seconds.
+        """
+        self._duration = duration
+
+    def start(self):
+        """Start counting the repaints and show the overlay."""
+        QtWidgets.QApplication.instance().install_event_filter(self)
+        self._refresh_timer.start()
+        self._refresh()
+        self.show()
+
+    def stop(self):
+        """Stop counting the repaints and hide the overlay."""
+        QtWidgets.QApplication.instance().remove_event_filter(self)
+        self._refresh_timer.stop()
+        self._repaints.clear()
+        self._rects.clear()
+        self.hide()
+
+    def repaint_counts(self) -> typing.Dict[str, int]:
+        """Return the number of repaints in the last seconds, by widget.
+
+        :return: The counts, by class and object name of the widgets.
+        """
+        counts = collections.Counter()
+        for widget, times in self._repaints.items():
+            if times and shiboken6.isValid(widget):
+                counts[f"{type(widget).__name__}#{widget.object_name()}" if widget.object_name() else
+                       type(widget).__name__] += len(times)
+        return dict(counts)
+
+    def _in_roots(self, widget: QtWidgets.QWidget) -> bool:
+        """Return whether a widget is one of the root widgets or one of their children."""
+        while widget is not None:
+            if widget in self._roots:
+                return True
+            widget = widget.parent_widget()
+        return False
+
+    def event_filter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        """Count the repaints of the ribbon widgets."""
+        if (
+            event.type() == QtCore.QEvent.Type.Paint
+            and isinstance(watched, QtWidgets.QWidget)
+            and watched is not self
+            and self._in_roots(watched)
+        ):
+            now = time.monotonic()
+            times = self._repaints.get(watched)
+            if times is None:
+                times = self._repaints[watched] = collections.deque()
+            times.append(now)
+            rect = event.rect()
+            self._rects.append((now, QtCore.QRect(watched.map_to_global(rect.top_left()), rect.size())))
+        return False
+
+    def _refresh(self):
+        """Drop the old repaints, follow the ribbon window and repaint the overlay."""
+        oldest = time.monotonic() - self._duration
+        for widget in list(self._repaints):
+            times = self._repaints[widget]
+            while times and times[0] < oldest:
+                times.popleft()
+            if not times or not shiboken6.isValid(widget):
+                del self._repaints[widget]
+        window = self._roots[0].window()
+        self.set_geometry(QtCore.QRect(window.map_to_global(QtCore.QPoint(0, 0)), window.size()))
+        self.update()
+
+    def paint_event(self, event: QtGui.QPaintEvent) -> None:
+        """Tint the widgets by their repaint count and outline the recent repainted rects."""
+        painter = QtGui.QPainter(self)
+        counts = [(widget, len(times)) for widget, times in self._repaints.items() if shiboken6.isValid(widget)]
+        maximum = max((count for _, count in counts), default=0)
+        origin = self.map_to_global(QtCore.QPoint(0, 0))
+        for widget, count in sorted(counts, key=lambda item: item[1]):
+            if not widget.is_visible():
+                continue
+            rect = QtCore.QRect(widget.map_to_global(QtCore.QPoint(0, 0)) - origin, widget.size())
+            painter.fill_rect(rect, QtGui.QColor(255, 0, 0, 20 + 160 * count // maximum))
+            if rect.width() > 20 and rect.height() > 12:
+                painter.set_pen(QtCore.Qt.GlobalColor.black)
+                painter.draw_text(rect, QtCore.Qt.AlignmentFlag.AlignTop | QtCore.Qt.AlignmentFlag.AlignLeft, str(count))
+        recent = time.monotonic() - self._rect_duration
+        painter.set_pen(QtGui.QPen(QtGui.QColor(255, 200, 0), 1))
+        painter.set_brush(QtCore.Qt.BrushStyle.NoBrush)
+        for painted, rect in self._rects:
+            if painted >= recent:
+                painter.draw_rect(rect.translated(-origin))
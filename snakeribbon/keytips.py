@@ -0,0 +1,440 @@
+from __feature__ import snake_case
+
+import collections
+import itertools
+import logging
+import string
+import typing
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+from snakeribbon.gallery import RibbonGallery
+from snakeribbon.separator import RibbonSeparator
+
+if typing.TYPE_CHECKING:
+    from .category import RibbonCategory  # noqa: F401
+    from .ribbonbar import RibbonBar  # noqa: F401
+
+log = logging.getLogger(__name__)
+
+#: Characters a key tip is made of
+KEY_TIP_CHARS = string.ascii_uppercase + string.digits
+
+#: Name of the dynamic property holding the key tip chosen for a widget
+KEY_TIP_PROPERTY = "ribbon_key_tip"
+
+
+class RibbonKeyTipTrie(object):
+    """Trie of the assigned key tips, it keeps the key tips prefix-free."""
+
+    _end = ""
+
+    def __init__(self):
+        """Create a new empty trie."""
+        self._root = {}
+
+    def is_free(self, key: str) -> bool:
+        """Return whether a key can be added without being a prefix of a key, or having a key as prefix.
+
+        :param key: The key.
+        :return: Whether the key is free.
+        """
+        node = self._root
+        for char in key:
+            node = node.get(char)
+            if node is None:
+                return True
+            if self._end in node:
+                return False
+        return False
+
+    def insert(self, key: str):
+        """Add a key.
+
+        :param key: The key.
+        """
+        node = self._root
+        for char in key:
+            node = node.setdefault(char, {})
+        node[self._end] = True
+
+
+def _key_candidates(chars: typing.List[str], length: int) -> typing.Iterator[str]:
+    """Yield the key tips to try for a label, the ones made of its own letters first.
+
+    :param chars: The key characters of the label.
+    :param length: The preferred length of the key tip.
+    """
+    first = chars[0]
+    if length == 1:
+        yield from chars
+    else:
+        for combination in itertools.combinations(chars[1:], length - 1):
+            yield first + "".join(combination)
+        for product in itertools.product(KEY_TIP_CHARS, repeat=length - 1):
+            yield first + "".join(product)
+    for size in itertools.count(length):
+        for product in itertools.product(KEY_TIP_CHARS, repeat=size):
+            yield "".join(product)
+
+
+def assign_key_tips(labels: typing.Sequence[str], reserved: typing.Iterable[str] = ()) -> typing.List[str]:
+    """Assign prefix-free key tips to labels.
+
+    Labels are grouped by their first letter, a label alone in its group gets its first letter, the labels of
+    a group share the first letter followed by other letters of the label, all with the same length so the
+    group stays prefix-free.
+
+    :param labels: The labels, e.g. texts of the controls.
+    :param reserved: Key tips already taken, e.g. set explicitly on some controls.
+    :return: The key tips, in the order of the labels.
+    """
+    trie = RibbonKeyTipTrie()
+    for key in reserved:
+        trie.insert(key.upper())
+    chars = [[char for char in label.upper() if char in KEY_TIP_CHARS] or [KEY_TIP_CHARS[0]] for label in labels]
+    groups = collections.Counter(label_chars[0] for label_chars in chars)
+    keys = []
+    for label_chars in chars:
+        size = groups[label_chars[0]]
+        length = 1
+        while size > 1 and len(KEY_TIP_CHARS) ** (length - 1) < size:
+            length += 1
+        length = max(length, 2) if size > 1 else 1
+        key = next(key for key in _key_candidates(label_chars, length) if trie.is_free(key))
+        trie.insert(key)
+        keys.append(key)
+    return keys
+
+
+class RibbonKeyTipOverlay(QtWidgets.QWidget):
+    """Transparent layer painting all the key tip badges of a widget at once."""
+
+    #: Padding around the text of a badge
+    _padding = 3
+
+    def __init__(self, parent: QtWidgets.QWidget):
+        """Create a new key tip overlay covering its parent.
+
+        :param parent: The widget the badges are shown over.
+        """
+        super().__init__(parent)
+        self.set_attribute(QtCore.Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.set_attribute(QtCore.Qt.WidgetAttribute.WA_NoSystemBackground)
+        self._badges = []  # type: typing.List[typing.Tuple[QtCore.QRect, str]]
+        self._prefix = ""
+        self._pen = QtGui.QPen(self.palette().color(QtGui.QPalette.ColorRole.ToolTipText))
+        self._brush = QtGui.QBrush(self.palette().color(QtGui.QPalette.ColorRole.ToolTipBase))
+        self._border = QtGui.QPen(self.palette().color(QtGui.QPalette.ColorRole.Mid))
+        self.hide()
+
+    def set_badges(self, badges: typing.Iterable[typing.Tuple[QtCore.QPoint, str]]):
+        """Set the badges, each one is centered on its anchor.
+
+        :param badges: The anchors in parent coordinates and the key tips.
+        """
+        metrics = self.font_metrics()
+        self._badges = []
+        for anchor, key in badges:
+            width = metrics.horizontal_advance(key) + self._padding * 2
+            height = metrics.height() + self._padding
+            self._badges.append((QtCore.QRect(anchor.x() - width // 2, anchor.y() - height // 2, width, height), key))
+        self.update()
+
+    def set_prefix(self, prefix: str):
+        """Only show the badges starting with the typed prefix.
+
+        :param prefix: The typed prefix.
+        """
+        self._prefix = prefix
+        self.update()
+
+    def show_over_parent(self):
+        """Cover the parent and show the badges."""
+        self.set_geometry(self.parent_widget().rect())
+        self.raise_()
+        self.show()
+
+    def paint_event(self, event: QtGui.QPaintEvent) -> None:
+        """Paint the badges matching the prefix."""
+        painter = QtGui.QPainter(self)
+        painter.set_render_hint(QtGui.QPainter.RenderHint.Antialiasing)
+        for rect, key in self._badges:
+            if not key.startswith(self._prefix) or not event.rect().intersects(rect):
+                continue
+            painter.set_pen(self._border)
+            painter.set_brush(self._brush)
+            painter.draw_rounded_rect(rect, 2, 2)
+            painter.set_pen(self._pen)
+            painter.draw_text(rect, QtCore.Qt.AlignmentFlag.AlignCenter, key)
+
+
+class RibbonKeyTips(QtCore.QObject):
+    """Keyboard access to the ribbon: pressing and releasing Alt shows key tips over the tabs, typing a key tip
+    selects the category and shows key tips over its controls, typing one of those runs the control.
+
+    Key tips of a category are assigned once and cached, they are assigned again only after panels or widgets
+    were added to the category.
+    """
+
+    _Inactive = 0
+    _Tabs = 1
+    _Category = 2
+
+    def __init__(self, ribbon: "RibbonBar"):
+        """Create the key tips of a ribbon, they are active once installed on the application.
+
+        :param ribbon: The ribbon.
+        """
+        super().__init__(ribbon)
+        self._ribbon = ribbon
+        self._mode = self._Inactive
+        self._typed = ""
+        self._alt_pressed = False
+        self._keys = {}  # type: typing.Dict[str, typing.Any]
+        self._category = None  # type: typing.Optional[RibbonCategory]
+        self._tab_overlay = RibbonKeyTipOverlay(ribbon.tab_bar())
+        #: cached controls and key tips, by category
+        self._category_keys = {}  # type: typing.Dict[RibbonCategory, typing.Dict[str, QtWidgets.QWidget]]
+        self._category_overlays = {}  # type: typing.Dict[RibbonCategory, RibbonKeyTipOverlay]
+        self._followed = set()  # type: typing.Set[int]
+
+    def install(self):
+        """Start listening to the keyboard."""
+        QtWidgets.QApplication.instance().install_event_filter(self)
+
+    def uninstall(self):
+        """Stop listening to the keyboard and hide the key tips."""
+        self.hide_key_tips()
+        QtWidgets.QApplication.instance().remove_event_filter(self)
+
+    def is_active(self) -> bool:
+        """Return whether key tips are shown.
+
+        :return: Whether key tips are shown.
+        """
+        return self._mode != self._Inactive
+
+    @staticmethod
+    def set_key_tip(widget: QtWidgets.QWidget, key: str):
+        """Set the key tip of a control instead of assigning it automatically.
+
+        :param widget: The control.
+        :param key: The key tip.
+        """
+        widget.set_property(KEY_TIP_PROPERTY, key.upper())
+
+    @staticmethod
+    def _label(widget: QtWidgets.QWidget) -> str:
+        """Return the label key tips are assigned from.
+
+        :param widget: The control.
+        :return: The label.
+        """
+        text = widget.text() if isinstance(widget, QtWidgets.QAbstractButton) else ""
+        return text or widget.tool_tip() or widget.accessible_name() or type(widget).__name__
+
+    def category_key_tips(self, category: "RibbonCategory") -> typing.Dict[str, QtWidgets.QWidget]:
+        """Return the key tips of the controls of a category, they are assigned on first use and cached.
+
+        :param category: The category.
+        :return: The controls, by key tip.
+        """
+        keys = self._category_keys.get(category)
+        if keys is not None:
+            return keys
+        if id(category) not in self._followed:
+            self._followed.add(id(category))
+            category.panel_added.connect(lambda panel: self._follow_panel(category, panel))  # type: ignore
+            for panel in category.panels().values():
+                self._follow_panel(category, panel, invalidate=False)
+        widgets = [
+            widget
+            for panel in category.panels().values()
+            for widget in panel.widgets()
+            if not isinstance(widget, RibbonSeparator)
+        ]
+        explicit = [widget.property(KEY_TIP_PROPERTY) for widget in widgets]
+        # An explicit key tip equal to, or prefix of, an earlier one is dropped, the control gets a generated one
+        trie = RibbonKeyTipTrie()
+        for index, (widget, key) in enumerate(zip(widgets, explicit)):
+            if not key:
+                continue
+            if trie.is_free(key):
+                trie.insert(key)
+            else:
+                log.warning("Key tip %s of %r conflicts with another control, it is ignored.", key, widget)
+                explicit[index] = None
+        assigned = iter(
+            assign_key_tips(
+                [self._label(widget) for widget, key in zip(widgets, explicit) if not key],
+                [key for key in explicit if key],
+            )
+        )
+        keys = {key or next(assigned): widget for widget, key in zip(widgets, explicit)}
+        self._category_keys[category] = keys
+        return keys
+
+    def _follow_panel(self, category: "RibbonCategory", panel, invalidate: bool = True):
+        """Invalidate the key tips of a category when widgets are added to one of its panels.
+
+        :param category: The category.
+        :param panel: The panel.
+        :param invalidate: Whether to invalidate the key tips now, i.e. the panel was just added.
+        """
+        panel.widget_added.connect(lambda widget: self.invalidate(category))  # type: ignore
+        if invalidate:
+            self.invalidate(category)
+
+    def invalidate(self, category: "RibbonCategory" = None):
+        """Drop the cached key tips of a category, or of all categories.
+
+        :param category: The category, None for all categories.
+        """
+        if category is None:
+            self._category_keys.clear()
+        else:
+            self._category_keys.pop(category, None)
+
+    def _tab_key_tips(self) -> typing.Dict[str, "RibbonCategory"]:
+        """Return the key tips of the visible tabs.
+
+        :return: The categories, by key tip.
+        """
+        tab_bar = self._ribbon.tab_bar()
+        categories = self._ribbon.categories()
+        titles = [
+            tab_bar.tab_text(index)
+            for index in range(tab_bar.count())
+            if tab_bar.is_tab_visible(index) and tab_bar.tab_text(index) in categories
+        ]
+        return {key: categories[title] for key, title in zip(assign_key_tips(titles), titles)}
+
+    def show_tab_key_tips(self):
+        """Show the key tips over the tabs."""
+        self._hide_overlays()
+        tab_bar = self._ribbon.tab_bar()
+        self._keys = self._tab_key_tips()
+        self._mode = self._Tabs
+        self._typed = ""
+        self._tab_overlay.set_badges(
+            (tab_bar.tab_rect(tab_bar.index_of(category.title())).center(), key)
+            for key, category in self._keys.items()
+        )
+        self._tab_overlay.set_prefix("")
+        self._tab_overlay.show_over_parent()
+
+    def show_category_key_tips(self, category: "RibbonCategory"):
+        """Show the key tips over the controls of a category.
+
+        :param category: The category.
+        """
+        self._hide_overlays()
+        self._keys = self.category_key_tips(category)
+        self._mode = self._Category
+        self._typed = ""
+        self._category = category
+        overlay = self._category_overlays.get(category)
+        if overlay is None:
+            overlay = self._category_overlays[category] = RibbonKeyTipOverlay(category)
+        badges = []
+        for key, widget in self._keys.items():
+            if widget.is_visible():
+                rect = widget.rect()
+                anchor = widget.map_to(category, QtCore.QPoint(rect.center().x(), rect.bottom()))
+                badges.append((anchor, key))
+        overlay.set_badges(badges)
+        overlay.set_prefix("")
+        overlay.show_over_parent()
+
+    def hide_key_tips(self):
+        """Hide the key tips."""
+        self._hide_overlays()
+        self._mode = self._Inactive
+        self._typed = ""
+        self._category = None
+
+    def _hide_overlays(self):
+        """Hide the overlays."""
+        self._tab_overlay.hide()
+        for overlay in self._category_overlays.values():
+            overlay.hide()
+
+    def _current_overlay(self) -> RibbonKeyTipOverlay:
+        """Return the overlay of the current mode.
+
+        :return: The overlay.
+        """
+        if self._mode == self._Category:
+            return self._category_overlays[self._category]
+        return self._tab_overlay
+
+    def _type(self, char: str):
+        """Handle a typed key tip character.
+
+        :param char: The typed character.
+        """
+        typed = self._typed + char
+        if not any(key.startswith(typed) for key in self._keys):
+            return
+        target = self._keys.get(typed)
+        if target is None:
+            self._typed = typed
+            self._current_overlay().set_prefix(typed)
+        elif self._mode == self._Tabs:
+            self._ribbon.set_current_category(target)
+            self._ribbon.set_overlay_visible(True)
+            self.show_category_key_tips(target)
+        else:
+            self.hide_key_tips()
+            self._activate(target)
+
+    @staticmethod
+    def _activate(widget: QtWidgets.QWidget):
+        """Run a control: click a button, open a gallery or focus any other widget.
+
+        :param widget: The control.
+        """
+        if isinstance(widget, QtWidgets.QToolButton) and widget.menu() is not None and (
+            widget.popup_mode() == QtWidgets.QToolButton.ToolButtonPopupMode.InstantPopup
+        ):
+            widget.show_menu()
+        elif isinstance(widget, QtWidgets.QAbstractButton):
+            widget.click()
+        elif isinstance(widget, RibbonGallery):
+            widget.show_popup()
+        else:
+            widget.set_focus(QtCore.Qt.FocusReason.ShortcutFocusReason)
+
+    def event_filter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        """Show the key tips on Alt, and handle the typed key tips while they are shown."""
+        event_type = event.type()
+        if event_type == QtCore.QEvent.Type.KeyPress:
+            if QtWidgets.QApplication.active_window() is not self._ribbon.window():
+                return False
+            key = event.key()
+            if key == QtCore.Qt.Key.Key_Alt and not event.is_auto_repeat():
+                self._alt_pressed = not event.modifiers() & ~QtCore.Qt.KeyboardModifier.AltModifier
+                return False
+            self._alt_pressed = False
+            if self._mode == self._Inactive:
+                return False
+            if key == QtCore.Qt.Key.Key_Escape:
+                self.show_tab_key_tips() if self._mode == self._Category else self.hide_key_tips()
+                return True
+            char = event.text().upper()
+            if char and char in KEY_TIP_CHARS:
+                self._type(char)
+                return True
+            self.hide_key_tips()
+        elif event_type == QtCore.QEvent.Type.KeyRelease:
+            if event.key() == QtCore.Qt.Key.Key_Alt and self._alt_pressed and not event.is_auto_repeat():
+                self._alt_pressed = False
+                self.hide_key_tips() if self._mode != self._Inactive else self.show_tab_key_tips()
+                return True
+        elif self._mode != self._Inactive and event_type in (
+            QtCore.QEvent.Type.MouseButtonPress,
+            QtCore.QEvent.Type.WindowDeactivate,
+        ):
+            self.hide_key_tips()
+        return False
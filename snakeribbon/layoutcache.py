@@ -0,0 +1,121 @@
+from __feature__ import snake_case
+
+import json
+import os
+import typing
+from pathlib import Path
+
+from PySide6 import QtGui, QtWidgets
+
+
+class RibbonLayoutCache(object):
+    """On-disk cache of the cell placements and sizes computed when widgets are added to panels.
+
+    Entries are keyed by a hash of the panel spec so far (the widgets added and their spans), the font metrics,
+    the device pixel ratio and the panel height, so any change of these inputs is a miss and the geometry is
+    computed again. Only the entries used or recorded since the cache was loaded are saved, stale entries are
+    dropped on save.
+
+    .. code-block:: python
+
+        ribbon.set_layout_cache(RibbonLayoutCache("ribbon-layout.json"))
+    """
+
+    #: version of the file format, files of other versions are ignored
+    _version = 1
+
+    def __init__(self, path: typing.Union[str, os.PathLike]):
+        """Create a layout cache stored in a file, it is loaded if it exists.
+
+        :param path: The path of the cache file.
+        """
+        self._path = Path(path)
+        self._entries = {}  # type: typing.Dict[str, typing.List[int]]
+        self._used = {}  # type: typing.Dict[str, typing.List[int]]
+        self._dirty = False
+        self._hits = 0
+        self._misses = 0
+        self.load()
+
+    def path(self) -> Path:
+        """Return the path of the cache file.
+
+        :return: The path.
+        """
+        return self._path
+
+    def load(self):
+        """Load the cache file, a missing, unreadable or outdated file gives an empty cache."""
+        try:
+            with open(self._path, "r", encoding="utf-8") as cache_file:
+                data = json.load(cache_file)
+        except (OSError, ValueError):
+            data = {}
+        self._entries = data.get("entries", {}) if data.get("version") == self._version else {}
+        self._used = {}
+        self._dirty = False
+
+    def save(self):
+        """Write the entries used or recorded since the cache was loaded, if they differ from the file."""
+        if not self._dirty and len(self._used) == len(self._entries):
+            return
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self._path.with_suffix(self._path.suffix + ".tmp")
+        with open(temporary, "w", encoding="utf-8") as cache_file:
+            json.dump({"version": self._version, "entries": self._used}, cache_file, separators=(",", ":"))
+        os.replace(temporary, self._path)
+        self._entries = dict(self._used)
+        self._dirty = False
+
+    def clear(self):
+        """Drop all the entries, the file is emptied on the next save."""
+        self._entries.clear()
+        self._used.clear()
+        self._dirty = True
+
+    def get(self, key: str) -> typing.Optional[typing.List[int]]:
+        """Return a cached entry.
+
+        :param key: The key of the entry.
+        :return: The cached values, None on a miss.
+        """
+        values = self._used.get(key)
+        if values is None:
+            values = self._entries.get(key)
+            if values is not None:
+                self._used[key] = values
+        if values is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return values
+
+    def put(self, key: str, values: typing.List[int]):
+        """Record an entry.
+
+        :param key: The key of the entry.
+        :param values: The computed values.
+        """
+        self._used[key] = values
+        self._dirty = True
+
+    def stats(self) -> typing.Dict[str, int]:
+        """Return the number of hits, misses and entries.
+
+        :return: The statistics of the cache.
+        """
+        return {"hits": self._hits, "misses": self._misses, "entries": len(self._used)}
+
+    @staticmethod
+    def environment_key(widget: QtWidgets.QWidget) -> str:
+        """Return the inputs of the geometry of a widget other than its spec.
+
+        :param widget: The widget, a panel.
+        :return: The font, font metrics, device pixel ratio and height of the widget.
+        """
+        font = widget.font()
+        metrics = QtGui.QFontMetrics(font)
+        return (
+            f"{font.key()}|{metrics.height()}|{metrics.average_char_width()}|"
+            f"{widget.device_pixel_ratio_f()}|{widget.height()}"
+        )
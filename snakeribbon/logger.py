@@ -3,9 +3,15 @@ https://timlehr.com/python-exception-hooks-with-qt-message-box/
 """
 from __feature__ import snake_case
 
+import json
 import logging
+import logging.handlers
+import os
 import sys
+import threading
+import time
 import traceback
+import typing
 
 from PySide6 import QtCore, QtWidgets
 
@@ -13,17 +19,282 @@ log = logging.getLogger(__name__)
 log.addHandler(logging.StreamHandler(stream=sys.stdout))
 
 
+class _ErrorRecord(object):
+    """An uncaught exception and the number of times it was raised from the same place."""
+
+    __slots__ = ("key", "type", "message", "traceback", "count", "logged_count", "first", "last")
+
+    def __init__(self, key: str, exc_type: type, exc_value: BaseException, exc_traceback):
+        self.key = key
+        self.type = exc_type.__name__
+        self.message = str(exc_value)
+        self.traceback = "".join(traceback.format_exception(exc_type, exc_value, exc_traceback))
+        self.count = 0
+        self.logged_count = 0
+        self.first = self.last = time.time()
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Format log records as JSON objects, one per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "time": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for name in ("error_key", "error_type", "error_message", "error_count", "error_traceback"):
+            if hasattr(record, name):
+                data[name[len("error_"):]] = getattr(record, name)
+        return json.dumps(data)
+
+
+class RibbonErrorPanel(QtWidgets.QFrame):
+    """Non-modal window listing the uncaught exceptions, a repeated exception updates its count."""
+
+    def __init__(self, parent=None):
+        """Create a new error panel.
+
+        :param parent: The parent widget.
+        """
+        super().__init__(parent)
+        self.set_window_flags(QtCore.Qt.WindowType.Tool)
+        self.set_window_title("Unexpected errors")
+        self.set_window_icon(
+            QtWidgets.QApplication.style().standard_icon(QtWidgets.QStyle.StandardPixmap.SP_MessageBoxCritical)
+        )
+        self.resize(640, 360)
+        self._items = {}  # type: typing.Dict[str, QtWidgets.QTreeWidgetItem]
+
+        self._errors = QtWidgets.QTreeWidget(self)
+        self._errors.set_header_labels(["Count", "Error"])
+        self._errors.set_root_is_decorated(False)
+        self._errors.currentItemChanged.connect(self._show_details)  # type: ignore
+        self._details = QtWidgets.QPlainTextEdit(self)
+        self._details.set_read_only(True)
+        self._clear_button = QtWidgets.QPushButton("Clear", self)
+        self._clear_button.clicked.connect(self.clear)  # type: ignore
+        self._close_button = QtWidgets.QPushButton("Close", self)
+        self._close_button.clicked.connect(self.hide)  # type: ignore
+
+        self._button_layout = QtWidgets.QHBoxLayout()
+        self._button_layout.add_stretch(1)
+        self._button_layout.add_widget(self._clear_button)
+        self._button_layout.add_widget(self._close_button)
+        self._main_layout = QtWidgets.QVBoxLayout(self)
+        self._main_layout.add_widget(self._errors, 1)
+        self._main_layout.add_widget(self._details, 1)
+        self._main_layout.add_layout(self._button_layout)
+
+    def update_error(self, key: str, summary: str, details: str, count: int):
+        """Add an error, or update its count if it is listed.
+
+        :param key: The key of the error, identifying where it was raised.
+        :param summary: The type and message of the error.
+        :param details: The traceback of the error.
+        :param count: The number of times it was raised.
+        """
+        item = self._items.get(key)
+        if item is None:
+            item = self._items[key] = QtWidgets.QTreeWidgetItem(self._errors, ["", summary])
+            item.set_data(0, QtCore.Qt.ItemDataRole.UserRole, details)
+            if self._errors.current_item() is None:
+                self._errors.set_current_item(item)
+        item.set_text(0, str(count))
+
+    def clear(self):
+        """Remove the listed errors."""
+        self._items.clear()
+        self._errors.clear()
+        self._details.clear()
+
+    def _show_details(self, item: typing.Optional[QtWidgets.QTreeWidgetItem]):
+        """Show the traceback of the selected error."""
+        self._details.set_plain_text(item.data(0, QtCore.Qt.ItemDataRole.UserRole) if item is not None else "")
+
+
 class UncaughtHook(QtCore.QObject):
-    def __init__(self, *args, **kwargs):
-        super(UncaughtHook, self).__init__(*args, **kwargs)
+    """Handle uncaught exceptions without blocking the event loop.
+
+    Each distinct exception, identified by its type and the places of its traceback, is logged once and its
+    repetitions are counted; logging is rate limited, and the errors are shown in a non-modal
+    :class:`RibbonErrorPanel` refreshed at most a few times per second, so a burst of exceptions does not freeze
+    the interface. The hook is not active until installed, see :func:`install_exception_hook`.
+    """
+
+    #: Signal, an exception was recorded, it wakes up the GUI thread when raised from another thread.
+    _error_recorded = QtCore.Signal()
+
+    #: Interval between two refreshes of the error panel, in milliseconds
+    _flush_interval = 250
+
+    def __init__(self, rate_limit: float = 10, show_panel: bool = True, parent=None):
+        """Create a new exception hook.
+
+        :param rate_limit: The maximum number of exceptions logged per second, the others are only counted.
+        :param show_panel: Whether to show the uncaught exceptions in a non-modal panel.
+        :param parent: The parent object.
+        """
+        super(UncaughtHook, self).__init__(parent)
+        self._rate_limit = rate_limit
+        self._tokens = rate_limit
+        self._tokens_time = time.monotonic()
+        self._show_panel = show_panel
+        self._panel = None  # type: typing.Optional[RibbonErrorPanel]
+        self._errors = {}  # type: typing.Dict[str, _ErrorRecord]
+        self._pending = {}  # type: typing.Dict[str, None]
+        self._rate_limited = 0
+        self._lock = threading.Lock()
+        self._previous_hooks = None  # type: typing.Optional[typing.Tuple[typing.Callable, typing.Callable]]
+
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.set_single_shot(True)
+        self._flush_timer.set_interval(self._flush_interval)
+        self._flush_timer.timeout.connect(self._flush)  # type: ignore
+        self._error_recorded.connect(self._schedule_flush)  # type: ignore
+
+    def install(self):
+        """Handle the uncaught exceptions of the interpreter and of the threads."""
+        if self._previous_hooks is None:
+            self._previous_hooks = (sys.excepthook, threading.excepthook)
+            sys.excepthook = self.exception_hook
+            threading.excepthook = self._thread_exception_hook
+
+    def uninstall(self):
+        """Restore the previous exception hooks."""
+        if self._previous_hooks is not None:
+            sys.excepthook, threading.excepthook = self._previous_hooks
+            self._previous_hooks = None
+
+    def is_installed(self) -> bool:
+        """Return whether the hook handles the uncaught exceptions.
+
+        :return: Whether the hook is installed.
+        """
+        return self._previous_hooks is not None
+
+    def errors(self) -> typing.Dict[str, int]:
+        """Return the number of times each distinct exception was raised.
+
+        :return: The counts, by the type and message of the first exception.
+        """
+        with self._lock:
+            return {f"{record.type}: {record.message}": record.count for record in self._errors.values()}
 
-        # this registers the exception_hook() function as hook with the Python interpreter
-        sys.excepthook = self.exception_hook
+    def panel(self) -> typing.Optional[RibbonErrorPanel]:
+        """Return the error panel.
+
+        :return: The error panel, None if it was not shown yet.
+        """
+        return self._panel
+
+    @staticmethod
+    def _key(exc_type: type, exc_traceback) -> str:
+        """Return the key identifying an exception: its type and the places of its traceback."""
+        places = [exc_type.__qualname__]
+        while exc_traceback is not None:
+            places.append(f"{exc_traceback.tb_frame.f_code.co_filename}:{exc_traceback.tb_lineno}")
+            exc_traceback = exc_traceback.tb_next
+        return "|".join(places)
+
+    def _take_token(self) -> bool:
+        """Return whether an exception can be logged now, the tokens are refilled at the rate limit."""
+        now = time.monotonic()
+        self._tokens = min(self._rate_limit, self._tokens + (now - self._tokens_time) * self._rate_limit)
+        self._tokens_time = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    def exception_hook(self, exc_type, exc_value, exc_traceback):
+        """Function handling uncaught exceptions.
+        It is triggered each time an uncaught exception occurs.
+        """
+        if issubclass(exc_type, KeyboardInterrupt):
+            # ignore keyboard interrupt to support console applications
+            sys.__excepthook__(exc_type, exc_value, exc_traceback)
+            return
+        key = self._key(exc_type, exc_traceback)
+        with self._lock:
+            record = self._errors.get(key)
+            if record is None:
+                record = self._errors[key] = _ErrorRecord(key, exc_type, exc_value, exc_traceback)
+            record.count += 1
+            record.last = time.time()
+            # Repetitions are logged on the next flush, only the new exceptions are rate limited
+            logged = False
+            if record.logged_count == 0:
+                logged = self._take_token()
+                if logged:
+                    record.logged_count = record.count
+                else:
+                    self._rate_limited += 1
+            self._pending[key] = None
+        if logged:
+            log.critical(
+                "Uncaught exception:\n %s",
+                record.traceback,
+                extra=self._extra(record),
+            )
+        self._error_recorded.emit()
+
+    def _thread_exception_hook(self, args):
+        """Handle the uncaught exceptions of the threads."""
+        if args.exc_type is SystemExit:
+            return
+        self.exception_hook(args.exc_type, args.exc_value, args.exc_traceback)
+
+    @staticmethod
+    def _extra(record: _ErrorRecord) -> typing.Dict[str, typing.Any]:
+        """Return the structured fields of a record, logged as JSON."""
+        return {
+            "error_key": record.key,
+            "error_type": record.type,
+            "error_message": record.message,
+            "error_count": record.count,
+            "error_traceback": record.traceback,
+        }
+
+    def _schedule_flush(self):
+        """Refresh the error panel soon, repeated exceptions are coalesced in one refresh."""
+        if not self._flush_timer.is_active():
+            self._flush_timer.start()
+
+    def _flush(self):
+        """Log the repetitions and update the error panel with the exceptions recorded since the last refresh."""
+        with self._lock:
+            records = [self._errors[key] for key in self._pending if key in self._errors]
+            self._pending.clear()
+            rate_limited, self._rate_limited = self._rate_limited, 0
+        repeated = [record for record in records if record.logged_count and record.count > record.logged_count]
+        for record in repeated:
+            log.error(
+                "Uncaught exception %s: %s repeated %d times",
+                record.type,
+                record.message,
+                record.count - record.logged_count,
+                extra=self._extra(record),
+            )
+            record.logged_count = record.count
+        if rate_limited:
+            log.warning("%d uncaught exceptions were not logged, the rate limit was exceeded", rate_limited)
+        if not self._show_panel or QtWidgets.QApplication.instance() is None:
+            return
+        if self._panel is None:
+            self._panel = RibbonErrorPanel()
+        for record in records:
+            self._panel.update_error(record.key, f"{record.type}: {record.message}", record.traceback, record.count)
+        if not self._panel.is_visible():
+            self._panel.show()
 
     @staticmethod
     def show_exception_box(log_msg):
         """Checks if a QApplication instance is available and shows a messagebox with the exception message.
         If unavailable (non-console application), log an additional notice.
+
+        .. note:: The message box is modal and blocks until closed, the hook shows a non-modal panel instead.
         """
         if QtWidgets.QApplication.instance() is not None:
             errorbox = QtWidgets.QMessageBox()
@@ -37,21 +308,52 @@ class UncaughtHook(QtCore.QObject):
         else:
             log.debug("No QApplication instance available.")
 
-    def exception_hook(self, exc_type, exc_value, exc_traceback):
-        """Function handling uncaught exceptions.
-        It is triggered each time an uncaught exception occurs.
-        """
-        if issubclass(exc_type, KeyboardInterrupt):
-            # ignore keyboard interrupt to support console applications
-            sys.__excepthook__(exc_type, exc_value, exc_traceback)
-        else:
-            exc_info = (exc_type, exc_value, exc_traceback)
-            log_msg = "\n".join(["".join(traceback.format_tb(exc_traceback)), f"{exc_type.__name__}: {exc_value}"])
-            log.critical(f"Uncaught exception:\n {log_msg}", exc_info=exc_info)
 
-            # trigger message box show
-            self.show_exception_box(log_msg)
+#: The installed hook and its log file handler
+qt_exception_hook = None  # type: typing.Optional[UncaughtHook]
+_log_file_handler = None  # type: typing.Optional[logging.Handler]
+
+
+def install_exception_hook(
+    rate_limit: float = 10,
+    show_panel: bool = True,
+    log_file: typing.Union[str, os.PathLike] = None,
+    max_bytes: int = 1024 * 1024,
+    backup_count: int = 3,
+) -> UncaughtHook:
+    """Handle the uncaught exceptions: log them and show them in a non-modal panel.
+
+    Call it once the ``QApplication`` is created, it replaces ``sys.excepthook`` and ``threading.excepthook``.
+
+    :param rate_limit: The maximum number of exceptions logged per second, the others are only counted.
+    :param show_panel: Whether to show the uncaught exceptions in a non-modal panel.
+    :param log_file: A file the exceptions are also logged to, as JSON lines, it is rotated when too large.
+    :param max_bytes: The size the log file is rotated at.
+    :param backup_count: The number of rotated log files kept.
+    :return: The installed hook.
+    """
+    global qt_exception_hook, _log_file_handler
+    uninstall_exception_hook()
+    qt_exception_hook = UncaughtHook(rate_limit, show_panel, QtWidgets.QApplication.instance())
+    if log_file is not None:
+        _log_file_handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+        )
+        _log_file_handler.setFormatter(JsonLinesFormatter())
+        log.addHandler(_log_file_handler)
+    qt_exception_hook.install()
+    return qt_exception_hook
 
 
-# create a global instance of our class to register the hook
-qt_exception_hook = UncaughtHook()
+def uninstall_exception_hook():
+    """Restore the previous exception hooks and close the log file."""
+    global qt_exception_hook, _log_file_handler
+    if qt_exception_hook is None:
+        return
+    qt_exception_hook.uninstall()
+    qt_exception_hook.delete_later()
+    qt_exception_hook = None
+    if _log_file_handler is not None:
+        log.removeHandler(_log_file_handler)
+        _log_file_handler.close()
+        _log_file_handler = None
@@ -0,0 +1,73 @@
+from __feature__ import snake_case
+
+import tracemalloc
+import typing
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+
+def _pixmap_bytes(pixmap: QtGui.QPixmap) -> int:
+    """Return the size of the pixels of a pixmap."""
+    return 0 if pixmap is None or pixmap.is_null() else pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+
+def _icon_bytes(icon: QtGui.QIcon) -> int:
+    """Return the size of the pixels of the pixmaps an icon holds, scalable icons hold none."""
+    return 0 if icon.is_null() else sum(size.width() * size.height() * 4 for size in icon.available_sizes())
+
+
+def widget_memory(widget: QtWidgets.QWidget) -> typing.Dict[str, int]:
+    """Return the objects, the style sheets and the pixmaps a widget and its children hold.
+
+    :param widget: The widget.
+    :return: The number of QObjects and QWidgets, including the widget, the size of the style sheets and the size
+             of the pixmaps of the icons and labels, in bytes.
+    """
+    children = widget.find_children(QtCore.QObject)
+    widgets = [widget] + [child for child in children if isinstance(child, QtWidgets.QWidget)]
+    style_sheet_bytes = 0
+    pixmap_bytes = 0
+    for child in widgets:
+        style_sheet_bytes += len(child.style_sheet().encode())
+        if isinstance(child, QtWidgets.QAbstractButton):
+            pixmap_bytes += _icon_bytes(child.icon())
+        elif isinstance(child, QtWidgets.QLabel):
+            pixmap_bytes += _pixmap_bytes(child.pixmap())
+    return {
+        "objects": len(children) + 1,
+        "widgets": len(widgets),
+        "style_sheet_bytes": style_sheet_bytes,
+        "pixmap_bytes": pixmap_bytes,
+    }
+
+
+class RibbonAllocationTracker(object):
+    """Python allocations between two calls, from ``tracemalloc`` snapshots."""
+
+    def __init__(self):
+        """Create a new tracker, ``tracemalloc`` is started on the first snapshot if it is not tracing."""
+        self._snapshot = None  # type: typing.Optional[tracemalloc.Snapshot]
+
+    def diff(self, limit: int = 10) -> typing.List[typing.Dict[str, typing.Any]]:
+        """Take a snapshot and compare it with the previous one.
+
+        :param limit: The number of source lines returned, the ones with the largest growth first.
+        :return: The allocation growth by source line, empty on the first call.
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._snapshot = None
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__))
+        )
+        previous, self._snapshot = self._snapshot, snapshot
+        if previous is None:
+            return []
+        return [
+            {
+                "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                "size_diff": stat.size_diff,
+                "count_diff": stat.count_diff,
+            }
+            for stat in snapshot.compare_to(previous, "lineno")[:limit]
+        ]
@@ -1,11 +1,63 @@
+import logging
 import typing
 
 from __feature__ import snake_case
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
+log = logging.getLogger(__name__)
+
+#: An item yielded by a menu provider, an action, a widget, a text, a (text, slot) pair or None for a separator
+RibbonMenuItem = typing.Union[QtGui.QAction, QtWidgets.QWidget, str, typing.Tuple[str, typing.Callable], None]
+#: A callable returning or yielding the items of a menu
+RibbonMenuProvider = typing.Callable[[], typing.Iterable[RibbonMenuItem]]
+
+
+class _RibbonMenuProviderSignals(QtCore.QObject):
+    """Signals of the provider tasks, they live in the GUI thread so the results are queued to it."""
+
+    finished = QtCore.Signal(int, object)
+
+
+class _RibbonMenuProviderTask(QtCore.QRunnable):
+    """Run a menu provider in a worker thread."""
+
+    def __init__(self, provider: RibbonMenuProvider, generation: int, signals: _RibbonMenuProviderSignals):
+        """Create a new provider task.
+
+        :param provider: The provider to run.
+        :param generation: The generation of the menu contents the task fills.
+        :param signals: The signals to report the items with.
+        """
+        super().__init__()
+        self._provider = provider
+        self._generation = generation
+        self._signals = signals
+
+    def run(self):
+        try:
+            items = list(self._provider())
+        except Exception as e:  # noqa
+            items = e
+        try:
+            self._signals.finished.emit(self._generation, items)
+        except RuntimeError:
+            # The menu was deleted while the provider was running
+            pass
+
 
 class RibbonMenu(QtWidgets.QMenu):
+    #: provider of the lazily populated items
+    _provider: typing.Optional[RibbonMenuProvider] = None
+    #: whether the provider runs in a worker thread
+    _provider_threaded = False
+    #: text of the entry shown while a threaded provider is running
+    _provider_placeholder = "Loading..."
+    #: whether the items of the provider are in the menu
+    _provider_populated = False
+    #: bumped on each invalidation, results of older generations are dropped
+    _provider_generation = 0
+
     @typing.overload
     def __init__(self, title: str = "", parent=None):
         pass
@@ -28,6 +80,7 @@ class RibbonMenu(QtWidgets.QMenu):
             parent = args[0] if len(args) > 0 else kwargs.get("parent", None)
         super().__init__(title, parent)
         self.set_font(QtWidgets.QApplication.instance().font())  # type: ignore
+        self._provider_actions = []  # type: typing.List[QtGui.QAction]
 
     def add_widget(self, widget: QtWidgets.QWidget):
         """Add a widget to the menu.
@@ -102,10 +155,144 @@ class RibbonMenu(QtWidgets.QMenu):
         label.set_alignment(alignment)
         self.add_widget(label)  # noqa
 
+    def set_provider(self, provider: RibbonMenuProvider, threaded: bool = False, placeholder: str = "Loading..."):
+        """Populate the menu lazily from a provider, the first time it is about to show.
+
+        The items are cached until :meth:`invalidate` is called.
+
+        :param provider: A callable returning or yielding the items, each item is a QAction, a QWidget, a text,
+                         a (text, slot) pair or None for a separator.
+        :param threaded: Whether to run the provider in a worker thread, a threaded provider must only yield
+                         texts, (text, slot) pairs and None, the actions are created in the GUI thread.
+        :param placeholder: The text of the disabled entry shown while a threaded provider is running.
+        """
+        if self._provider is None:
+            self.aboutToShow.connect(self._populate_from_provider)  # type: ignore
+        self._provider = provider
+        self._provider_threaded = threaded
+        self._provider_placeholder = placeholder
+        self.invalidate()
+
+    def provider(self) -> typing.Optional[RibbonMenuProvider]:
+        """Return the provider of the menu.
+
+        :return: The provider, None if the menu is not populated lazily.
+        """
+        return self._provider
+
+    def invalidate(self):
+        """Drop the items of the provider, they are provided again the next time the menu is about to show."""
+        self._provider_generation += 1
+        self._provider_populated = False
+        self._clear_provider_actions()
+        if self.is_visible():
+            self._populate_from_provider()
+
+    def add_provider_menu(
+        self, title: str, provider: RibbonMenuProvider, threaded: bool = False, placeholder: str = "Loading..."
+    ) -> "RibbonMenu":
+        """Add a sub menu populated lazily from a provider.
+
+        :param title: The title of the sub menu.
+        :param provider: The provider of the items, see :meth:`set_provider`.
+        :param threaded: Whether to run the provider in a worker thread.
+        :param placeholder: The text of the entry shown while a threaded provider is running.
+        :return: The sub menu.
+        """
+        menu = RibbonMenu(title, self)
+        menu.set_provider(provider, threaded, placeholder)
+        self.add_menu(menu)
+        return menu
+
+    def _populate_from_provider(self):
+        """Fill the menu from the provider, if it is not filled yet."""
+        if self._provider is None or self._provider_populated:
+            return
+        self._provider_populated = True
+        # Drop the error entry of a failed provider
+        self._clear_provider_actions()
+        if self._provider_threaded:
+            placeholder = self.add_action(self._provider_placeholder)
+            placeholder.set_enabled(False)
+            self._provider_actions.append(placeholder)
+            if not hasattr(self, "_provider_signals"):
+                self._provider_signals = _RibbonMenuProviderSignals(self)
+                self._provider_signals.finished.connect(self._provider_finished)
+            QtCore.QThreadPool.global_instance().start(
+                _RibbonMenuProviderTask(self._provider, self._provider_generation, self._provider_signals)
+            )
+        else:
+            try:
+                items = list(self._provider())
+            except Exception as error:
+                self._provider_failed(error)
+                return
+            self._add_provider_items(items)
+
+    def _provider_finished(self, generation: int, items: typing.Union[typing.List[RibbonMenuItem], Exception]):
+        """Replace the placeholder with the items of a threaded provider.
+
+        :param generation: The generation the items were provided for.
+        :param items: The items, or the exception raised by the provider.
+        """
+        if generation != self._provider_generation:
+            return
+        self._clear_provider_actions()
+        if isinstance(items, Exception):
+            self._provider_failed(items)
+            return
+        self._add_provider_items(items)
+
+    def _provider_failed(self, error: Exception):
+        """Show the error of the provider in a disabled entry.
+
+        :param error: The exception raised by the provider.
+        """
+        log.error("Menu provider of %r failed: %s", self.title(), error)
+        action = self.add_action(f"Error: {error}")
+        action.set_enabled(False)
+        self._provider_actions.append(action)
+        # Try again the next time the menu is shown
+        self._provider_populated = False
+
+    def _add_provider_items(self, items: typing.Iterable[RibbonMenuItem]):
+        """Add the items of the provider to the menu.
+
+        :param items: The items to add.
+        """
+        for item in items:
+            if item is None:
+                action = self.add_separator()
+            elif isinstance(item, QtGui.QAction):
+                self.add_action(item)
+                action = item
+            elif isinstance(item, QtWidgets.QWidget):
+                action = QtWidgets.QWidgetAction(self)
+                action.set_default_widget(item)
+                self.add_action(action)
+            elif isinstance(item, str):
+                action = self.add_action(item)
+            else:
+                text, slot = item
+                action = self.add_action(text)
+                action.triggered.connect(slot)  # type: ignore
+            self._provider_actions.append(action)
+
+    def _clear_provider_actions(self):
+        """Remove the items of the provider from the menu."""
+        for action in self._provider_actions:
+            self.remove_action(action)
+            if action.parent() is self:
+                action.delete_later()
+        self._provider_actions = []
+
 
 class RibbonPermanentMenu(RibbonMenu):
     """
     A permanent menu.
+
+    It keeps showing itself when Qt hides it as a popup, prefer :class:`RibbonActionList` to embed actions in a
+    widget.
     """
 
     action_added = QtCore.Signal(QtGui.QAction)
@@ -117,3 +304,297 @@ class RibbonPermanentMenu(RibbonMenu):
         action = super().add_action(*args, **kwargs)
         self.action_added.emit(action)
         return action
+
+
+class RibbonActionList(QtWidgets.QWidget):
+    """A flat list of actions drawn like menu items.
+
+    Unlike a menu it is a plain widget and not a popup, so it never hides itself and can be embedded in other
+    widgets, e.g. the popup of a gallery. It has the methods of :class:`RibbonMenu` to add sub menus, widgets,
+    labels, spacings and layout widgets, sub menus pop up when their item is clicked.
+    """
+
+    action_added = QtCore.Signal(QtGui.QAction)
+
+    def __init__(self, parent=None):
+        """Create a new action list.
+
+        :param parent: The parent widget.
+        """
+        super().__init__(parent)
+        self.set_mouse_tracking(True)
+        self.set_size_policy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self._items = []  # type: typing.List[typing.Tuple[QtGui.QAction, QtCore.QRect]]
+        self._items_width = -1
+        self._size_hint = QtCore.QSize()
+        self._items_dirty = True
+        self._hovered_action = None  # type: typing.Optional[QtGui.QAction]
+        self._action_widgets = {}  # type: typing.Dict[QtWidgets.QWidgetAction, QtWidgets.QWidget]
+
+    def add_action(self, *args) -> QtGui.QAction:
+        """Add an action to the list.
+
+        :param args: An action, or the text and optionally the icon of a new action.
+        :return: The added action.
+        """
+        if len(args) == 1 and isinstance(args[0], QtGui.QAction):
+            action = args[0]
+        else:
+            action = QtGui.QAction(*args, self)
+        super().add_action(action)
+        return action
+
+    def add_separator(self) -> QtGui.QAction:
+        """Add a separator to the list.
+
+        :return: The separator action.
+        """
+        action = QtGui.QAction(self)
+        action.set_separator(True)
+        super().add_action(action)
+        return action
+
+    @typing.overload
+    def add_menu(self, menu: QtWidgets.QMenu) -> QtGui.QAction:
+        pass
+
+    @typing.overload
+    def add_menu(self, title: str) -> "RibbonMenu":
+        pass
+
+    @typing.overload
+    def add_menu(self, icon: QtGui.QIcon, title: str) -> "RibbonMenu":
+        pass
+
+    def add_menu(self, *args):
+        """Add a sub menu to the list, as :meth:`QMenu.add_menu` does.
+
+        :param args: A menu, or the title and optionally the icon of a new menu.
+        :return: The action of the menu if a menu is given, otherwise the new menu.
+        """
+        if len(args) == 1 and isinstance(args[0], QtWidgets.QMenu):
+            self.add_action(args[0].menu_action())
+            return args[0].menu_action()
+        menu = RibbonMenu(args[-1], self)
+        if len(args) > 1:
+            menu.set_icon(args[0])
+        self.add_action(menu.menu_action())
+        return menu
+
+    def add_widget(self, widget: QtWidgets.QWidget):
+        """Add a widget to the list.
+
+        :param widget: The widget to add.
+        """
+        widgetAction = QtWidgets.QWidgetAction(self)
+        widgetAction.set_default_widget(widget)
+        self.add_action(widgetAction)
+
+    add_horizontal_layout_widget = RibbonMenu.add_horizontal_layout_widget
+    add_vertical_layout_widget = RibbonMenu.add_vertical_layout_widget
+    add_grid_layout_widget = RibbonMenu.add_grid_layout_widget
+    add_form_layout_widget = RibbonMenu.add_form_layout_widget
+    add_spacing = RibbonMenu.add_spacing
+    add_label = RibbonMenu.add_label
+
+    def clear(self):
+        """Remove all actions from the list."""
+        for action in self.actions():
+            self.remove_action(action)
+            if action.parent() is self:
+                action.delete_later()
+
+    def action_event(self, event: QtGui.QActionEvent) -> None:
+        """Keep the items in sync with the actions."""
+        super().action_event(event)
+        action = event.action()
+        if event.type() == QtCore.QEvent.Type.ActionAdded:
+            action.changed.connect(self._invalidate_items)  # type: ignore
+            if isinstance(action, QtWidgets.QWidgetAction):
+                widget = action.request_widget(self)
+                if widget is not None:
+                    # The item follows the size of the widget, e.g. when widgets are added to its layout
+                    widget.install_event_filter(self)
+                    self._action_widgets[action] = widget
+            self.action_added.emit(action)
+        elif event.type() == QtCore.QEvent.Type.ActionRemoved:
+            action.changed.disconnect(self._invalidate_items)  # type: ignore
+            if action is self._hovered_action:
+                self._hovered_action = None
+            widget = self._action_widgets.pop(action, None)
+            if widget is not None:
+                widget.remove_event_filter(self)
+                action.release_widget(widget)
+        self._invalidate_items()
+
+    def event_filter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        """Lay the items out again when the layout of a widget item changes."""
+        if event.type() == QtCore.QEvent.Type.LayoutRequest:
+            self._invalidate_items()
+        return False
+
+    def resize_event(self, event: QtGui.QResizeEvent) -> None:
+        """Lay the widget items out for the new width."""
+        super().resize_event(event)
+        self._layout_items()
+
+    def _invalidate_items(self):
+        """Schedule a new layout of the items."""
+        self._items_dirty = True
+        self.update_geometry()
+        self.update()
+
+    def _item_option(self, action: QtGui.QAction) -> QtWidgets.QStyleOptionMenuItem:
+        """Return the style option to draw an action with.
+
+        :param action: The action.
+        :return: The style option.
+        """
+        option = QtWidgets.QStyleOptionMenuItem()
+        option.init_from(self)
+        option.font = action.font() if action.font() != QtGui.QFont() else self.font()
+        option.menuRect = self.rect()
+        option.reservedShortcutWidth = 0
+        if action.is_separator():
+            option.menuItemType = QtWidgets.QStyleOptionMenuItem.MenuItemType.Separator
+            option.text = ""
+            return option
+        option.menuItemType = (
+            QtWidgets.QStyleOptionMenuItem.MenuItemType.SubMenu
+            if action.menu() is not None
+            else QtWidgets.QStyleOptionMenuItem.MenuItemType.Normal
+        )
+        option.text = action.text()
+        if not action.shortcut().is_empty():
+            option.text += "\t" + action.shortcut().to_string(QtGui.QKeySequence.SequenceFormat.NativeText)
+        option.icon = action.icon()
+        option.maxIconWidth = self.style().pixel_metric(QtWidgets.QStyle.PixelMetric.PM_SmallIconSize, None, self)
+        option.checkType = (
+            QtWidgets.QStyleOptionMenuItem.CheckType.NonExclusive
+            if action.is_checkable()
+            else QtWidgets.QStyleOptionMenuItem.CheckType.NotCheckable
+        )
+        option.checked = action.is_checked()
+        if not action.is_enabled():
+            option.state &= ~QtWidgets.QStyle.StateFlag.State_Enabled
+        if action is self._hovered_action and action.is_enabled():
+            option.state |= QtWidgets.QStyle.StateFlag.State_Selected
+        return option
+
+    def _layout_items(self):
+        """Compute the rects of the items, only when the actions or the width changed."""
+        if not self._items_dirty and self._items_width == self.width():
+            return
+        self._items = []
+        y = 0
+        width = 0
+        for action in self.actions():
+            if not action.is_visible():
+                continue
+            widget = self._action_widgets.get(action)
+            if widget is not None:
+                size = widget.size_hint().expanded_to(widget.minimum_size()).bounded_to(widget.maximum_size())
+                rect = QtCore.QRect(0, y, self.width(), size.height())
+                widget.set_geometry(rect)
+                widget.show()
+                self._items.append((action, rect))
+                y += size.height()
+                width = max(width, size.width())
+                continue
+            option = self._item_option(action)
+            metrics = QtGui.QFontMetrics(option.font)
+            size = self.style().size_from_contents(
+                QtWidgets.QStyle.ContentsType.CT_MenuItem,
+                option,
+                QtCore.QSize(metrics.horizontal_advance(option.text), metrics.height()),
+                self,
+            )
+            self._items.append((action, QtCore.QRect(0, y, self.width(), size.height())))
+            y += size.height()
+            width = max(width, size.width())
+        self._size_hint = QtCore.QSize(width, y)
+        self._items_width = self.width()
+        self._items_dirty = False
+
+    def action_at(self, pos: QtCore.QPoint) -> typing.Optional[QtGui.QAction]:
+        """Return the action at the given position.
+
+        :param pos: The position in widget coordinates.
+        :return: The action, None if there is no action at the position.
+        """
+        self._layout_items()
+        for action, rect in self._items:
+            if rect.contains(pos):
+                return action
+        return None
+
+    def action_geometry(self, action: QtGui.QAction) -> QtCore.QRect:
+        """Return the geometry of the given action.
+
+        :param action: The action.
+        :return: The geometry, empty if the action is not in the list.
+        """
+        self._layout_items()
+        for item, rect in self._items:
+            if item is action:
+                return rect
+        return QtCore.QRect()
+
+    def size_hint(self) -> QtCore.QSize:
+        """Return the size needed by the items."""
+        self._layout_items()
+        return self._size_hint
+
+    def minimum_size_hint(self) -> QtCore.QSize:
+        """Return the minimum size needed by the items."""
+        return self.size_hint()
+
+    def paint_event(self, event: QtGui.QPaintEvent) -> None:
+        """Paint the items like menu items."""
+        self._layout_items()
+        painter = QtGui.QPainter(self)
+        for action, rect in self._items:
+            if action not in self._action_widgets and event.rect().intersects(rect):
+                option = self._item_option(action)
+                option.rect = rect
+                self.style().draw_control(QtWidgets.QStyle.ControlElement.CE_MenuItem, option, painter, self)
+
+    def _set_hovered_action(self, action: typing.Optional[QtGui.QAction]):
+        """Set the hovered action and repaint the items that changed.
+
+        :param action: The hovered action.
+        """
+        if action is self._hovered_action:
+            return
+        if self._hovered_action is not None:
+            self.update(self.action_geometry(self._hovered_action))
+        self._hovered_action = action
+        if action is not None:
+            self.update(self.action_geometry(action))
+            action.hover()
+
+    def mouse_move_event(self, event: QtGui.QMouseEvent) -> None:
+        """Highlight the hovered action."""
+        self._set_hovered_action(self.action_at(event.position().to_point()))
+        super().mouse_move_event(event)
+
+    def leave_event(self, event: QtCore.QEvent) -> None:
+        """Clear the hovered action."""
+        self._set_hovered_action(None)
+        super().leave_event(event)
+
+    def mouse_release_event(self, event: QtGui.QMouseEvent) -> None:
+        """Trigger the clicked action."""
+        action = self.action_at(event.position().to_point())
+        if (
+            event.button() == QtCore.Qt.MouseButton.LeftButton
+            and action is not None
+            and action.is_enabled()
+            and not action.is_separator()
+            and action not in self._action_widgets
+        ):
+            if action.menu() is not None:
+                action.menu().popup(self.map_to_global(self.action_geometry(action).top_right()))
+            else:
+                action.trigger()
+        super().mouse_release_event(event)
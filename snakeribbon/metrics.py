@@ -0,0 +1,167 @@
+"""Counters of the paint, resize, layout, polish and restyle activity of the ribbon widgets.
+
+.. code-block:: python
+
+    from snakeribbon import metrics
+
+    metrics.enable_metrics()
+    ...
+    print(metrics.metrics_snapshot())
+    # {"RibbonToolButton": {"paint": 120, "resize": 40, "layout": 0, "polish": 40, "style_change": 40,
+    #                       "set_style_sheet": 0}, ...}
+"""
+from __feature__ import snake_case
+
+import collections
+import typing
+
+from PySide6 import QtCore, QtWidgets
+
+from snakeribbon.category import RibbonCategoryLayoutWidget
+from snakeribbon.gallery import RibbonGallery
+from snakeribbon.panel import RibbonPanel
+from snakeribbon.separator import RibbonSeparator
+from snakeribbon.tabbar import RibbonTabBar
+from snakeribbon.toolbutton import RibbonToolButton
+
+#: Widget classes whose activity is counted, their subclasses are counted under their own name
+TRACKED_CLASSES = (
+    RibbonCategoryLayoutWidget,
+    RibbonPanel,
+    RibbonSeparator,
+    RibbonGallery,
+    RibbonTabBar,
+    RibbonToolButton,
+)
+
+#: Counter names of the events
+_event_counters = {
+    QtCore.QEvent.Type.Paint: "paint",
+    QtCore.QEvent.Type.Resize: "resize",
+    QtCore.QEvent.Type.LayoutRequest: "layout",
+    QtCore.QEvent.Type.Polish: "polish",
+    QtCore.QEvent.Type.StyleChange: "style_change",
+}
+
+#: Names of all the counters
+COUNTERS = tuple(_event_counters.values()) + ("set_style_sheet",)
+
+
+class RibbonMetrics(QtCore.QObject):
+    """Count the activity of the ribbon widgets, per widget class.
+
+    Events are counted by an application event filter, ``set_style_sheet`` calls by a wrapper set on the
+    tracked classes while the metrics are enabled. Nothing is counted, nor wrapped, while disabled.
+    """
+
+    def __init__(self, classes: typing.Sequence[type] = TRACKED_CLASSES, parent=None):
+        """Create new metrics.
+
+        :param classes: The widget classes whose activity is counted.
+        :param parent: The parent object.
+        """
+        super().__init__(parent)
+        self._classes = tuple(classes)
+        self._counts = collections.defaultdict(collections.Counter)  # type: typing.Dict[str, typing.Counter[str]]
+        self._tracked_types = {}  # type: typing.Dict[type, bool]
+        self._wrapped = []  # type: typing.List[type]
+        self._enabled = False
+
+    def is_enabled(self) -> bool:
+        """Return whether the activity is counted.
+
+        :return: Whether the metrics are enabled.
+        """
+        return self._enabled
+
+    def enable(self):
+        """Start counting."""
+        if self._enabled:
+            return
+        self._enabled = True
+        QtWidgets.QApplication.instance().install_event_filter(self)
+        for cls in self._classes:
+            if "set_style_sheet" not in cls.__dict__:
+                cls.set_style_sheet = self._counting_set_style_sheet(cls)
+                self._wrapped.append(cls)
+
+    def disable(self):
+        """Stop counting, the counts are kept."""
+        if not self._enabled:
+            return
+        self._enabled = False
+        QtWidgets.QApplication.instance().remove_event_filter(self)
+        for cls in self._wrapped:
+            del cls.set_style_sheet
+        self._wrapped.clear()
+
+    def reset(self):
+        """Reset the counts."""
+        self._counts.clear()
+
+    def snapshot(self) -> typing.Dict[str, typing.Dict[str, int]]:
+        """Return the counts.
+
+        :return: The counts by widget class name and counter name, all the counters are listed.
+        """
+        return {name: {counter: counts[counter] for counter in COUNTERS} for name, counts in self._counts.items()}
+
+    def _counting_set_style_sheet(self, cls: type) -> typing.Callable:
+        """Return a ``set_style_sheet`` counting its calls for a class."""
+        base = super(cls, cls).set_style_sheet  # type: ignore
+        counts = self._counts
+
+        def set_style_sheet(widget: QtWidgets.QWidget, style_sheet: str):
+            counts[type(widget).__name__]["set_style_sheet"] += 1
+            base(widget, style_sheet)
+
+        return set_style_sheet
+
+    def event_filter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        """Count the events of the tracked widgets."""
+        counter = _event_counters.get(event.type())
+        if counter is not None:
+            cls = type(watched)
+            tracked = self._tracked_types.get(cls)
+            if tracked is None:
+                tracked = self._tracked_types[cls] = issubclass(cls, self._classes)
+            if tracked:
+                self._counts[cls.__name__][counter] += 1
+        return False
+
+
+_metrics = None  # type: typing.Optional[RibbonMetrics]
+
+
+def metrics() -> RibbonMetrics:
+    """Return the metrics of the application, they are created on first use.
+
+    :return: The metrics.
+    """
+    global _metrics
+    if _metrics is None:
+        _metrics = RibbonMetrics(parent=QtWidgets.QApplication.instance())
+    return _metrics
+
+
+def enable_metrics():
+    """Start counting the activity of the ribbon widgets."""
+    metrics().enable()
+
+
+def disable_metrics():
+    """Stop counting the activity of the ribbon widgets, the counts are kept."""
+    metrics().disable()
+
+
+def reset_metrics():
+    """Reset the counts."""
+    metrics().reset()
+
+
+def metrics_snapshot() -> typing.Dict[str, typing.Dict[str, int]]:
+    """Return the counts.
+
+    :return: The counts by widget class name and counter name.
+    """
+    return metrics().snapshot()
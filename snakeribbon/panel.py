@@ -2,28 +2,52 @@ from __future__ import annotations
 from __feature__ import snake_case
 
 import re
+import collections
 import functools
-from typing import Any, Callable, Dict, List, Union, overload
+import hashlib
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union, overload
 
-import numpy as np
 from PySide6 import QtCore, QtGui, QtWidgets
 
-from snakeribbon.constants import ColumnWise, RibbonIcon
+from snakeribbon.constants import Cancel, ColumnWise, RibbonAsyncPolicy, RibbonIcon
 from snakeribbon.constants import Large
 from snakeribbon.constants import Medium
 from snakeribbon.constants import RibbonButtonStyle
 from snakeribbon.constants import RibbonSpaceFindMode
 from snakeribbon.constants import Small
-from snakeribbon.gallery import RibbonGallery
+from snakeribbon.layoutcache import RibbonLayoutCache
 from snakeribbon.separator import RibbonSeparator
+from snakeribbon.shortcuts import register_shortcut
 from snakeribbon.toolbutton import RibbonToolButton
-from snakeribbon.utils import DataFile
+from snakeribbon.tracing import traced
+from snakeribbon.utils import DataFile, connect_slot
+
+if TYPE_CHECKING:
+    from snakeribbon.gallery import RibbonGallery  # noqa: F401
 
 
 class RibbonPanelTitle(QtWidgets.QLabel):
     """Widget to display the title of a panel."""
 
 
+def row_counts(max_rows: int) -> Tuple[int, int, int]:
+    """Return the number of rows spanned by the large, medium and small widgets of a panel.
+
+    :param max_rows: The maximal number of rows of the panel.
+    :return: The rows of the large, medium and small widgets.
+    """
+    return max_rows, max(round(max_rows / 2), 1), max(round(max_rows / 3), 1)
+
+
+def widget_method_name(widget_type: str) -> str:
+    """Return the name of the method adding a widget type, e.g. ``add_small_button`` for ``SmallButton``.
+
+    :param widget_type: The type, in CamelCase or snake_case.
+    :return: The name of the method.
+    """
+    return "add_" + re.sub(r"(?<=[a-z])(?=[A-Z])", "_", widget_type).lower()
+
+
 class RibbonGridLayoutManager(object):
     """Grid Layout Manager."""
 
@@ -32,8 +56,24 @@ class RibbonGridLayoutManager(object):
 
         :param rows: The number of rows in the grid layout.
         """
+        # NumPy is only loaded once a grid is created
+        import numpy as np
+
         self.rows = rows
         self.cells = np.ones((rows, 1), dtype=bool)
+        self._deferred = []
+
+    def defer_request_cells(self, row_span: int = 1, col_span: int = 1, mode: RibbonSpaceFindMode = ColumnWise):
+        """Record a request whose cells are already known, e.g. from a layout cache.
+
+        The deferred requests are replayed before the next request, so the grid is only searched when a
+        placement is actually computed.
+
+        :param row_span: The number of rows the cell spans.
+        :param col_span: The number of columns the cell spans.
+        :param mode: The mode of the grid.
+        """
+        self._deferred.append((row_span, col_span, mode))
 
     def request_cells(self, row_span: int = 1, col_span: int = 1, mode: RibbonSpaceFindMode = ColumnWise):
         """Request a number of available cells from the grid.
@@ -43,6 +83,16 @@ class RibbonGridLayoutManager(object):
         :param mode: The mode of the grid.
         :return: row, col, the row and column of the requested cell.
         """
+        if self._deferred:
+            deferred, self._deferred = self._deferred, []
+            for request in deferred:
+                self._request_cells(*request)
+        return self._request_cells(row_span, col_span, mode)
+
+    def _request_cells(self, row_span: int, col_span: int, mode: RibbonSpaceFindMode):
+        """Search the grid for available cells and mark them as used."""
+        import numpy as np
+
         if row_span > self.rows:
             raise ValueError("row_span is too large")
         if mode == ColumnWise:
@@ -117,12 +167,19 @@ class RibbonPanel(QtWidgets.QFrame):
     #: widgets that are added to the panel
     _widgets: List[QtWidgets.QWidget] = []
 
+    #: cache of the computed placements, and the hash of the panel spec so far
+    _layout_cache: Optional[RibbonLayoutCache] = None
+    _layout_hash = None
+
     # height of the title widget
     _title_height: int = 15
 
     # Panel options signal
     panel_option_clicked = QtCore.Signal(bool)
 
+    #: Signal, a widget was added to the panel.
+    widget_added = QtCore.Signal(QtWidgets.QWidget)
+
     @overload
     def __init__(self, title: str = "", max_rows: int = 6, show_panel_option_button=True, parent=None):
         pass
@@ -151,10 +208,9 @@ class RibbonPanel(QtWidgets.QFrame):
             parent = args[0] if len(args) > 0 else kwargs.get("parent", None)
         super().__init__(parent)
         self._max_rows = max_rows
-        self._large_rows = max_rows
-        self._medium_rows = max(round(max_rows / 2), 1)
-        self._small_rows = max(round(max_rows / 3), 1)
+        self._large_rows, self._medium_rows, self._small_rows = row_counts(max_rows)
         self._grid_layout_manager = RibbonGridLayoutManager(self._max_rows)
+        self._placements = collections.deque()
         self._widgets = []
         self._show_panel_option_button = show_panel_option_button
 
@@ -226,9 +282,7 @@ class RibbonPanel(QtWidgets.QFrame):
         :param max_rows: The maximal number of rows in the panel.
         """
         self._max_rows = max_rows
-        self._large_rows = max_rows
-        self._medium_rows = max(round(max_rows / 2), 1)
-        self._small_rows = max(round(max_rows / 3), 1)
+        self._large_rows, self._medium_rows, self._small_rows = row_counts(max_rows)
 
     def set_large_rows(self, rows: int):
         """Set the number of span rows for large widgets.
@@ -331,6 +385,60 @@ class RibbonPanel(QtWidgets.QFrame):
         """
         return self._title_height
 
+    def layout_cache(self) -> Optional[RibbonLayoutCache]:
+        """Return the cache of the computed placements of the panel.
+
+        :return: The layout cache, None if the placements are not cached.
+        """
+        return self._layout_cache
+
+    def set_layout_cache(self, cache: Optional[RibbonLayoutCache]):
+        """Cache the placements and sizes computed when widgets are added, set it before adding widgets.
+
+        :param cache: The layout cache, None to compute the placements every time.
+        """
+        self._layout_cache = cache
+        self._layout_hash = None
+
+    def _layout_cache_key(self, *values, spec: bool = False) -> Optional[str]:
+        """Return the layout cache key of a computation.
+
+        :param values: The inputs of the computation.
+        :param spec: Whether the inputs are part of the panel spec, i.e. a widget is placed, so they are kept
+                     in the hash of the following computations.
+        :return: The key, None if there is no layout cache.
+        """
+        if self._layout_cache is None:
+            return None
+        if self._layout_hash is None:
+            self._layout_hash = hashlib.blake2b(digest_size=16)
+            margins = self._actions_layout.contents_margins()
+            self._layout_hash.update(
+                repr(
+                    (
+                        RibbonLayoutCache.environment_key(self),
+                        self._grid_layout_manager.rows,
+                        self._title_widget.height(),
+                        self._actions_layout.vertical_spacing(),
+                        (margins.top(), margins.bottom()),
+                    )
+                ).encode()
+            )
+        digest = self._layout_hash.copy()
+        digest.update(repr(values).encode())
+        if spec:
+            self._layout_hash = digest
+        return digest.hexdigest()
+
+    def set_placements(self, placements: List[Tuple[int, int]]):
+        """Set the cells of the next widgets added, computed offline, e.g. by :mod:`snakeribbon.compile`.
+
+        The grid is not searched for these widgets, their cells must be the ones :meth:`add_widget` would find.
+
+        :param placements: The row and column of each widget, in the order they are added.
+        """
+        self._placements = collections.deque(tuple(placement) for placement in placements)
+
     def add_widgets_by(self, data: Dict[str, Dict]) -> Dict[str, QtWidgets.QWidget]:
         """Add widgets to the panel.
 
@@ -358,14 +466,15 @@ class RibbonPanel(QtWidgets.QFrame):
         """
         widgets = {}  # type: Dict[str, QtWidgets.QWidget]
         for key, widget_data in data.items():
-            type = widget_data.pop("type", "").capitalize()
-            method = getattr(self, f"add{type}", None)  # type: Callable
-            assert callable(method), f"Method add{type} is not callable or does not exist"
+            name = widget_method_name(widget_data.get("type", ""))
+            assert callable(getattr(type(self), name, None)), f"Method {name} is not callable or does not exist"
+            method = getattr(self, name)  # type: Callable
             args = widget_data.get("args", ())
             kwargs = widget_data.get("kwargs", widget_data.get("arguments", {}))
             widgets[key] = method(*args, **kwargs)
         return widgets
 
+    @traced("RibbonPanel.add_widget")
     def add_widget(
         self,
         widget: QtWidgets.QWidget,
@@ -392,8 +501,21 @@ class RibbonPanel(QtWidgets.QFrame):
         """
         row_span = self.default_row_span(row_span)
         self._widgets.append(widget)
-        row, col = self._grid_layout_manager.request_cells(row_span, col_span, mode)
-        maximumHeight = self.row_height() * row_span + self._actions_layout.vertical_spacing() * (row_span - 2)
+        key = self._layout_cache_key(type(widget).__name__, row_span, col_span, int(mode), fixed_height, spec=True)
+        cached = self._layout_cache.get(key) if key else None
+        placement = self._placements.popleft() if self._placements else None
+        if cached is None:
+            if placement is None:
+                row, col = self._grid_layout_manager.request_cells(row_span, col_span, mode)
+            else:
+                row, col = placement
+                self._grid_layout_manager.defer_request_cells(row_span, col_span, mode)
+            maximumHeight = self.row_height() * row_span + self._actions_layout.vertical_spacing() * (row_span - 2)
+            if key:
+                self._layout_cache.put(key, [row, col, maximumHeight])
+        else:
+            row, col, maximumHeight = cached
+            self._grid_layout_manager.defer_request_cells(row_span, col_span, mode)
         widget.set_maximum_height(maximumHeight)
         if fixed_height is True or fixed_height > 0:
             fixed_height = (
@@ -406,6 +528,7 @@ class RibbonPanel(QtWidgets.QFrame):
         item = RibbonPanelItemWidget(self)
         item.add_widget(widget)
         self._actions_layout.add_widget(item, row, col, row_span, col_span, alignment)  # type: ignore
+        self.widget_added.emit(widget)
         return widget
 
     add_small_widget = functools.partialmethod(add_widget, row_span=Small)
@@ -431,6 +554,7 @@ class RibbonPanel(QtWidgets.QFrame):
         """
         return self._widgets
 
+    @traced("RibbonPanel.add_button")
     def add_button(
         self,
         text: str = None,
@@ -445,6 +569,7 @@ class RibbonPanel(QtWidgets.QFrame):
         checkable: bool = False,
         *,
         row_span: RibbonButtonStyle = Large,
+        async_policy: RibbonAsyncPolicy = Cancel,
         **kwargs,
     ) -> RibbonToolButton:
         """Add a button to the panel.
@@ -452,12 +577,14 @@ class RibbonPanel(QtWidgets.QFrame):
         :param text: The text of the button.
         :param icon: The icon of the button.
         :param show_text: Whether to show the text of the button.
-        :param slot: The slot to call when the button is clicked.
+        :param slot: The slot to call when the button is clicked, a coroutine function or a callable annotated as
+                     returning a future runs without blocking, the button is busy until it is done.
         :param shortcut: The shortcut of the button.
         :param tooltip: The tooltip of the button.
         :param statusTip: The status tip of the button.
         :param checkable: Whether the button is checkable.
         :param row_span: The type of the button corresponding to the number of rows it should span.
+        :param async_policy: What clicking the button does while its asynchronous slot is running.
         :param kwargs: keyword arguments to control the properties of the widget on the ribbon bar.
 
         :return: The button that was added.
@@ -468,23 +595,32 @@ class RibbonPanel(QtWidgets.QFrame):
         button.set_button_style(style)
         button.set_text(text) if text else None
         button.set_icon(icon) if icon else None
-        button.clicked.connect(slot) if slot else None  # type: ignore
-        button.set_shortcut(shortcut) if shortcut else None
+        connect_slot([button], slot, async_policy) if slot else None
+        register_shortcut(button, shortcut) if shortcut else None
         button.set_tool_tip(tooltip) if tooltip else None
         button.set_status_tip(statusTip) if statusTip else None
-        maximumHeight = (
-            self.height()
-            - self._title_label.size_hint().height()
-            - self._main_layout.spacing()
-            - self._main_layout.contents_margins().top()
-            - self._main_layout.contents_margins().bottom()
-        )
+        key = self._layout_cache_key("button", style, button.font().key())
+        cached = self._layout_cache.get(key) if key else None
+        if cached is None:
+            maximumHeight = (
+                self.height()
+                - self._title_label.size_hint().height()
+                - self._main_layout.spacing()
+                - self._main_layout.contents_margins().top()
+                - self._main_layout.contents_margins().bottom()
+            )
+            maximum_icon_size = 0
+            if style == Large:
+                font_size = max(button.font().point_size() * 4 / 3, button.font().pixel_size())
+                arrow_size = font_size
+                maximum_icon_size = int(max(maximumHeight - font_size * 2 - arrow_size, 48))
+            if key:
+                self._layout_cache.put(key, [maximumHeight, maximum_icon_size])
+        else:
+            maximumHeight, maximum_icon_size = cached
         button.set_maximum_height(maximumHeight)
         if style == Large:
-            font_size = max(button.font().point_size() * 4 / 3, button.font().pixel_size())
-            arrow_size = font_size
-            maximum_icon_size = max(maximumHeight - font_size * 2 - arrow_size, 48)
-            button.set_maximum_icon_size(int(maximum_icon_size))
+            button.set_maximum_icon_size(maximum_icon_size)
         if not show_text:
             button.set_tool_button_style(QtCore.Qt.ToolButtonStyle.ToolButtonIconOnly)
         button.set_checkable(checkable)
@@ -627,6 +763,8 @@ class RibbonPanel(QtWidgets.QFrame):
         """
         kwargs["row_span"] = Large if "row_span" not in kwargs else kwargs["row_span"]
         row_span = self.default_row_span(kwargs["row_span"])
+        from snakeribbon.gallery import RibbonGallery
+
         gallery = RibbonGallery(minimum_width, popup_hide_on_click, self)
         maximum_height = self.row_height() * row_span + self._actions_layout.vertical_spacing() * (row_span - 2)
         gallery.set_fixed_height(maximum_height)
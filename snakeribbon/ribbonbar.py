@@ -3,6 +3,7 @@ from pathlib import Path
 from PySide6 import QtCore, QtGui, QtWidgets
 from __feature__ import snake_case
 
+import contextlib
 import typing
 
 from snakeribbon.category import (
@@ -12,10 +13,23 @@ from snakeribbon.category import (
     RibbonNormalCategory,
 )
 from snakeribbon.utils import DataFile
-from snakeribbon.menu import RibbonMenu
+from snakeribbon.layoutcache import RibbonLayoutCache
+from snakeribbon.shortcuts import RibbonShortcutRegistry
 from snakeribbon.tabbar import RibbonTabBar
-from snakeribbon.constants import RibbonCategoryStyle, context_colors, RibbonIcon
+from snakeribbon.constants import RibbonCategoryStyle, RibbonVisibilityState, context_colors, RibbonIcon
 from snakeribbon.titlewidget import RibbonApplicationButton, RibbonTitleWidget
+from snakeribbon.tracing import traced
+
+if typing.TYPE_CHECKING:
+    from snakeribbon.backstage import RibbonBackstageView  # noqa: F401
+    from snakeribbon.gallery import RibbonGallery  # noqa: F401
+    from snakeribbon.heatmap import RibbonRepaintHeatMap  # noqa: F401
+    from snakeribbon.keytips import RibbonKeyTips  # noqa: F401
+    from snakeribbon.memory import RibbonAllocationTracker  # noqa: F401
+    from snakeribbon.menu import RibbonMenu, RibbonMenuProvider  # noqa: F401
+    from snakeribbon.search import RibbonCommandIndex  # noqa: F401
+    from snakeribbon.updates import RibbonUpdateQueue  # noqa: F401
+    from snakeribbon.watchdog import RibbonStallWatchdog  # noqa: F401
 
 
 class RibbonStackedWidget(QtWidgets.QStackedWidget):
@@ -32,14 +46,46 @@ class RibbonStackedWidget(QtWidgets.QStackedWidget):
         self.set_graphics_effect(effect)
 
 
+class RibbonOverlayWidget(QtWidgets.QFrame):
+    """Floating layer that shows the categories over the window contents while the ribbon is collapsed."""
+
+    def __init__(self, parent=None):
+        """Create a new ribbon overlay widget.
+
+        :param parent: The parent widget.
+        """
+        super().__init__(parent)
+        self._layout = QtWidgets.QVBoxLayout(self)
+        self._layout.set_contents_margins(0, 0, 0, 0)
+        self._layout.set_spacing(0)
+        self.hide()
+
+    def set_widget(self, widget: QtWidgets.QWidget):
+        """Set the widget shown in the overlay.
+
+        :param widget: The widget to show.
+        """
+        self._layout.add_widget(widget)
+
+
 class RibbonBar(QtWidgets.QMenuBar):
     """The RibbonBar class is the top level widget that contains the ribbon."""
 
     #: Signal, the help button was clicked.
     sig_help_button_clicked = QtCore.Signal(bool)
 
-    #: hide the ribbon bar automatically when the mouse press outside the ribbon bar
-    _auto_hide_ribbon = False
+    #: Signal, the visibility state of the ribbon changed.
+    sig_ribbon_state_changed = QtCore.Signal(int)
+
+    #: magic number and version of the saved state
+    _state_magic = 0x52425354
+    _state_version = 1
+
+    #: visibility state of the categories
+    _ribbon_state = RibbonVisibilityState.Expanded
+
+    #: delay of the hover intent in auto-hide state, in milliseconds
+    _hover_delay = 250
 
     #: The categories of the ribbon.
     _categories: typing.Dict[str, RibbonCategory] = {}
@@ -48,15 +94,40 @@ class RibbonBar(QtWidgets.QMenuBar):
     #: Maximum rows
     _max_rows = 6
 
-    #: Whether the ribbon is visible.
-    _ribbon_visible = True
-
     #: heights of the ribbon elements
     _ribbon_height = 150
 
     #: current tab index
     _current_tab_index = 0
 
+    #: search index of the commands, built on first use
+    _command_index: typing.Optional["RibbonCommandIndex"] = None
+
+    #: shortcuts of the controls, created on first use
+    _shortcut_registry: typing.Optional[RibbonShortcutRegistry] = None
+
+    #: cache of the panel placements, disabled by default
+    _layout_cache: typing.Optional[RibbonLayoutCache] = None
+
+    #: debug overlay of the repaints, disabled by default
+    _repaint_heat_map: typing.Optional["RibbonRepaintHeatMap"] = None
+
+    #: updates of the ribbon widgets posted from worker threads
+    _update_queue: typing.Optional["RibbonUpdateQueue"] = None
+
+    #: watchdog attributing the stalls of the GUI thread to the ribbon commands, disabled by default
+    _stall_watchdog: typing.Optional["RibbonStallWatchdog"] = None
+
+    #: snapshots of the Python allocations diffed by the memory report
+    _allocation_tracker: typing.Optional["RibbonAllocationTracker"] = None
+
+    #: keyboard access with key tips, disabled by default
+    _key_tips: typing.Optional["RibbonKeyTips"] = None
+
+    #: nesting depth of the context category batch and the tab selected when it started
+    _context_batch_depth = 0
+    _context_batch_tab: typing.Tuple[int, str] = (-1, "")
+
     def __init__(self, title: str = "Ribbon Bar Title", max_rows=6, parent=None):
         """Create a new ribbon.
 
@@ -69,6 +140,7 @@ class RibbonBar(QtWidgets.QMenuBar):
         self._max_rows = max_rows
         self._ribbon_title = title
 
+    @traced("RibbonBar.init")
     def init(self):
         self.set_fixed_height(self._ribbon_height)
 
@@ -83,28 +155,51 @@ class RibbonBar(QtWidgets.QMenuBar):
         self._main_layout.add_widget(self._stacked_widget, 1)
         self._main_layout.set_size_constraint(QtWidgets.QLayout.SizeConstraint.SetMinAndMaxSize)
 
+        # Overlay of the categories while the ribbon is collapsed, moved to the window when shown
+        self._overlay_widget = RibbonOverlayWidget(self)
+        self._overlay_widget.install_event_filter(self)
+        self._hover_intent = False
+        self._hover_timer = QtCore.QTimer(self)
+        self._hover_timer.set_single_shot(True)
+        self._hover_timer.timeout.connect(self._apply_hover_intent)  # type: ignore
+
         # Connect signals
         self._title_widget.sig_help_button_clicked.connect(self.sig_help_button_clicked)
         self._title_widget.sig_collapse_ribbon_button_clicked.connect(self._collapse_button_clicked)
         self._title_widget.tab_bar().currentChanged.connect(self.show_category_by_index)  # type: ignore
+        self._title_widget.tab_bar().tabBarClicked.connect(self._tab_bar_clicked)  # type: ignore
+        self._title_widget.tab_bar().install_event_filter(self)
 
     def auto_hide_ribbon(self) -> bool:
         """Return whether the ribbon bar is automatically hidden when the mouse is pressed outside the ribbon bar.
 
         :return: Whether the ribbon bar is automatically hidden.
         """
-        return self._auto_hide_ribbon
+        return self._ribbon_state == RibbonVisibilityState.AutoHide
 
     def set_auto_hide_ribbon(self, autoHide: bool):
         """Set whether the ribbon bar is automatically hidden when the mouse is pressed outside the ribbon bar.
 
         :param autoHide: Whether the ribbon bar is automatically hidden.
         """
-        self._auto_hide_ribbon = autoHide
+        self.set_ribbon_state(RibbonVisibilityState.AutoHide if autoHide else RibbonVisibilityState.Expanded)
 
     def event_filter(self, a0: QtCore.QObject, a1: QtCore.QEvent) -> bool:
-        if self._auto_hide_ribbon and a1.type() == QtCore.QEvent.Type.HoverMove:
-            self.set_ribbon_visible(self.under_mouse())
+        event_type = a1.type()
+        if a0 is self._title_widget.tab_bar() or a0 is self._overlay_widget:
+            if self._ribbon_state == RibbonVisibilityState.AutoHide:
+                if event_type == QtCore.QEvent.Type.Enter:
+                    self._set_hover_intent(True)
+                elif event_type == QtCore.QEvent.Type.Leave:
+                    self._set_hover_intent(False)
+        elif event_type == QtCore.QEvent.Type.MouseButtonPress and a0.is_widget_type():
+            # Installed on the application while the overlay is shown, a press outside dismisses it
+            position = a1.global_position().to_point()
+            if not (
+                self._overlay_widget.rect().contains(self._overlay_widget.map_from_global(position))
+                or self._title_widget.tab_bar().rect().contains(self._title_widget.tab_bar().map_from_global(position))
+            ):
+                self._hide_overlay()
         return super().event_filter(a0, a1)
 
     def action_at(self, QPoint):
@@ -191,9 +286,20 @@ class RibbonBar(QtWidgets.QMenuBar):
         """
         self._title_widget.insert_title_widget(index, widget)
 
-    def add_file_menu(self) -> RibbonMenu:
-        """Add a file menu to the ribbon."""
-        return self.application_option_button().add_file_menu()
+    def add_file_menu(self, provider: "RibbonMenuProvider" = None, threaded: bool = False) -> "RibbonMenu":
+        """Add a file menu to the ribbon.
+
+        :param provider: The provider to populate the menu lazily from, see :meth:`RibbonMenu.set_provider`.
+        :param threaded: Whether to run the provider in a worker thread.
+        """
+        return self.application_option_button().add_file_menu(provider, threaded)
+
+    def add_backstage_view(self) -> "RibbonBackstageView":
+        """Add a backstage view opened by the application button, it replaces the file menu.
+
+        :return: The backstage view, the one already added if any.
+        """
+        return self.application_option_button().add_backstage_view()
 
     def ribbon_height(self) -> int:
         """Get the total height of the ribbon.
@@ -208,7 +314,8 @@ class RibbonBar(QtWidgets.QMenuBar):
         :param height: The height to set.
         """
         self._ribbon_height = height
-        self.set_fixed_height(height)
+        if self._ribbon_state == RibbonVisibilityState.Expanded:
+            self.set_fixed_height(height)
 
     def tab_bar(self) -> RibbonTabBar:
         """Return the tab bar of the ribbon.
@@ -377,6 +484,41 @@ class RibbonBar(QtWidgets.QMenuBar):
             categories[title].add_panels_by(category_data.get("panels", {}))
         return categories
 
+    @traced("RibbonBar.load_bundle")
+    def load_bundle(self, path: typing.Union[str, Path]) -> typing.Dict[str, RibbonCategory]:
+        """Add the categories of a bundle compiled by :mod:`snakeribbon.compile`.
+
+        The data of the bundle are not validated again, its icons are already scaled, its style sheet minified and
+        the cells of its widgets are not searched, unless the bundle was compiled for another number of rows.
+
+        :param path: The bundle file.
+        :return: A dict of the categories added.
+        """
+        from snakeribbon.compile import read_bundle
+
+        bundle = read_bundle(path)
+        icons = {}
+        for name, pixmaps in bundle.icons.items():
+            icon = icons[name] = QtGui.QIcon()
+            for data in pixmaps.values():
+                pixmap = QtGui.QPixmap()
+                pixmap.load_from_data(data, "PNG")
+                icon.add_pixmap(pixmap)
+        for category in bundle.spec.values():
+            if isinstance(category.get("color"), str):
+                category["color"] = QtGui.QColor(category["color"])
+            for panel in category.get("panels", {}).values():
+                if bundle.max_rows != self._max_rows:
+                    panel.pop("placements", None)
+                for widget in panel.get("widgets", {}).values():
+                    kwargs = widget.get("kwargs", widget.get("arguments"))
+                    if kwargs and isinstance(kwargs.get("icon"), str):
+                        kwargs["icon"] = icons.get(kwargs["icon"]) or QtGui.QIcon(kwargs["icon"])
+        if bundle.style_sheet:
+            self.set_style_sheet(bundle.style_sheet)
+        return self.add_categories_by(bundle.spec)
+
+    @traced("RibbonBar.add_category")
     def add_category(
         self,
         title: str,
@@ -413,12 +555,19 @@ class RibbonBar(QtWidgets.QMenuBar):
 
         self._categories[title] = category
         self._stacked_widget.add_widget(category)
+        if self._command_index is not None:
+            self._command_index.add_category(category)
 
         if style == RibbonCategoryStyle.Normal:
-            self._title_widget.tab_bar().add_tab(title, color)
+            # Normal tabs always come before the resident (possibly hidden) context tabs
+            self._title_widget.tab_bar().insert_tab(self._normal_tab_count(), title, color)
 
         elif style == RibbonCategoryStyle.Context:
             category.hide()
+            # Context tabs stay resident and are only toggled through the tab visibility
+            with self.batch_context_categories():
+                index = self._title_widget.tab_bar().add_tab(title, color)
+                self._title_widget.tab_bar().set_tab_visible(index, False)
 
         if len(self._categories) == 1:
             self._title_widget.tab_bar().set_current_index(1)
@@ -469,8 +618,71 @@ class RibbonBar(QtWidgets.QMenuBar):
             {title: self.add_context_category(title, color) for title in titles},
             self,
         )
+        self._title_widget.tab_bar().associate_tabs(name, titles, color)
         return categories
 
+    def _normal_tab_count(self) -> int:
+        """Return the number of tabs in front of the first context tab.
+
+        :return: The index of the first context tab, or the tab count if there is none.
+        """
+        tab_bar = self._title_widget.tab_bar()
+        for index in range(tab_bar.count()):
+            category = self._categories.get(tab_bar.tab_text(index))
+            if category is not None and category.category_style() == RibbonCategoryStyle.Context:
+                return index
+        return tab_bar.count()
+
+    @contextlib.contextmanager
+    def batch_context_categories(self):
+        """Group several context category changes into one transaction.
+
+        Signals of the tab bar are blocked and its updates disabled until the outermost batch exits,
+        then ``currentChanged`` is emitted once if the current tab changed, so the tab bar is restyled,
+        repainted and laid out a single time.
+
+        .. code-block:: python
+
+            with ribbon.batch_context_categories():
+                ribbon.hide_context_category(table_tools)
+                ribbon.show_context_category(picture_tools)
+        """
+        tab_bar = self._title_widget.tab_bar()
+        if self._context_batch_depth == 0:
+            self._context_batch_tab = (tab_bar.current_index(), tab_bar.tab_text(tab_bar.current_index()))
+            tab_bar.set_updates_enabled(False)
+            tab_bar.block_signals(True)
+        self._context_batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._context_batch_depth -= 1
+            if self._context_batch_depth == 0:
+                tab_bar.block_signals(False)
+                tab_bar.set_updates_enabled(True)
+                tab_bar.update_geometry()
+                index = tab_bar.current_index()
+                if (index, tab_bar.tab_text(index)) != self._context_batch_tab:
+                    tab_bar.currentChanged.emit(index)  # type: ignore
+                if self._shortcut_registry is not None:
+                    self._shortcut_registry.update_scopes()
+
+    def update_context_categories(
+        self,
+        show: typing.Iterable[typing.Union[RibbonContextCategory, RibbonContextCategories]] = (),
+        hide: typing.Iterable[typing.Union[RibbonContextCategory, RibbonContextCategories]] = (),
+    ):
+        """Show and hide several context categories or groups of categories in one batch.
+
+        :param show: The categories to show, the first one becomes the current category.
+        :param hide: The categories to hide.
+        """
+        with self.batch_context_categories():
+            for category in hide:
+                self.hide_context_category(category)
+            for category in show:
+                self.show_context_category(category)
+
     def show_category_by_index(self, index: int):
         """Show category by tab index
 
@@ -481,33 +693,47 @@ class RibbonBar(QtWidgets.QMenuBar):
         if title in self._categories:
             self._stacked_widget.set_current_widget(self._categories[title])
 
+    @staticmethod
+    def _context_categories_of(
+        category: typing.Union[RibbonContextCategory, RibbonContextCategories]
+    ) -> typing.List[RibbonContextCategory]:
+        """Return the context categories of a category or a group of categories.
+
+        :param category: The category or group of categories.
+        :return: The list of context categories, empty if it is not a context category.
+        """
+        if isinstance(category, RibbonContextCategory):
+            return [category]
+        elif isinstance(category, RibbonContextCategories):
+            return list(category.values())
+        return []
+
     def show_context_category(self, category: typing.Union[RibbonContextCategory, RibbonContextCategories]):
         """Show the given category or categories, if it is not a context category, nothing happens.
 
         :param category: The category to show.
         """
-        if isinstance(category, RibbonContextCategory):
-            self._title_widget.tab_bar().add_tab(category.title(), category.color())
-            self._title_widget.tab_bar().set_current_index(self._title_widget.tab_bar().count() - 1)
-            self._stacked_widget.set_current_widget(category)
-        elif isinstance(category, RibbonContextCategories):
-            categories = category
-            titles = list(categories.keys())
-            self._title_widget.tab_bar().add_associated_tabs(categories.name(), titles, categories.color())
-            self._title_widget.tab_bar().set_current_index(self._title_widget.tab_bar().count() - len(titles))
-            self._stacked_widget.set_current_widget(categories[titles[0]])
+        categories = self._context_categories_of(category)
+        if not categories:
+            return
+        tab_bar = self._title_widget.tab_bar()
+        with self.batch_context_categories():
+            for c in categories:
+                tab_bar.set_tab_visible(tab_bar.index_of(c.title()), True)
+            tab_bar.set_current_index(tab_bar.index_of(categories[0].title()))
 
     def hide_context_category(self, category: typing.Union[RibbonContextCategory, RibbonContextCategories]):
         """Hide the given category or categories, if it is not a context category, nothing happens.
 
         :param category: The category to hide.
         """
-        if isinstance(category, RibbonContextCategory):
-            self.tab_bar().remove_tab(self.tab_bar().index_of(category.title()))
-        elif isinstance(category, RibbonContextCategories):
-            categories = category
+        categories = self._context_categories_of(category)
+        if not categories:
+            return
+        tab_bar = self._title_widget.tab_bar()
+        with self.batch_context_categories():
             for c in categories:
-                self.tab_bar().remove_tab(self.tab_bar().index_of(c.title()))
+                tab_bar.set_tab_visible(tab_bar.index_of(c.title()), False)
 
     def category_visible(self, category: RibbonCategory) -> bool:
         """Return whether the category is shown.
@@ -516,7 +742,8 @@ class RibbonBar(QtWidgets.QMenuBar):
 
         :return: Whether the category is shown.
         """
-        return category.title() in self._title_widget.tab_bar().tab_titles()
+        index = self._title_widget.tab_bar().index_of(category.title())
+        return index >= 0 and self._title_widget.tab_bar().is_tab_visible(index)
 
     def remove_category(self, category: RibbonCategory):
         """Remove a category from the ribbon.
@@ -525,6 +752,8 @@ class RibbonBar(QtWidgets.QMenuBar):
         """
         self.tab_bar().remove_tab(self._title_widget.tab_bar().index_of(category.title()))
         self._stacked_widget.remove_widget(category)
+        if self._command_index is not None:
+            self._command_index.remove_category(category)
 
     def remove_categories(self, categories: RibbonContextCategories):
         """Remove a list of categories from the ribbon.
@@ -540,7 +769,7 @@ class RibbonBar(QtWidgets.QMenuBar):
         :param category: The category to set.
         """
         self._stacked_widget.set_current_widget(category)
-        if category.title() in self._title_widget.tab_bar().tab_titles():
+        if self.category_visible(category):
             self._title_widget.tab_bar().set_current_index(self._title_widget.tab_bar().index_of(category.title()))
         else:
             raise ValueError(
@@ -555,6 +784,186 @@ class RibbonBar(QtWidgets.QMenuBar):
         """
         return self._categories[self._title_widget.tab_bar().tab_text(self._title_widget.tab_bar().current_index())]
 
+    def command_index(self) -> "RibbonCommandIndex":
+        """Return the search index of the commands of the ribbon.
+
+        The index is built on first use, then kept up to date as categories, panels and widgets are added.
+
+        :return: The command index.
+        """
+        if self._command_index is None:
+            from snakeribbon.search import RibbonCommandIndex
+
+            self._command_index = RibbonCommandIndex(self)
+            for category in self._categories.values():
+                self._command_index.add_category(category)
+        return self._command_index
+
+    def shortcut_registry(self) -> RibbonShortcutRegistry:
+        """Return the registry of the shortcuts of the ribbon controls.
+
+        :return: The shortcut registry.
+        """
+        if self._shortcut_registry is None:
+            self._shortcut_registry = RibbonShortcutRegistry(self)
+        return self._shortcut_registry
+
+    def update_queue(self) -> "RibbonUpdateQueue":
+        """Return the queue updating the ribbon widgets from worker threads.
+
+        :return: The update queue.
+        """
+        if self._update_queue is None:
+            from snakeribbon.updates import RibbonUpdateQueue
+
+            self._update_queue = RibbonUpdateQueue(parent=self)
+        return self._update_queue
+
+    def layout_cache(self) -> typing.Optional[RibbonLayoutCache]:
+        """Return the cache of the panel placements.
+
+        :return: The layout cache, None if it is disabled.
+        """
+        return self._layout_cache
+
+    def set_layout_cache(self, cache: typing.Union[RibbonLayoutCache, str, Path, None]):
+        """Cache the placements and sizes of the panel widgets on disk, so they are not computed again on the
+        next start. Set it before adding categories, the cache is saved when the application quits.
+
+        :param cache: The layout cache or the path of its file, None to disable it.
+        """
+        if self._layout_cache is not None:
+            QtWidgets.QApplication.instance().aboutToQuit.disconnect(self._layout_cache.save)  # type: ignore
+        if cache is not None and not isinstance(cache, RibbonLayoutCache):
+            cache = RibbonLayoutCache(cache)
+        self._layout_cache = cache
+        if cache is not None:
+            QtWidgets.QApplication.instance().aboutToQuit.connect(cache.save)  # type: ignore
+
+    def repaint_heat_map(self) -> typing.Optional["RibbonRepaintHeatMap"]:
+        """Return the repaint heat map of the ribbon.
+
+        :return: The heat map, None if it is disabled.
+        """
+        return self._repaint_heat_map
+
+    def set_repaint_heat_map_enabled(self, enabled: bool, duration: float = 5.0):
+        """Show or hide a debug overlay tinting the ribbon widgets by how often they repainted.
+
+        :param enabled: Whether the heat map is shown.
+        :param duration: The number of seconds the repaints are counted over.
+        """
+        if enabled and self._repaint_heat_map is None:
+            from snakeribbon.heatmap import RibbonRepaintHeatMap
+
+            self._repaint_heat_map = RibbonRepaintHeatMap((self, self._overlay_widget), duration)
+            self._repaint_heat_map.start()
+        elif not enabled and self._repaint_heat_map is not None:
+            self._repaint_heat_map.stop()
+            self._repaint_heat_map.delete_later()
+            self._repaint_heat_map = None
+
+    def stall_watchdog(self) -> typing.Optional["RibbonStallWatchdog"]:
+        """Return the watchdog of the GUI thread.
+
+        :return: The watchdog, None if it is disabled.
+        """
+        return self._stall_watchdog
+
+    def set_stall_watchdog_enabled(self, enabled: bool, threshold: int = 100):
+        """Start or stop a watchdog attributing the stalls of the GUI thread to the ribbon commands.
+
+        The stalls are listed by :meth:`RibbonStallWatchdog.stalls`, slowest slots first.
+
+        :param enabled: Whether the GUI thread is watched.
+        :param threshold: The delay of the event loop, in milliseconds, from which the GUI thread is stalled.
+        """
+        if enabled and self._stall_watchdog is None:
+            from snakeribbon.watchdog import RibbonStallWatchdog
+
+            self._stall_watchdog = RibbonStallWatchdog(threshold, parent=self)
+            self._stall_watchdog.start()
+        elif not enabled and self._stall_watchdog is not None:
+            self._stall_watchdog.stop()
+            self._stall_watchdog.delete_later()
+            self._stall_watchdog = None
+
+    def memory_report(self, trace_allocations: bool = False, limit: int = 10) -> typing.Dict[str, typing.Any]:
+        """Return the objects and memory held by the ribbon, per category and per panel.
+
+        Each level reports the number of QObjects and QWidgets, the size of the style sheets and of the pixmaps of
+        icons and labels, and the number of entries of the Python containers. Containers shared by all instances
+        of a class are reported with their class, they grow with each ribbon.
+
+        :param trace_allocations: Whether to diff the Python allocations with the previous call, ``tracemalloc``
+                                  is started on the first call, so the allocations are reported from the second.
+        :param limit: The number of source lines of the allocation diff.
+        :return: The report.
+        """
+        # The report loads tracemalloc, it is imported once requested
+        from snakeribbon.gallery import RibbonGallery
+        from snakeribbon.memory import RibbonAllocationTracker, widget_memory
+
+        title_widget = self._title_widget
+        report = widget_memory(self)
+        report["containers"] = dict(
+            self.tab_bar().container_sizes(),
+            categories=len(self._categories),
+            quick_access_buttons=len(title_widget.quick_access_buttons()),
+            right_tool_buttons=len(title_widget.right_tool_buttons()),
+        )
+        report["shared_containers"] = {
+            f"{type(title_widget).__name__}.{name}": len(getattr(type(title_widget), name))
+            for name in ("_quick_access_buttons", "_right_tool_buttons")
+            if getattr(type(title_widget), name) is getattr(title_widget, name)
+        }
+        report["categories"] = {}
+        for title, category in self._categories.items():
+            category_report = report["categories"][title] = widget_memory(category)
+            category_report["panels"] = {}
+            for panel_title, panel in category.panels().items():
+                panel_report = category_report["panels"][panel_title] = widget_memory(panel)
+                galleries = [widget for widget in panel.widgets() if isinstance(widget, RibbonGallery)]
+                panel_report["containers"] = {
+                    "widgets": len(panel.widgets()),
+                    "gallery_buttons": sum(len(gallery.buttons()) for gallery in galleries),
+                    "gallery_popup_buttons": sum(len(gallery.popup_buttons()) for gallery in galleries),
+                }
+        if trace_allocations:
+            if self._allocation_tracker is None:
+                self._allocation_tracker = RibbonAllocationTracker()
+            report["allocations"] = self._allocation_tracker.diff(limit)
+        return report
+
+    def key_tips(self) -> typing.Optional["RibbonKeyTips"]:
+        """Return the key tips of the ribbon.
+
+        :return: The key tips, None if they are disabled.
+        """
+        return self._key_tips
+
+    def key_tips_enabled(self) -> bool:
+        """Return whether pressing Alt shows the key tips.
+
+        :return: Whether the key tips are enabled.
+        """
+        return self._key_tips is not None
+
+    def set_key_tips_enabled(self, enabled: bool):
+        """Enable or disable the key tips, they are shown when Alt is pressed and released.
+
+        :param enabled: Whether the key tips are enabled.
+        """
+        if enabled and self._key_tips is None:
+            from snakeribbon.keytips import RibbonKeyTips
+
+            self._key_tips = RibbonKeyTips(self)
+            self._key_tips.install()
+        elif not enabled and self._key_tips is not None:
+            self._key_tips.uninstall()
+            self._key_tips.delete_later()
+            self._key_tips = None
+
     def minimum_size_hint(self) -> QtCore.QSize:
         """Return the minimum size hint of the widget.
 
@@ -562,34 +971,138 @@ class RibbonBar(QtWidgets.QMenuBar):
         """
         return QtCore.QSize(super().minimum_size_hint().width(), self._ribbon_height)
 
+    def ribbon_state(self) -> RibbonVisibilityState:
+        """Return the visibility state of the ribbon.
+
+        :return: The visibility state.
+        """
+        return self._ribbon_state
+
+    def set_ribbon_state(self, state: RibbonVisibilityState):
+        """Set the visibility state of the ribbon.
+
+        In the collapsed and auto-hide states the categories are moved to a floating overlay, so showing them
+        does not resize the ribbon bar nor relayout the main window.
+
+        :param state: The visibility state.
+        """
+        state = RibbonVisibilityState(state)
+        if state == self._ribbon_state:
+            return
+        self._hover_timer.stop()
+        self._hide_overlay()
+        expanded = state == RibbonVisibilityState.Expanded
+        if expanded or self._ribbon_state == RibbonVisibilityState.Expanded:
+            if expanded:
+                self.collapse_ribbon_button().set_tool_tip("Collapse Ribbon")
+                self.collapse_ribbon_button().set_icon(QtGui.QIcon(DataFile(RibbonIcon.Up)))
+                self._main_layout.add_widget(self._stacked_widget, 1)
+                self._stacked_widget.show()
+                self.set_fixed_height(self._ribbon_height)
+            else:
+                self.collapse_ribbon_button().set_tool_tip("Expand Ribbon")
+                self.collapse_ribbon_button().set_icon(QtGui.QIcon(DataFile(RibbonIcon.Down)))
+                self._main_layout.remove_widget(self._stacked_widget)
+                self._overlay_widget.set_widget(self._stacked_widget)
+                self.set_fixed_height(self._title_widget.size().height() + 5)
+        self._ribbon_state = state
+        self.sig_ribbon_state_changed.emit(int(state))
+
+    def overlay_visible(self) -> bool:
+        """Return whether the categories are shown in the overlay.
+
+        :return: True if the overlay is shown, False otherwise.
+        """
+        return self._overlay_widget.is_visible()
+
+    def set_overlay_visible(self, visible: bool):
+        """Show or hide the categories over the window contents, while the ribbon is collapsed or auto-hidden.
+
+        :param visible: Whether to show the overlay.
+        """
+        self._show_overlay() if visible else self._hide_overlay()
+
+    def _show_overlay(self):
+        """Show the categories over the window contents, under the tab bar."""
+        if self._ribbon_state == RibbonVisibilityState.Expanded or self._overlay_widget.is_visible():
+            return
+        window = self.window()
+        if self._overlay_widget.parent_widget() is not window:
+            self._overlay_widget.set_parent(window)
+        top_left = self.map_to(window, QtCore.QPoint(0, self.height()))
+        self._overlay_widget.set_geometry(
+            top_left.x(), top_left.y(), self.width(), self._ribbon_height - self._title_widget.height()
+        )
+        self._overlay_widget.raise_()
+        self._overlay_widget.show()
+        QtWidgets.QApplication.instance().install_event_filter(self)
+
+    def _hide_overlay(self):
+        """Hide the overlay of the categories."""
+        if self._overlay_widget.is_visible():
+            QtWidgets.QApplication.instance().remove_event_filter(self)
+            self._overlay_widget.hide()
+
+    def _tab_bar_clicked(self, index: int):
+        """Toggle the overlay when a tab is clicked while the ribbon is collapsed.
+
+        :param index: The index of the clicked tab.
+        """
+        if self._ribbon_state == RibbonVisibilityState.Expanded:
+            return
+        if self._overlay_widget.is_visible() and index == self._title_widget.tab_bar().current_index():
+            self._hide_overlay()
+        else:
+            self._show_overlay()
+
+    def _set_hover_intent(self, hovered: bool):
+        """Record the hover intent, it is applied once the mouse settled for the hover delay.
+
+        :param hovered: Whether the tab bar or the overlay is hovered.
+        """
+        self._hover_intent = hovered
+        self._hover_timer.start(self._hover_delay)
+
+    def _apply_hover_intent(self):
+        """Show or hide the overlay according to the last hover intent."""
+        if self._ribbon_state != RibbonVisibilityState.AutoHide:
+            return
+        self._show_overlay() if self._hover_intent else self._hide_overlay()
+
+    def hover_delay(self) -> int:
+        """Return the delay of the hover intent in auto-hide state.
+
+        :return: The delay in milliseconds.
+        """
+        return self._hover_delay
+
+    def set_hover_delay(self, delay: int):
+        """Set the delay of the hover intent in auto-hide state.
+
+        :param delay: The delay in milliseconds.
+        """
+        self._hover_delay = delay
+
     def _collapse_button_clicked(self):
-        self.tab_bar().currentChanged.connect(self.show_ribbon)  # type: ignore
-        self.hide_ribbon() if self._stacked_widget.is_visible() else self.show_ribbon()
+        if self._ribbon_state == RibbonVisibilityState.Expanded:
+            self.hide_ribbon()
+        else:
+            self.show_ribbon()
 
     def show_ribbon(self):
         """Show the ribbon."""
-        if not self._ribbon_visible:
-            self._ribbon_visible = True
-            self.collapse_ribbon_button().set_tool_tip("Collapse Ribbon")
-            self.collapse_ribbon_button().set_icon(QtGui.QIcon(DataFile(RibbonIcon.Up)))
-            self._stacked_widget.set_visible(True)
-            self.set_fixed_size(self.size_hint())
+        self.set_ribbon_state(RibbonVisibilityState.Expanded)
 
     def hide_ribbon(self):
         """Hide the ribbon."""
-        if self._ribbon_visible:
-            self._ribbon_visible = False
-            self.collapse_ribbon_button().set_tool_tip("Expand Ribbon")
-            self.collapse_ribbon_button().set_icon(QtGui.QIcon(DataFile(RibbonIcon.Down)))
-            self._stacked_widget.set_visible(False)
-            self.set_fixed_size(self.size_hint().width(), self._title_widget.size().height() + 5)  # type: ignore
+        self.set_ribbon_state(RibbonVisibilityState.Collapsed)
 
     def ribbon_visible(self) -> bool:
         """Get the visibility of the ribbon.
 
         :return: True if the ribbon is visible, False otherwise.
         """
-        return self._ribbon_visible
+        return self._ribbon_state == RibbonVisibilityState.Expanded
 
     def set_ribbon_visible(self, visible: bool):
         """Set the visibility of the ribbon.
@@ -597,3 +1110,118 @@ class RibbonBar(QtWidgets.QMenuBar):
         :param visible: True to show the ribbon, False to hide it.
         """
         self.show_ribbon() if visible else self.hide_ribbon()
+
+    def _quick_access_actions(self) -> typing.Dict[str, QtGui.QAction]:
+        """Return the actions of the quick access buttons, by the name they are saved with.
+
+        :return: The actions, by name.
+        """
+        tool_bar = self.quick_access_tool_bar()
+        actions = {}
+        for action in tool_bar.actions():
+            button = tool_bar.widget_for_action(action)
+            if isinstance(button, QtWidgets.QAbstractButton) and not isinstance(button, RibbonApplicationButton):
+                actions[button.object_name() or button.text() or button.tool_tip()] = action
+        return actions
+
+    def _galleries(self) -> typing.Dict[str, "RibbonGallery"]:
+        """Return the galleries of the ribbon, by the path they are saved with.
+
+        :return: The galleries, by category, panel and index in the panel.
+        """
+        from snakeribbon.gallery import RibbonGallery
+
+        galleries = {}
+        for category_title, category in self._categories.items():
+            for panel_title, panel in category.panels().items():
+                for index, widget in enumerate(panel.widgets()):
+                    if isinstance(widget, RibbonGallery):
+                        galleries[f"{category_title}/{panel_title}/{index}"] = widget
+        return galleries
+
+    def save_state(self) -> bytes:
+        """Save the state of the ribbon: the current category, the visibility state, the quick access buttons shown,
+        the scroll positions of the categories and the scroll positions and checked buttons of the galleries.
+
+        :return: The state, restored with :meth:`restore_state`.
+        """
+        data = QtCore.QByteArray()
+        stream = QtCore.QDataStream(data, QtCore.QIODevice.OpenModeFlag.WriteOnly)
+        stream.set_version(QtCore.QDataStream.Version.Qt_6_0)
+        stream.writeUInt32(self._state_magic)
+        stream.writeUInt16(self._state_version)
+        stream.writeQString(self.current_category().title() if self._categories else "")
+        stream.writeUInt8(int(self._ribbon_state))
+
+        quick_access_actions = self._quick_access_actions()
+        stream.writeUInt16(len(quick_access_actions))
+        for name, action in quick_access_actions.items():
+            stream.writeQString(name)
+            stream.write_bool(action.is_visible())
+
+        stream.writeUInt16(len(self._categories))
+        for title, category in self._categories.items():
+            stream.writeQString(title)
+            stream.write_int32(category.scroll_position())
+
+        galleries = self._galleries()
+        stream.writeUInt16(len(galleries))
+        for path, gallery in galleries.items():
+            checked = [row for row, button in enumerate(gallery.buttons()) if button.is_checked()]
+            stream.writeQString(path)
+            stream.write_int32(gallery.scroll_position())
+            stream.writeUInt16(len(checked))
+            for row in checked:
+                stream.writeUInt16(row)
+        return data.data()
+
+    def restore_state(self, state: bytes) -> bool:
+        """Restore a state saved with :meth:`save_state`.
+
+        Call it before the ribbon is first shown, the current category is selected once and the scroll positions
+        are applied when the categories and galleries are laid out. Entries of categories, quick access buttons
+        or galleries that no longer exist are ignored.
+
+        :param state: The saved state.
+        :return: True if the state was restored, False if it is invalid or from a newer version.
+        """
+        stream = QtCore.QDataStream(QtCore.QByteArray(state))
+        stream.set_version(QtCore.QDataStream.Version.Qt_6_0)
+        if stream.readUInt32() != self._state_magic or not 0 < stream.readUInt16() <= self._state_version:
+            return False
+        current = stream.readQString()
+        ribbon_state = stream.readUInt8()
+        quick_access = [(stream.readQString(), stream.read_bool()) for _ in range(stream.readUInt16())]
+        scroll_positions = [(stream.readQString(), stream.read_int32()) for _ in range(stream.readUInt16())]
+        galleries = []
+        for _ in range(stream.readUInt16()):
+            path, position = stream.readQString(), stream.read_int32()
+            galleries.append((path, position, [stream.readUInt16() for _ in range(stream.readUInt16())]))
+        if stream.status() != QtCore.QDataStream.Status.Ok or ribbon_state not in list(RibbonVisibilityState):
+            return False
+
+        quick_access_actions = self._quick_access_actions()
+        for name, visible in quick_access:
+            if name in quick_access_actions:
+                quick_access_actions[name].set_visible(visible)
+        for title, position in scroll_positions:
+            if title in self._categories:
+                self._categories[title].set_scroll_position(position)
+        ribbon_galleries = self._galleries()
+        for path, position, checked in galleries:
+            gallery = ribbon_galleries.get(path)
+            if gallery is None:
+                continue
+            gallery.set_scroll_position(position)
+            buttons = gallery.buttons()
+            for row, button in enumerate(buttons):
+                if button.is_checkable():
+                    button.set_checked(row in checked)
+                    gallery.popup_buttons()[row].set_checked(row in checked)
+        # the batch switches the category once, at its end
+        with self.batch_context_categories():
+            category = self._categories.get(current)
+            if category is not None and self.category_visible(category):
+                self.set_current_category(category)
+        self.set_ribbon_state(RibbonVisibilityState(ribbon_state))
+        return True
@@ -0,0 +1,372 @@
+from __feature__ import snake_case
+
+import heapq
+import typing
+
+import shiboken6
+from PySide6 import QtCore, QtGui, QtWidgets
+
+from snakeribbon.gallery import RibbonGallery
+
+if typing.TYPE_CHECKING:
+    from .category import RibbonCategory  # noqa: F401
+    from .panel import RibbonPanel  # noqa: F401
+    from .ribbonbar import RibbonBar  # noqa: F401
+
+
+#: A searchable command, a button is clicked and an action is triggered when the command is run
+RibbonCommand = typing.Union[QtWidgets.QAbstractButton, QtGui.QAction]
+
+
+class RibbonCommandIndex(QtCore.QObject):
+    """Search index over the commands of a ribbon: buttons, gallery items and menu actions.
+
+    Every command is indexed by the prefixes of the words of its text, and of its tooltip, status tip and
+    category/panel path. A search is answered with set operations on these prefixes, ranked in tiers: commands
+    whose text starts with the query, whose text words start with the query words, whose other words start
+    with the query words, and last, fuzzy matches of the letters of the query words in the text words. Only the tiers
+    needed to fill the results are computed.
+    """
+
+    #: Separator of the category and panel in the path of a command
+    path_separator = " > "
+
+    def __init__(self, parent=None):
+        """Create a new command index.
+
+        :param parent: The parent object.
+        """
+        super().__init__(parent)
+        self._commands = []  # type: typing.List[typing.Optional[RibbonCommand]]
+        self._texts = []  # type: typing.List[str]
+        self._paths = []  # type: typing.List[str]
+        self._lower_texts = []  # type: typing.List[str]
+        #: order of the commands in a tier, shorter texts first
+        self._order = []  # type: typing.List[int]
+        self._ids = {}  # type: typing.Dict[int, int]
+        self._removed = set()  # type: typing.Set[int]
+        #: prefixes of the first word of the texts
+        self._first_prefixes = {}  # type: typing.Dict[str, typing.Set[int]]
+        #: prefixes of the words of the texts
+        self._text_prefixes = {}  # type: typing.Dict[str, typing.Set[int]]
+        #: prefixes of the words of the tooltips, status tips and paths
+        self._other_prefixes = {}  # type: typing.Dict[str, typing.Set[int]]
+        #: distinct words of the texts, by first letter
+        self._text_words = {}  # type: typing.Dict[str, typing.Set[str]]
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @staticmethod
+    def _command_text(command: RibbonCommand) -> str:
+        """Return the text of a command, without the mnemonic ampersands.
+
+        :param command: The command.
+        :return: The text.
+        """
+        return command.text().replace("&&", "\0").replace("&", "").replace("\0", "&")
+
+    @staticmethod
+    def _add_prefixes(index: dict, words: typing.Iterable[str], command_id: int):
+        """Index all prefixes of the words for a command.
+
+        :param index: The prefix index.
+        :param words: The lower case words.
+        :param command_id: The id of the command.
+        """
+        for word in words:
+            for i in range(1, len(word) + 1):
+                ids = index.get(word[:i])
+                if ids is None:
+                    index[word[:i]] = {command_id}
+                else:
+                    ids.add(command_id)
+
+    def add_command(self, command: RibbonCommand, path: str = ""):
+        """Add a command to the index, commands without text and tooltip are ignored.
+
+        :param command: The button or action.
+        :param path: The category/panel path of the command.
+        """
+        key = id(command)
+        if key in self._ids or (isinstance(command, QtGui.QAction) and command.is_separator()):
+            return
+        text = self._command_text(command)
+        tooltip = command.tool_tip()
+        if not text and not tooltip:
+            return
+        if not text:
+            text = tooltip
+        command_id = len(self._commands)
+        lower_text = text.lower()
+        self._commands.append(command)
+        self._texts.append(text)
+        self._paths.append(path)
+        self._lower_texts.append(lower_text)
+        self._order.append((len(lower_text) << 32) + command_id)
+        self._ids[key] = command_id
+        # The index keeps the command, so its key is not reused by another object until it is dropped
+        command.destroyed.connect(lambda: self._forget(key))  # type: ignore
+
+        text_words = set(lower_text.split())
+        other_words = set(" ".join((tooltip, command.status_tip(), path)).lower().split()) - text_words
+        self._add_prefixes(self._first_prefixes, lower_text.split()[:1], command_id)
+        self._add_prefixes(self._text_prefixes, text_words, command_id)
+        self._add_prefixes(self._other_prefixes, other_words, command_id)
+        for word in text_words:
+            self._text_words.setdefault(word[0], set()).add(word)
+
+        if isinstance(command, QtWidgets.QAbstractButton):
+            # Actions added to a button later on are indexed too
+            command.install_event_filter(self)
+            for action in command.actions():
+                self.add_command(action, path)
+            menu = command.menu() if isinstance(command, QtWidgets.QToolButton) else None
+            if menu is not None:
+                self.add_menu(menu, path)
+
+    def add_menu(self, menu: QtWidgets.QMenu, path: str = ""):
+        """Add the actions of a menu to the index, actions added later on are indexed too.
+
+        :param menu: The menu.
+        :param path: The category/panel path of the menu.
+        """
+        menu.install_event_filter(self)
+        menu.set_property("_ribbon_command_path", path)
+        for action in menu.actions():
+            if action.menu() is not None:
+                self.add_menu(action.menu(), path)
+            else:
+                self.add_command(action, path)
+
+    def remove_command(self, command: RibbonCommand):
+        """Remove a command from the index.
+
+        :param command: The button or action.
+        """
+        self._forget(id(command))
+
+    def _forget(self, key: int):
+        """Drop a command from the index.
+
+        :param key: The key of the command.
+        """
+        command_id = self._ids.pop(key, None)
+        if command_id is not None:
+            self._commands[command_id] = None
+            self._removed.add(command_id)
+
+    def add_widget(self, widget: QtWidgets.QWidget, path: str = ""):
+        """Add the commands of a widget of a panel to the index.
+
+        :param widget: The widget, a button, a gallery or any other widget.
+        :param path: The category/panel path of the widget.
+        """
+        if isinstance(widget, RibbonGallery):
+            for button in widget.buttons():
+                self.add_command(button, path)
+            for action in widget.popup_menu().actions():
+                self.add_command(action, path)
+            widget.button_added.connect(lambda button: self.add_command(button, path))  # type: ignore
+            widget.popup_menu().action_added.connect(lambda action: self.add_command(action, path))  # type: ignore
+        elif isinstance(widget, QtWidgets.QAbstractButton):
+            self.add_command(widget, path)
+
+    def add_panel(self, panel: "RibbonPanel", category: "RibbonCategory"):
+        """Add the commands of a panel to the index, and follow the widgets added to it later on.
+
+        :param panel: The panel.
+        :param category: The category of the panel.
+        """
+        path = category.title() + self.path_separator + panel.title()
+        for widget in panel.widgets():
+            self.add_widget(widget, path)
+        panel.widget_added.connect(lambda widget: self.add_widget(widget, path))  # type: ignore
+
+    def add_category(self, category: "RibbonCategory"):
+        """Add the commands of a category to the index, and follow the panels added to it later on.
+
+        :param category: The category.
+        """
+        for panel in category.panels().values():
+            self.add_panel(panel, category)
+        category.panel_added.connect(lambda panel: self.add_panel(panel, category))  # type: ignore
+
+    def remove_category(self, category: "RibbonCategory"):
+        """Remove the commands of a category from the index.
+
+        :param category: The category.
+        """
+        prefix = category.title() + self.path_separator
+        for key, command_id in list(self._ids.items()):
+            if self._paths[command_id].startswith(prefix):
+                self._forget(key)
+
+    def event_filter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        """Follow the actions added to and removed from the indexed buttons and menus."""
+        event_type = event.type()
+        if event_type == QtCore.QEvent.Type.ActionAdded:
+            path = watched.property("_ribbon_command_path") if isinstance(watched, QtWidgets.QMenu) else None
+            if path is None:
+                index = self._ids.get(id(watched))
+                path = self._paths[index] if index is not None else ""
+            if event.action().menu() is not None:
+                self.add_menu(event.action().menu(), path)
+            else:
+                self.add_command(event.action(), path)
+        elif event_type == QtCore.QEvent.Type.ActionRemoved:
+            self.remove_command(event.action())
+        return super().event_filter(watched, event)
+
+    def _fuzzy(self, token: str) -> typing.Set[int]:
+        """Return the commands having a text word that contains the letters of the token in order.
+
+        Only the distinct words starting with the first letter of the token are looked at.
+
+        :param token: The lower case token.
+        :return: The ids of the matching commands.
+        """
+        matches = set()
+        for word in self._text_words.get(token[0], ()):
+            position = 0
+            for char in token:
+                position = word.find(char, position) + 1
+                if not position:
+                    break
+            else:
+                matches |= self._text_prefixes[word]
+        return matches
+
+    @staticmethod
+    def _intersection(sets: typing.List[typing.Set[int]]) -> typing.Set[int]:
+        """Return the intersection of sets, starting from the smallest.
+
+        :param sets: The sets.
+        :return: The intersection.
+        """
+        sets = sorted(sets, key=len)
+        return sets[0].intersection(*sets[1:]) if sets[0] else set()
+
+    def _tiers(self, tokens: typing.List[str]) -> typing.Iterator[typing.Set[int]]:
+        """Yield the ids of the matching commands, tier by tier, best tier first.
+
+        :param tokens: The lower case tokens of the query.
+        """
+        empty = set()
+        text_matches = [self._text_prefixes.get(token, empty) for token in tokens]
+        tier = self._intersection(text_matches)
+        first = tier & self._first_prefixes.get(tokens[0], empty)
+        yield first
+        yield tier - first
+        seen = tier
+        word_matches = [
+            matches | self._other_prefixes.get(token, empty) for token, matches in zip(tokens, text_matches)
+        ]
+        tier = self._intersection(word_matches) - seen
+        yield tier
+        seen = seen | tier
+        yield self._intersection([matches | self._fuzzy(token) for token, matches in zip(tokens, word_matches)]) - seen
+
+    def search(self, query: str, limit: int = 20) -> typing.List[typing.Tuple[RibbonCommand, str, str]]:
+        """Search the commands matching a query, best matches first.
+
+        :param query: The query, its words are matched against the text, tooltip, status tip and path.
+        :param limit: The maximum number of results.
+        :return: A list of (command, text, path).
+        """
+        tokens = query.lower().split()
+        results = []
+        if not tokens:
+            return results
+        for tier in self._tiers(tokens):
+            if self._removed:
+                tier = tier - self._removed
+            for command_id in heapq.nsmallest(limit - len(results), tier, key=self._order.__getitem__):
+                command = self._commands[command_id]
+                if not shiboken6.isValid(command):
+                    self.remove_command(command)
+                    continue
+                results.append((command, self._texts[command_id], self._paths[command_id]))
+            if len(results) >= limit:
+                break
+        return results
+
+    @staticmethod
+    def run(command: RibbonCommand):
+        """Run a command, buttons are clicked and actions are triggered.
+
+        :param command: The command to run.
+        """
+        if isinstance(command, QtGui.QAction):
+            command.trigger()
+        else:
+            command.click()
+
+
+class RibbonCommandSearch(QtWidgets.QLineEdit):
+    """Search field running the commands of a ribbon, install it with :meth:`RibbonBar.add_title_widget`."""
+
+    #: Role of the command in the items of the results model
+    CommandRole = QtCore.Qt.ItemDataRole.UserRole + 1
+
+    #: Maximum number of results shown
+    _maximum_results = 12
+
+    def __init__(self, ribbon: "RibbonBar", placeholder: str = "Tell me what you want to do", parent=None):
+        """Create a new command search field.
+
+        :param ribbon: The ribbon whose commands are searched.
+        :param placeholder: The placeholder text of the field.
+        :param parent: The parent widget.
+        """
+        super().__init__(parent)
+        self._index = ribbon.command_index()
+        self.set_placeholder_text(placeholder)
+        self.set_clear_button_enabled(True)
+
+        self._model = QtGui.QStandardItemModel(self)
+        self._completer = QtWidgets.QCompleter(self._model, self)
+        self._completer.set_completion_mode(QtWidgets.QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        self._completer.set_max_visible_items(self._maximum_results)
+        self._completer.activated[QtCore.QModelIndex].connect(self._run_result)  # type: ignore
+        self.set_completer(self._completer)
+        self.textEdited.connect(self._update_results)  # type: ignore
+
+    def maximum_results(self) -> int:
+        """Return the maximum number of results shown.
+
+        :return: The maximum number of results.
+        """
+        return self._maximum_results
+
+    def set_maximum_results(self, count: int):
+        """Set the maximum number of results shown.
+
+        :param count: The maximum number of results.
+        """
+        self._maximum_results = count
+        self._completer.set_max_visible_items(count)
+
+    def _update_results(self, text: str):
+        """Search the commands and show the results.
+
+        :param text: The query.
+        """
+        self._model.clear()
+        for command, command_text, path in self._index.search(text, self._maximum_results):
+            item = QtGui.QStandardItem(command.icon(), command_text)
+            item.set_tool_tip(path)
+            item.set_data(command, self.CommandRole)
+            self._model.append_row(item)
+        self._completer.complete()
+
+    def _run_result(self, index: QtCore.QModelIndex):
+        """Run the command of a result and clear the field.
+
+        :param index: The index of the result in the completion model.
+        """
+        command = index.data(self.CommandRole)
+        # The text of the selected result is set after the signal, clear the field afterwards
+        QtCore.QTimer.single_shot(0, self.clear)
+        if command is not None and shiboken6.isValid(command):
+            self._index.run(command)
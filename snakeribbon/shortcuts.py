@@ -0,0 +1,202 @@
+import logging
+import typing
+
+from __feature__ import snake_case
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+from snakeribbon.constants import RibbonCategoryStyle
+
+if typing.TYPE_CHECKING:
+    from .category import RibbonCategory  # noqa: F401
+    from .ribbonbar import RibbonBar  # noqa: F401
+
+log = logging.getLogger(__name__)
+
+#: Anything a key sequence can be built from
+RibbonShortcutKey = typing.Union[
+    QtCore.Qt.Key, QtGui.QKeySequence, QtCore.QKeyCombination, QtGui.QKeySequence.StandardKey, str, int
+]
+#: A command run by a shortcut, a button is clicked, an action triggered and a callable called
+RibbonShortcutCommand = typing.Union[QtWidgets.QAbstractButton, QtGui.QAction, typing.Callable[[], typing.Any]]
+
+
+def register_shortcut(widget: QtWidgets.QWidget, shortcut: RibbonShortcutKey):
+    """Register the shortcut of a control in the registry of its ribbon.
+
+    Controls outside a ribbon have the shortcut set on themselves.
+
+    :param widget: The control, a button.
+    :param shortcut: The shortcut.
+    """
+    category = widget.parent_widget()
+    while category is not None and not hasattr(type(category), "shortcut_registry"):
+        category = category.parent_widget()
+    registry = category.shortcut_registry() if category is not None else None
+    if registry is None:
+        widget.set_shortcut(shortcut)
+    else:
+        registry.add_shortcut(shortcut, widget, category)
+
+
+class RibbonShortcutRegistry(QtCore.QObject):
+    """Shortcuts of a ribbon, one ``QShortcut`` per key sequence dispatching to the registered commands.
+
+    A key sequence is registered once in the global scope, or once per context category; the shortcuts of a
+    context category are only active while the category is visible. Registering a key sequence already used
+    in the same scope, or in the global scope and a context category, is a conflict: it is reported with
+    :attr:`conflict_detected` and a warning, and the first registration is kept.
+    """
+
+    #: Signal, a shortcut was not registered because of a conflict: key sequence, registered command, new command.
+    conflict_detected = QtCore.Signal(str, object, object)
+
+    def __init__(self, ribbon: "RibbonBar"):
+        """Create the shortcut registry of a ribbon.
+
+        :param ribbon: The ribbon, shortcuts are active while its window is active.
+        """
+        super().__init__(ribbon)
+        self._ribbon = ribbon
+        #: commands by key sequence and scope, None is the global scope
+        self._commands = {}  # type: typing.Dict[str, typing.Dict[typing.Optional[RibbonCategory], RibbonShortcutCommand]]
+        self._shortcuts = {}  # type: typing.Dict[str, QtGui.QShortcut]
+
+    @staticmethod
+    def key(shortcut: RibbonShortcutKey) -> str:
+        """Return the portable text of a shortcut, the key of the registry.
+
+        :param shortcut: The shortcut.
+        :return: The portable text.
+        """
+        return QtGui.QKeySequence(shortcut).to_string(QtGui.QKeySequence.SequenceFormat.PortableText)
+
+    @staticmethod
+    def _scope(category: typing.Optional["RibbonCategory"]) -> typing.Optional["RibbonCategory"]:
+        """Return the scope of the shortcuts of a category, only context categories have their own scope.
+
+        :param category: The category.
+        :return: The scope, None for the global scope.
+        """
+        if category is not None and category.category_style() == RibbonCategoryStyle.Context:
+            return category
+        return None
+
+    def add_shortcut(
+        self,
+        shortcut: RibbonShortcutKey,
+        command: RibbonShortcutCommand,
+        category: "RibbonCategory" = None,
+    ) -> bool:
+        """Register a shortcut.
+
+        :param shortcut: The shortcut.
+        :param command: The command to run.
+        :param category: The category of the command, the shortcut is scoped to it if it is a context category.
+        :return: True if the shortcut was registered, False if it conflicts with a registered one.
+        """
+        key = self.key(shortcut)
+        if not key:
+            raise ValueError(f"Invalid shortcut {shortcut!r}.")
+        scope = self._scope(category)
+        commands = self._commands.setdefault(key, {})
+        if scope in commands:
+            registered = commands[scope]
+        elif None in commands or (scope is None and commands):
+            # a global shortcut is alone in its key sequence
+            registered = next(iter(commands.values()))
+        else:
+            registered = None
+        if registered is not None:
+            log.warning("Shortcut %s of %r conflicts with %r, it is ignored.", key, command, registered)
+            self.conflict_detected.emit(key, registered, command)
+            return False
+        commands[scope] = command
+        if key not in self._shortcuts:
+            shortcut = QtGui.QShortcut(QtGui.QKeySequence(key), self._ribbon)
+            shortcut.set_context(QtCore.Qt.ShortcutContext.WindowShortcut)
+            shortcut.activated.connect(lambda: self._activated(key))  # type: ignore
+            self._shortcuts[key] = shortcut
+        self._update_shortcut(key)
+        return True
+
+    def remove_shortcut(self, shortcut: RibbonShortcutKey, category: "RibbonCategory" = None):
+        """Unregister a shortcut.
+
+        :param shortcut: The shortcut.
+        :param category: The category it was registered with.
+        """
+        key = self.key(shortcut)
+        commands = self._commands.get(key, {})
+        commands.pop(self._scope(category), None)
+        if not commands:
+            self._commands.pop(key, None)
+            shortcut = self._shortcuts.pop(key, None)
+            if shortcut is not None:
+                shortcut.set_enabled(False)
+                shortcut.delete_later()
+        else:
+            self._update_shortcut(key)
+
+    def command(
+        self, shortcut: RibbonShortcutKey, category: "RibbonCategory" = None
+    ) -> typing.Optional[RibbonShortcutCommand]:
+        """Return the command registered for a shortcut.
+
+        :param shortcut: The shortcut.
+        :param category: The category it was registered with.
+        :return: The command, None if the shortcut is not registered.
+        """
+        return self._commands.get(self.key(shortcut), {}).get(self._scope(category))
+
+    def shortcuts(self) -> typing.List[str]:
+        """Return the registered key sequences.
+
+        :return: The key sequences, in portable text.
+        """
+        return list(self._commands)
+
+    def _active(self, scope: typing.Optional["RibbonCategory"]) -> bool:
+        """Return whether the shortcuts of a scope are active.
+
+        :param scope: The scope.
+        :return: Whether the shortcuts are active.
+        """
+        return scope is None or self._ribbon.category_visible(scope)
+
+    def _update_shortcut(self, key: str):
+        """Enable the shortcut of a key sequence only if one of its scopes is active, so it does not eat the keys.
+
+        :param key: The key sequence.
+        """
+        self._shortcuts[key].set_enabled(any(self._active(scope) for scope in self._commands[key]))
+
+    def update_scopes(self):
+        """Enable or disable the shortcuts after context categories were shown or hidden."""
+        for key, commands in self._commands.items():
+            if None not in commands:
+                self._update_shortcut(key)
+
+    def _activated(self, key: str):
+        """Run the command of an activated shortcut.
+
+        :param key: The key sequence.
+        """
+        for scope, command in self._commands.get(key, {}).items():
+            if self._active(scope):
+                self.run(command)
+                return
+
+    @staticmethod
+    def run(command: RibbonShortcutCommand):
+        """Run a command.
+
+        :param command: The command.
+        """
+        if isinstance(command, QtWidgets.QAbstractButton):
+            if command.is_enabled():
+                command.click()
+        elif isinstance(command, QtGui.QAction):
+            command.trigger()
+        else:
+            command()
@@ -9,8 +9,12 @@ class RibbonTabBar(QtWidgets.QTabBar):
     """The TabBar for the title widget."""
     _context_category_top_margin = 0
     _context_category_dark_color_height = 5
-    _tab_colors: typing.Dict[str, typing.Union[QtCore.Qt.GlobalColor, QtGui.QColor]] = {}
-    _associated_tabs = {}
+    #: alpha of the background of context tabs
+    _context_category_light_alpha = 40
+    _tab_colors: typing.Dict[str, typing.Union[QtCore.Qt.GlobalColor, QtGui.QColor]]
+    _associated_tabs: typing.Dict[str, typing.List[str]]
+    #: text color, light and dark brushes of the colored tabs, keyed by the tab text
+    _color_cache: typing.Dict[str, typing.Tuple[QtGui.QColor, QtGui.QBrush, QtGui.QBrush]]
 
     def __init__(self, parent=None):
         """Create a new tab bar.
@@ -18,8 +22,11 @@ class RibbonTabBar(QtWidgets.QTabBar):
         :param parent: The parent widget.
         """
         super().__init__(parent)
+        self._tab_colors = {}
+        self._associated_tabs = {}
+        self._color_cache = {}
+        self._default_text_color = QtGui.QColor(QtCore.Qt.GlobalColor.black)
 
-        self.currentChanged.connect(self.change_color)
         self.set_draw_base(False)
 
     def index_of(self, tabName: str) -> int:
@@ -48,19 +55,41 @@ class RibbonTabBar(QtWidgets.QTabBar):
         :return: The index of the tab.
         """
         self._tab_colors[text] = color
+        self._color_cache.pop(text, None)
         return super().add_tab(text)
 
-    def add_associated_tabs(self, name: str, texts: typing.List[str], color: QtGui.QColor) -> typing.List[int]:
-        """Add associated multiple tabs which have the same color to the tab bar.
+    def insert_tab(self, index: int, text: str, color: QtGui.QColor = None, *args, **kwargs) -> int:
+        """Insert a new tab into the tab bar.
+
+        :param index: The index to insert the tab at.
+        :param text: The text of the tab.
+        :param color: The color of the tab.
+        :return: The index of the tab.
+        """
+        self._tab_colors[text] = color
+        self._color_cache.pop(text, None)
+        return super().insert_tab(index, text)
+
+    def associate_tabs(self, name: str, texts: typing.List[str], color: QtGui.QColor) -> None:
+        """Mark existing tabs as associated tabs which have the same color.
 
         :param name: The name of the context category.
         :param texts: The texts of the tabs.
         :param color: The color of the tabs.
-        :return: The indices of the tabs.
         """
         self._tab_colors[name] = color
         for text in texts:
             self._associated_tabs[text] = [t for t in texts if t != text]
+
+    def add_associated_tabs(self, name: str, texts: typing.List[str], color: QtGui.QColor) -> typing.List[int]:
+        """Add associated multiple tabs which have the same color to the tab bar.
+
+        :param name: The name of the context category.
+        :param texts: The texts of the tabs.
+        :param color: The color of the tabs.
+        :return: The indices of the tabs.
+        """
+        self.associate_tabs(name, texts, color)
         return [self.add_tab(text, color) for text in texts]
 
     def remove_associated_tabs(self, titles: typing.List[str]) -> None:
@@ -73,6 +102,7 @@ class RibbonTabBar(QtWidgets.QTabBar):
             if title in tabTitles:
                 self.remove_tab(self.index_of(title))
                 del self._tab_colors[title]
+                self._color_cache.pop(title, None)
                 if title in self._associated_tabs:
                     del self._associated_tabs[title]
 
@@ -83,13 +113,117 @@ class RibbonTabBar(QtWidgets.QTabBar):
         """
         return self._tab_colors[self.tab_text(self.current_index())]
 
+    def tab_color(self, text: str) -> typing.Optional[QtGui.QColor]:
+        """Return the color of the tab with the given text.
+
+        :param text: The text of the tab.
+        :return: The color of the tab, None if the tab has no color.
+        """
+        return self._tab_colors.get(text)
+
+    def set_tab_color(self, text: str, color: QtGui.QColor = None) -> None:
+        """Set the color of the tab with the given text.
+
+        :param text: The text of the tab.
+        :param color: The color of the tab, None to remove it.
+        """
+        self._tab_colors[text] = color
+        self._color_cache.pop(text, None)
+        self.update()
+
+    def container_sizes(self) -> typing.Dict[str, int]:
+        """Return the number of entries of the tab color containers, for memory accounting.
+
+        :return: The sizes, by container.
+        """
+        return {
+            "tab_colors": len(self._tab_colors),
+            "associated_tabs": len(self._associated_tabs),
+            "color_cache": len(self._color_cache),
+        }
+
     def change_color(self, inx: int) -> None:
-        """Change tab's color."""
-
-        if self.count() > 0:
-            currentTabText = self.tab_text(inx)
-            currentTabColor = self._tab_colors[currentTabText]
-            if currentTabColor is not None:
-                self.set_style_sheet("RibbonTabBar::tab:selected {color: %s;}" % QtGui.QColor(currentTabColor).name())
-            else:
-                self.set_style_sheet("RibbonTabBar::tab:selected {color: black;}")
+        """Change tab's color.
+
+        Tab colors are painted by :meth:`paint_event`, this only schedules a repaint.
+        """
+        self.update()
+
+    def _cached_colors(self, text: str) -> typing.Optional[typing.Tuple[QtGui.QColor, QtGui.QBrush, QtGui.QBrush]]:
+        """Return the cached text color, light and dark brushes of a colored tab.
+
+        :param text: The text of the tab.
+        :return: The colors, None if the tab has no color.
+        """
+        colors = self._color_cache.get(text)
+        if colors is None:
+            color = self._tab_colors.get(text)
+            if color is None:
+                return None
+            color = QtGui.QColor(color)
+            light = QtGui.QColor(color)
+            light.set_alpha(self._context_category_light_alpha)
+            colors = (color, QtGui.QBrush(light), QtGui.QBrush(color))
+            self._color_cache[text] = colors
+        return colors
+
+    def paint_event(self, event: QtGui.QPaintEvent) -> None:
+        """Paint the tabs, the selected tab text in its color and a header over the context tabs."""
+        painter = QtWidgets.QStylePainter(self)
+        option = QtWidgets.QStyleOptionTab()
+        current = self.current_index()
+        headers = []  # type: typing.List[typing.List]
+        previous = ""
+
+        for index in range(self.count()):
+            if not self.is_tab_visible(index):
+                continue
+            text = self.tab_text(index)
+            rect = self.tab_rect(index)
+            colors = self._cached_colors(text)
+            if colors is not None:
+                # Associated tabs share one header spanning the whole group
+                if headers and text in self._associated_tabs.get(previous, ()):
+                    headers[-1][0] = headers[-1][0].united(rect)
+                else:
+                    headers.append([rect, colors])
+            previous = text
+            if index != current and event.rect().intersects(rect):
+                self.init_style_option(option, index)
+                painter.draw_control(QtWidgets.QStyle.ControlElement.CE_TabBarTab, option)
+
+        # The selected tab is drawn last, on top of its neighbours
+        if 0 <= current < self.count() and self.is_tab_visible(current):
+            self.init_style_option(option, current)
+            colors = self._cached_colors(self.tab_text(current))
+            palette = option.palette
+            palette.set_color(
+                QtGui.QPalette.ColorRole.WindowText, colors[0] if colors is not None else self._default_text_color
+            )
+            option.palette = palette
+            painter.draw_control(QtWidgets.QStyle.ControlElement.CE_TabBarTab, option)
+
+        for rect, colors in headers:
+            if event.rect().intersects(rect):
+                self._paint_header(painter, rect, colors)
+
+    def _paint_header(
+        self,
+        painter: QtGui.QPainter,
+        rect: QtCore.QRect,
+        colors: typing.Tuple[QtGui.QColor, QtGui.QBrush, QtGui.QBrush],
+    ) -> None:
+        """Paint the tinted background and the dark header strip of a context tab or a group of associated tabs.
+
+        :param painter: The painter.
+        :param rect: The rect of the tabs.
+        :param colors: The cached colors of the tabs.
+        """
+        painter.fill_rect(rect, colors[1])
+        painter.fill_rect(
+            rect.left(),
+            rect.top() + self._context_category_top_margin,
+            rect.width(),
+            self._context_category_dark_color_height,
+            colors[2],
+        )
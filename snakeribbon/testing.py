@@ -0,0 +1,223 @@
+"""Synthetic ribbons for stress tests and reproductions.
+
+:func:`generate_spec` returns the data of :meth:`RibbonBar.add_categories_by` for a ribbon of any size, the same
+arguments always give the same ribbon. The command line builds one offscreen and reports its timings and memory:
+
+.. code-block:: shell
+
+    python -m snakeribbon.testing --categories 10 --panels 8 --widgets 20 --seed 1 --output spec.json
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+import typing
+
+from PySide6 import QtWidgets
+
+from __feature__ import snake_case  # noqa: F401
+
+from snakeribbon.constants import ColumnWise, RibbonCategoryStyle, RowWise
+
+#: Titles of the categories, numbered once they are all used
+_category_titles = ["Home", "Insert", "Design", "Layout", "References", "Review", "View", "Draw", "Data", "Tools"]
+
+#: Titles of the panels, numbered once they are all used
+_panel_titles = ["Clipboard", "Font", "Paragraph", "Styles", "Editing", "Tables", "Illustrations", "Links",
+                 "Comments", "Text", "Symbols", "Arrange", "Size", "Pages", "Media", "Proofing"]
+
+#: Texts of the buttons
+_button_texts = ["Paste", "Cut", "Copy", "Format", "Bold", "Italic", "Underline", "Align", "Indent", "Find",
+                 "Replace", "Select", "Table", "Picture", "Shapes", "Chart", "Link", "Comment", "Header", "Footer",
+                 "Margins", "Orientation", "Columns", "Track Changes", "Accept", "Reject", "Zoom", "Ruler", "Grid"]
+
+#: Widget types with their weight, some of them are not repeated in a panel
+_widget_weights = [
+    ("SmallButton", 30),
+    ("MediumButton", 12),
+    ("LargeButton", 14),
+    ("SmallToggleButton", 6),
+    ("ComboBox", 10),
+    ("SmallFontComboBox", 2),
+    ("LineEdit", 4),
+    ("Label", 4),
+    ("Separator", 8),
+    ("Gallery", 4),
+]
+
+
+def _titles(words: typing.Sequence[str], count: int, rng: random.Random) -> typing.List[str]:
+    """Return distinct titles picked from words, numbered once the words are all used."""
+    words = list(words)
+    rng.shuffle(words)
+    return [words[index % len(words)] + (f" {index // len(words) + 1}" if index >= len(words) else "")
+            for index in range(count)]
+
+
+def _widget(kind: str, index: int, rng: random.Random) -> typing.Dict[str, typing.Any]:
+    """Return the data of a widget of a type."""
+    text = rng.choice(_button_texts)
+    mode = RowWise if rng.random() < 0.2 else ColumnWise
+    if kind.endswith("Button"):
+        return {"type": kind, "args": [text], "kwargs": {"tooltip": f"{text} {index}", "mode": mode}}
+    if kind.endswith("ComboBox"):
+        items = [f"{text} {item}" for item in range(rng.randint(3, 12))] if kind == "ComboBox" else []
+        return {"type": kind, "args": [items], "kwargs": {"mode": mode}}
+    if kind in ("LineEdit", "Label"):
+        return {"type": kind, "args": [text] if kind == "Label" else [], "kwargs": {"mode": mode}}
+    if kind == "Separator":
+        return {"type": kind}
+    # row_span is a number of rows, so the data are the same once saved as JSON
+    return {"type": kind, "kwargs": {"minimum_width": rng.randrange(200, 601, 50), "row_span": 6}}
+
+
+def generate_spec(
+    categories: int = 5,
+    panels: int = 5,
+    widgets: int = 10,
+    seed: int = 0,
+    context: float = 0.2,
+) -> typing.Dict[str, typing.Dict]:
+    """Generate the data of a ribbon for :meth:`RibbonBar.add_categories_by`.
+
+    Panels mix small, medium and large buttons, toggle buttons, combo boxes, line edits, labels, separators and
+    galleries, placed column-wise or row-wise. The last categories are context categories.
+
+    :param categories: The number of categories.
+    :param panels: The number of panels of each category.
+    :param widgets: The number of widgets of each panel.
+    :param seed: The seed of the random generator, the same arguments always generate the same data.
+    :param context: The fraction of the categories that are context categories.
+    :return: The data, only made of dicts, lists, strings and numbers so it can be saved as JSON.
+    """
+    if min(categories, panels, widgets) < 0 or not 0 <= context <= 1:
+        raise ValueError("The counts must be positive and the context fraction between 0 and 1")
+    rng = random.Random(seed)
+    kinds, weights = zip(*_widget_weights)
+    context_count = int(categories * context)
+    spec = {}
+    panel_titles = []
+    for category_index, title in enumerate(_titles(_category_titles, categories, rng)):
+        if category_index >= categories - context_count:
+            category = spec[f"{title} Tools"] = {"style": RibbonCategoryStyle.Context, "panels": {}}
+        else:
+            category = spec[title] = {"style": RibbonCategoryStyle.Normal, "panels": {}}
+        if not panel_titles:
+            panel_titles = _titles(_panel_titles, panels, rng)
+        for panel_title in panel_titles:
+            panel = category["panels"][panel_title] = {
+                "show_panel_option_button": rng.random() < 0.5,
+                "widgets": {},
+            }
+            previous = None
+            for index in range(widgets):
+                kind = rng.choices(kinds, weights)[0]
+                # Separators and galleries never follow one another
+                while kind == previous and kind in ("Separator", "Gallery"):
+                    kind = rng.choices(kinds, weights)[0]
+                panel["widgets"][f"{kind}-{index}"] = _widget(kind, index, rng)
+                previous = kind
+    return spec
+
+
+def spec_size(spec: typing.Dict[str, typing.Dict]) -> typing.Dict[str, int]:
+    """Return the number of categories, panels and widgets of ribbon data.
+
+    :param spec: The data.
+    :return: The counts.
+    """
+    panels = [panel for category in spec.values() for panel in category.get("panels", {}).values()]
+    return {
+        "categories": len(spec),
+        "panels": len(panels),
+        "widgets": sum(len(panel.get("widgets", {})) for panel in panels),
+    }
+
+
+def _peak_rss() -> typing.Optional[int]:
+    """Return the peak resident memory of the process, in bytes, None where it is not available."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def main(argv: typing.Sequence[str] = None) -> int:
+    """Generate a ribbon, build it offscreen and report its timings and memory.
+
+    :param argv: The arguments, the ones of the process by default.
+    :return: The exit code.
+    """
+    parser = argparse.ArgumentParser(prog="python -m snakeribbon.testing", description=main.__doc__.split("\n")[0])
+    parser.add_argument("--categories", type=int, default=5, help="Number of categories (default 5).")
+    parser.add_argument("--panels", type=int, default=5, help="Number of panels of each category (default 5).")
+    parser.add_argument("--widgets", type=int, default=10, help="Number of widgets of each panel (default 10).")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random generator (default 0).")
+    parser.add_argument("--context", type=float, default=0.2, help="Fraction of context categories (default 0.2).")
+    parser.add_argument("--output", help="File to save the data to, as JSON.")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON.")
+    arguments = parser.parse_args(argv)
+
+    try:
+        spec = generate_spec(arguments.categories, arguments.panels, arguments.widgets, arguments.seed,
+                             arguments.context)
+    except ValueError as error:
+        parser.error(str(error))
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as output:
+            json.dump(spec, output, indent=1)
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    from snakeribbon.ribbonbar import RibbonBar
+
+    ribbon = RibbonBar()
+    ribbon.init()
+    ribbon.resize(1200, 200)
+    start = time.perf_counter()
+    ribbon.add_categories_by(spec)
+    built = time.perf_counter()
+    ribbon.show()
+    app.process_events()
+    shown = time.perf_counter()
+    memory = ribbon.memory_report()
+    peak_rss = _peak_rss()
+
+    # Tracing slows the allocations down, the Python peak is measured on a second build, not timed
+    traced = RibbonBar()
+    traced.init()
+    traced.resize(1200, 200)
+    tracemalloc.start()
+    traced.add_categories_by(spec)
+    _, python_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    traced.delete_later()
+
+    report = dict(
+        spec_size(spec),
+        seed=arguments.seed,
+        build_seconds=built - start,
+        show_seconds=shown - built,
+        python_peak_bytes=python_peak,
+        peak_rss_bytes=peak_rss,
+        objects=memory["objects"],
+        qwidgets=memory["widgets"],
+        style_sheet_bytes=memory["style_sheet_bytes"],
+        pixmap_bytes=memory["pixmap_bytes"],
+    )
+    if arguments.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for key, value in report.items():
+            print(f"{key:>18}: {value:.3f}" if isinstance(value, float) else f"{key:>18}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
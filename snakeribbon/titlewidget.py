@@ -4,24 +4,169 @@ from __feature__ import snake_case
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from snakeribbon.constants import RibbonIcon
-from snakeribbon.menu import RibbonMenu
 from snakeribbon.tabbar import RibbonTabBar
 from snakeribbon.utils import DataFile
 
+if typing.TYPE_CHECKING:
+    from snakeribbon.backstage import RibbonBackstageView  # noqa: F401
+    from snakeribbon.menu import RibbonMenu, RibbonMenuProvider  # noqa: F401
+
 
 class RibbonApplicationButton(QtWidgets.QToolButton):
     """Application button in the ribbon bar."""
 
-    def add_file_menu(self) -> RibbonMenu:
+    #: backstage view opened by the button, it replaces the file menu
+    _backstage_view: typing.Optional["RibbonBackstageView"] = None
+
+    def add_file_menu(self, provider: "RibbonMenuProvider" = None, threaded: bool = False) -> "RibbonMenu":
         """Add a new ribbon menu to the application button.
 
+        :param provider: The provider to populate the menu lazily from, see :meth:`RibbonMenu.set_provider`.
+        :param threaded: Whether to run the provider in a worker thread.
         :return: The new ribbon menu.
         """
+        from snakeribbon.menu import RibbonMenu
+
+        self._remove_backstage_view()
         menu = RibbonMenu(self)
+        if provider is not None:
+            menu.set_provider(provider, threaded)
         self.set_popup_mode(QtWidgets.QToolButton.ToolButtonPopupMode.InstantPopup)
         self.set_menu(menu)
         return menu
 
+    def add_backstage_view(self) -> "RibbonBackstageView":
+        """Add a backstage view opened by the application button, it replaces the file menu.
+
+        :return: The backstage view, the one already added if any.
+        """
+        from snakeribbon.backstage import RibbonBackstageView
+
+        if self._backstage_view is None:
+            self._backstage_view = RibbonBackstageView(self)
+            self.set_menu(None)
+            self.set_popup_mode(QtWidgets.QToolButton.ToolButtonPopupMode.DelayedPopup)
+            self.clicked.connect(self._show_backstage_view)  # type: ignore
+        return self._backstage_view
+
+    def _show_backstage_view(self):
+        """Open the backstage view."""
+        self._backstage_view.show_backstage()
+
+    def _remove_backstage_view(self):
+        """Delete the backstage view, if any, so the button opens the file menu again."""
+        if self._backstage_view is not None:
+            self.clicked.disconnect(self._show_backstage_view)  # type: ignore
+            self._backstage_view.hide_backstage()
+            self._backstage_view.delete_later()
+            self._backstage_view = None
+
+
+class RibbonWindowDragController(QtCore.QObject):
+    """Move the top-level window while a widget is dragged.
+
+    A system move is requested once per press gesture, after the drag threshold is exceeded, and the window
+    manager moves the window from there. Where system moves are unsupported the window is moved manually, at
+    most once per move interval.
+    """
+
+    _Idle = 0
+    _Pressed = 1
+    _SystemMove = 2
+    _ManualMove = 3
+
+    #: minimum interval between two manual moves, in milliseconds
+    _move_interval = 16
+
+    def __init__(self, widget: QtWidgets.QWidget):
+        """Create a new drag controller.
+
+        :param widget: The widget that is dragged.
+        """
+        super().__init__(widget)
+        self._widget = widget
+        self._state = self._Idle
+        self._press_position = QtCore.QPoint()
+        self._window_position = QtCore.QPoint()
+        self._target_position = None  # type: typing.Optional[QtCore.QPoint]
+        self._move_timer = QtCore.QTimer(self)
+        self._move_timer.set_single_shot(True)
+        self._move_timer.set_interval(self._move_interval)
+        self._move_timer.timeout.connect(self._flush_move)  # type: ignore
+
+    def is_dragging(self) -> bool:
+        """Return whether the window is being dragged.
+
+        :return: Whether the window is being dragged.
+        """
+        return self._state in (self._SystemMove, self._ManualMove)
+
+    def press(self, e: QtGui.QMouseEvent):
+        """Start a press gesture.
+
+        :param e: The mouse press event.
+        """
+        if e.button() != QtCore.Qt.MouseButton.LeftButton:
+            return
+        self._state = self._Pressed
+        self._press_position = e.global_position().to_point()
+        self._window_position = self._widget.window().frame_geometry().top_left()
+
+    def move(self, e: QtGui.QMouseEvent):
+        """Start the drag once the drag threshold is exceeded, or queue a manual move.
+
+        :param e: The mouse move event.
+        """
+        if self._state == self._Idle or self._state == self._SystemMove:
+            return
+        offset = e.global_position().to_point() - self._press_position
+        if self._state == self._Pressed:
+            if offset.manhattan_length() < QtWidgets.QApplication.start_drag_distance():
+                return
+            window = self._widget.window()
+            handle = window.window_handle()
+            if handle is not None and handle.start_system_move():
+                self._state = self._SystemMove
+                return
+            if window.is_maximized() or window.is_full_screen():
+                self._state = self._Idle
+                return
+            self._state = self._ManualMove
+        self._target_position = self._window_position + offset
+        if not self._move_timer.is_active():
+            self._flush_move()
+            self._move_timer.start()
+
+    def release(self, e: QtGui.QMouseEvent):
+        """End the press gesture.
+
+        :param e: The mouse release event.
+        """
+        if e.button() != QtCore.Qt.MouseButton.LeftButton:
+            return
+        self._move_timer.stop()
+        self._flush_move()
+        self._state = self._Idle
+
+    def double_click(self, e: QtGui.QMouseEvent):
+        """Toggle the maximized state of the window, the following moves are ignored until the next press.
+
+        :param e: The mouse double click event.
+        """
+        if e.button() != QtCore.Qt.MouseButton.LeftButton:
+            return
+        self._move_timer.stop()
+        self._target_position = None
+        self._state = self._Idle
+        window = self._widget.window()
+        window.show_normal() if window.is_maximized() else window.show_maximized()
+
+    def _flush_move(self):
+        """Move the window to the last queued position."""
+        if self._target_position is not None:
+            self._widget.window().move(self._target_position)
+            self._target_position = None
+
 
 class RibbonTitleLabel(QtWidgets.QLabel):
     """Title label in the ribbon bar."""
@@ -45,10 +190,6 @@ class RibbonTitleWidget(QtWidgets.QFrame):
     _quick_access_button_height = 20
     _right_button_height = 20
 
-    # Mouse move events
-    _start_point = None
-    _window_point = None
-
     @typing.overload
     def __init__(self, title=None, parent=None):
         pass
@@ -141,6 +282,9 @@ class RibbonTitleWidget(QtWidgets.QFrame):
         self._tab_bar_layout.add_widget(self._title_label, 1, QtCore.Qt.AlignmentFlag.AlignVCenter)
         self._tab_bar_layout.add_widget(self._right_tool_bar, 0, QtCore.Qt.AlignmentFlag.AlignVCenter)
 
+        # Window drag
+        self._drag_controller = RibbonWindowDragController(self)
+
     def application_button(self) -> RibbonApplicationButton:
         """Return the application button."""
         return self._application_button
@@ -234,6 +378,13 @@ class RibbonTitleWidget(QtWidgets.QFrame):
         """
         return self._right_tool_bar
 
+    def right_tool_buttons(self) -> typing.List[QtWidgets.QToolButton]:
+        """Return the buttons of the right toolbar.
+
+        :return: The buttons of the right toolbar.
+        """
+        return self._right_tool_buttons
+
     def add_right_tool_button(self, button: QtWidgets.QToolButton):
         """Add a widget to the right button bar.
 
@@ -301,15 +452,21 @@ class RibbonTitleWidget(QtWidgets.QFrame):
             widget = widget.parentWidget()
         return widget
 
+    def drag_controller(self) -> RibbonWindowDragController:
+        """Return the controller that moves the window while the title widget is dragged.
+
+        :return: The drag controller.
+        """
+        return self._drag_controller
+
     def mouse_press_event(self, e: QtGui.QMouseEvent):
-        self._start_point = e.pos()
-        self._window_point = self.top_level_widget().frame_geometry().top_left()
+        self._drag_controller.press(e)
 
     def mouse_move_event(self, e: QtGui.QMouseEvent):
-        relpos = e.pos() - self._start_point if self._start_point else None
-        self.top_level_widget().move(self._window_point + relpos) if self._window_point and relpos else None
-        self.top_level_widget().window_handle().start_system_move()
+        self._drag_controller.move(e)
+
+    def mouse_release_event(self, e: QtGui.QMouseEvent):
+        self._drag_controller.release(e)
 
-    def mouseDoubleClickEvent(self, e: QtGui.QMouseEvent):
-        mainwindow = self.top_level_widget()
-        mainwindow.show_normal() if mainwindow.is_maximized() else mainwindow.show_maximized()
+    def mouse_double_click_event(self, e: QtGui.QMouseEvent):
+        self._drag_controller.double_click(e)
@@ -1,11 +1,15 @@
 from __feature__ import snake_case
 
+import typing
+
 from PySide6 import QtCore
 from PySide6 import QtWidgets
 
-from snakeribbon.menu import RibbonMenu
 from snakeribbon.constants import RibbonButtonStyle
 
+if typing.TYPE_CHECKING:
+    from snakeribbon.menu import RibbonMenu, RibbonMenuProvider  # noqa: F401
+
 
 class RibbonToolButton(QtWidgets.QToolButton):
     """Tool button that is showed in the ribbon."""
@@ -104,11 +108,17 @@ class RibbonToolButton(QtWidgets.QToolButton):
         """
         return self._button_style
 
-    def add_ribbon_menu(self) -> RibbonMenu:
+    def add_ribbon_menu(self, provider: "RibbonMenuProvider" = None, threaded: bool = False) -> "RibbonMenu":
         """Add a ribbon menu for the button.
 
+        :param provider: The provider to populate the menu lazily from, see :meth:`RibbonMenu.set_provider`.
+        :param threaded: Whether to run the provider in a worker thread.
         :return: The added ribbon menu.
         """
+        from snakeribbon.menu import RibbonMenu
+
         menu = RibbonMenu()
+        if provider is not None:
+            menu.set_provider(provider, threaded)
         self.set_menu(menu)
         return menu
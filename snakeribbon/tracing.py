@@ -0,0 +1,185 @@
+"""Lightweight spans recording where the ribbon spends its time while it is built.
+
+Tracing is enabled with the ``SNAKERIBBON_TRACE`` environment variable or :func:`enable_tracing`. Spans are
+recorded to an in-memory ring buffer and exported in the Chrome ``trace_event`` format, open the file in
+``chrome://tracing`` or https://ui.perfetto.dev. If ``SNAKERIBBON_TRACE`` is a path ending with ``.json``,
+the trace is written to it when the interpreter exits.
+
+While tracing is disabled a traced function only costs one branch per call.
+"""
+import atexit
+import collections
+import functools
+import json
+import os
+import threading
+import time
+import typing
+
+#: Default number of spans kept, the oldest spans are dropped first
+DEFAULT_CAPACITY = 100000
+
+_enabled = False
+_events = collections.deque(maxlen=DEFAULT_CAPACITY)  # type: typing.Deque[typing.Tuple]
+
+
+def enable_tracing(capacity: int = DEFAULT_CAPACITY):
+    """Start recording spans.
+
+    :param capacity: The number of spans kept in the ring buffer.
+    """
+    global _enabled, _events
+    if capacity != _events.maxlen:
+        _events = collections.deque(_events, maxlen=capacity)
+    _enabled = True
+
+
+def disable_tracing():
+    """Stop recording spans, the recorded spans are kept."""
+    global _enabled
+    _enabled = False
+
+
+def tracing_enabled() -> bool:
+    """Return whether spans are recorded.
+
+    :return: Whether tracing is enabled.
+    """
+    return _enabled
+
+
+def clear_trace():
+    """Drop the recorded spans."""
+    _events.clear()
+
+
+def _record(name: str, category: str, start: int, args: typing.Optional[dict]):
+    """Record a span that started at a time, in nanoseconds, and ends now."""
+    _events.append((name, category, start, time.perf_counter_ns() - start, threading.get_ident(), args))
+
+
+class _Span(object):
+    """Context manager recording a span."""
+
+    __slots__ = ("_name", "_category", "_args", "_start")
+
+    def __init__(self, name: str, category: str, args: typing.Optional[dict]):
+        self._name = name
+        self._category = category
+        self._args = args
+        self._start = 0
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        _record(self._name, self._category, self._start, self._args)
+
+
+class _NullSpan(object):
+    """Context manager doing nothing, used while tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_null_span = _NullSpan()
+
+
+def span(name: str, category: str = "snakeribbon", **args) -> typing.ContextManager:
+    """Return a context manager recording a span around its block.
+
+    .. code-block:: python
+
+        with span("load theme", path=str(path)):
+            ...
+
+    :param name: The name of the span.
+    :param category: The category of the span.
+    :param args: Values shown with the span.
+    :return: The context manager.
+    """
+    if not _enabled:
+        return _null_span
+    return _Span(name, category, args or None)
+
+
+def traced(name: str = None, category: str = "snakeribbon") -> typing.Callable[[typing.Callable], typing.Callable]:
+    """Decorate a function so each call is recorded as a span.
+
+    :param name: The name of the spans, the qualified name of the function by default.
+    :param category: The category of the spans.
+    :return: The decorator.
+    """
+
+    def decorator(function: typing.Callable) -> typing.Callable:
+        label = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                _record(label, category, start, None)
+
+        return wrapper
+
+    return decorator
+
+
+def trace_events() -> typing.List[typing.Dict[str, typing.Any]]:
+    """Return the recorded spans as Chrome ``trace_event`` complete events.
+
+    :return: The events, timestamps and durations are in microseconds.
+    """
+    pid = os.getpid()
+    events = []
+    for name, category, start, duration, thread, args in list(_events):
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start / 1000,
+            "dur": duration / 1000,
+            "pid": pid,
+            "tid": thread,
+        }
+        if args:
+            event["args"] = {key: str(value) for key, value in args.items()}
+        events.append(event)
+    return events
+
+
+def export_chrome_trace(path: typing.Union[str, os.PathLike] = None) -> typing.Dict[str, typing.Any]:
+    """Export the recorded spans in the Chrome ``trace_event`` JSON format.
+
+    :param path: The file to write the trace to, None to only return it.
+    :return: The trace.
+    """
+    trace = {"traceEvents": trace_events(), "displayTimeUnit": "ms"}
+    if path is not None:
+        with open(path, "w", encoding="utf-8") as trace_file:
+            json.dump(trace, trace_file)
+    return trace
+
+
+def _enable_from_environment():
+    """Enable tracing if the ``SNAKERIBBON_TRACE`` environment variable is set."""
+    value = os.environ.get("SNAKERIBBON_TRACE", "")
+    if value.lower() in ("", "0", "false", "no", "off"):
+        return
+    enable_tracing()
+    if value.lower().endswith(".json"):
+        atexit.register(export_chrome_trace, value)
+
+
+_enable_from_environment()
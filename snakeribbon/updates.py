@@ -0,0 +1,127 @@
+from __feature__ import snake_case
+
+import collections
+import typing
+
+import shiboken6
+from PySide6 import QtCore, QtWidgets
+
+
+class RibbonUpdateQueue(QtCore.QObject):
+    """Thread-safe updates of the ribbon widgets.
+
+    Any thread posts the calls of widget setters, they are appended to a deque and applied on the GUI thread at
+    most ``rate`` times per second. Only the latest call of each setter of each widget is applied, so a worker
+    posting thousands of progress values per second costs one ``set_value`` per frame.
+
+    .. code-block:: python
+
+        updates = ribbon.update_queue()
+        progress = panel.add_progress_bar()
+
+        def work():  # on a worker thread
+            for step in range(100000):
+                ...
+                updates.set_value(progress, step)
+    """
+
+    #: Wakes the GUI thread up when the first update is posted after a flush
+    _wake = QtCore.Signal()
+
+    def __init__(self, rate: int = 60, parent=None):
+        """Create a new update queue, it must be created on the GUI thread.
+
+        :param rate: The maximum number of times the updates are applied per second.
+        :param parent: The parent object.
+        """
+        super().__init__(parent)
+        self._queue = collections.deque()  # type: typing.Deque[typing.Tuple[QtWidgets.QWidget, str, tuple]]
+        self._scheduled = False
+        self._flushes = 0
+        self._drained = 0
+        self._applied = 0
+        self._timer = QtCore.QTimer(self)
+        self._timer.set_single_shot(True)
+        self._timer.set_interval(max(1, 1000 // rate))
+        self._timer.timeout.connect(self.flush)  # type: ignore
+        self._wake.connect(self._schedule, QtCore.Qt.ConnectionType.QueuedConnection)  # type: ignore
+
+    def post(self, widget: QtWidgets.QWidget, setter: str, *args):
+        """Call a setter of a widget on the GUI thread, it can be called from any thread.
+
+        :param widget: The widget.
+        :param setter: The name of the setter, e.g. ``"set_value"``.
+        :param args: The arguments of the setter.
+        """
+        self._queue.append((widget, setter, args))
+        if not self._scheduled:
+            self._scheduled = True
+            self._wake.emit()
+
+    def set_value(self, widget: QtWidgets.QWidget, value: typing.Any):
+        """Set the value of a widget, e.g. a progress bar, from any thread.
+
+        :param widget: The widget.
+        :param value: The value.
+        """
+        self.post(widget, "set_value", value)
+
+    def set_text(self, widget: QtWidgets.QWidget, text: str):
+        """Set the text of a widget, e.g. a label or a button, from any thread.
+
+        :param widget: The widget.
+        :param text: The text.
+        """
+        self.post(widget, "set_text", text)
+
+    def set_enabled(self, widget: QtWidgets.QWidget, enabled: bool):
+        """Enable or disable a widget from any thread.
+
+        :param widget: The widget.
+        :param enabled: Whether the widget is enabled.
+        """
+        self.post(widget, "set_enabled", enabled)
+
+    def set_visible(self, widget: QtWidgets.QWidget, visible: bool):
+        """Show or hide a widget from any thread.
+
+        :param widget: The widget.
+        :param visible: Whether the widget is visible.
+        """
+        self.post(widget, "set_visible", visible)
+
+    def pending(self) -> int:
+        """Return the number of updates posted and not applied yet.
+
+        :return: The number of updates, before the latest calls of each setter are kept.
+        """
+        return len(self._queue)
+
+    def stats(self) -> typing.Dict[str, int]:
+        """Return the number of flushes and of updates applied, and of the ones dropped for a later call.
+
+        :return: The counts.
+        """
+        return {"flushes": self._flushes, "applied": self._applied, "coalesced": self._drained - self._applied}
+
+    def _schedule(self):
+        """Apply the updates once the interval since the last flush has elapsed."""
+        if not self._timer.is_active():
+            self._timer.start()
+
+    def flush(self):
+        """Apply the posted updates now, on the GUI thread, only the latest call of each setter is applied."""
+        self._scheduled = False
+        latest = {}  # type: typing.Dict[typing.Tuple[int, str], typing.Tuple[QtWidgets.QWidget, str, tuple]]
+        queue = self._queue
+        drained = 0
+        while queue:
+            widget, setter, args = queue.popleft()
+            latest[(id(widget), setter)] = (widget, setter, args)
+            drained += 1
+        for widget, setter, args in latest.values():
+            if shiboken6.isValid(widget):
+                getattr(widget, setter)(*args)
+        self._flushes += 1
+        self._drained += drained
+        self._applied += len(latest)
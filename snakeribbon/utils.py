@@ -1,9 +1,25 @@
 from __feature__ import snake_case
 
+import functools
 import os
-from typing import Union
+import re
+from typing import Callable, Sequence, Union
 
-from PySide6.QtWidgets import QWidget
+from PySide6.QtWidgets import QAbstractButton, QAbstractSlider, QWidget
+
+from snakeribbon.constants import Cancel, RibbonAsyncPolicy
+from snakeribbon.tracing import span, traced
+
+#: Flag of the code of coroutine functions, as ``inspect.CO_COROUTINE``
+_CO_COROUTINE = 0x80
+
+#: Dynamic property of a scroll bar holding the value set once its range allows it
+_pending_scroll_value = "snakeribbon_pending_value"
+#: Dynamic property of a scroll bar whose range changes apply the pending value
+_pending_scroll_connected = "snakeribbon_pending_connected"
+
+#: Modules of the future classes a slot may be annotated as returning
+_future_modules = ("asyncio.futures", "concurrent.futures._base")
 
 
 class _RegistryConnector:
@@ -25,9 +41,14 @@ class _RegistryConnector:
 
 class _DataFileConnector(_RegistryConnector):
 
+    @traced("DataFile.update_registry_data")
     def update_registry_data(self, icons: dict[str, Union[str, os.PathLike]]):
         self._registry.update(**icons)
 
+    def __call__(self, filename: str) -> None:
+        with span("DataFile", filename=filename):
+            return super().__call__(filename)
+
 
 DataFile = _DataFileConnector()
 
@@ -38,6 +59,7 @@ class _ThemeFileConnector(_RegistryConnector):
         super().__init__(*args, **kwargs)
         self._style_sheet = ""
 
+    @traced("ThemeFile.update_registry_data")
     def update_registry_data(self, target: QWidget, filename: Union[str, os.PathLike]):
         with open(filename, "r", encoding="utf-8") as output:
             self._style_sheet += output.read()
@@ -46,3 +68,85 @@ class _ThemeFileConnector(_RegistryConnector):
 
 
 ThemeFile = _ThemeFileConnector()
+
+
+def scroll_value(scroll_bar: QAbstractSlider) -> int:
+    """Return the value of a scroll bar, or the value set by :func:`set_scroll_value` that is not applied yet.
+
+    :param scroll_bar: The scroll bar.
+    :return: The value.
+    """
+    pending = scroll_bar.property(_pending_scroll_value)
+    return scroll_bar.value() if pending is None else pending
+
+
+def set_scroll_value(scroll_bar: QAbstractSlider, value: int):
+    """Set the value of a scroll bar, once its range allows it if the widget is not laid out yet.
+
+    Only the last value set is pending, it is dropped when the user moves the scroll bar.
+
+    :param scroll_bar: The scroll bar.
+    :param value: The value.
+    """
+    if value <= scroll_bar.maximum():
+        scroll_bar.set_property(_pending_scroll_value, None)
+        scroll_bar.set_value(value)
+        return
+    if not scroll_bar.property(_pending_scroll_connected):
+        # Connected once, the closures read the value pending when the range changes
+
+        def apply(minimum: int, maximum: int):
+            pending = scroll_bar.property(_pending_scroll_value)
+            if pending is not None and pending <= maximum:
+                scroll_bar.set_property(_pending_scroll_value, None)
+                scroll_bar.set_value(pending)
+
+        scroll_bar.rangeChanged.connect(apply)  # type: ignore
+        scroll_bar.actionTriggered.connect(lambda action: scroll_bar.set_property(_pending_scroll_value, None))
+        scroll_bar.set_property(_pending_scroll_connected, True)
+    scroll_bar.set_property(_pending_scroll_value, value)
+
+
+def is_async_slot(slot: Callable) -> bool:
+    """Return whether a slot runs without blocking, a coroutine function or a callable annotated as returning a
+    future, e.g. ``def export(self) -> concurrent.futures.Future``.
+
+    :param slot: The slot, it may be a bound method, a partial or a callable object.
+    :return: Whether the slot is asynchronous.
+    """
+    while isinstance(slot, (functools.partial, functools.partialmethod)):
+        slot = slot.func
+    function = getattr(slot, "__func__", slot)
+    if not hasattr(function, "__code__"):
+        function = getattr(type(slot), "__call__", None)
+    code = getattr(function, "__code__", None)
+    if code is None:
+        return False
+    if code.co_flags & _CO_COROUTINE:
+        return True
+    annotation = getattr(function, "__annotations__", {}).get("return")
+    if isinstance(annotation, str):
+        return re.search(r"\bFuture\b", annotation) is not None
+    annotation = getattr(annotation, "__origin__", annotation)
+    return any(
+        base.__name__ == "Future" and base.__module__ in _future_modules for base in getattr(annotation, "__mro__", ())
+    )
+
+
+def connect_slot(buttons: Sequence[QAbstractButton], slot: Callable, policy: RibbonAsyncPolicy = Cancel):
+    """Connect a slot to the clicked signal of buttons.
+
+    An asynchronous slot is run by a :class:`snakeribbon.asyncslots.RibbonAsyncCommand`, imported with asyncio
+    on the first one, other slots are connected as they are so Qt calls them as usual.
+
+    :param buttons: The buttons, e.g. a gallery button and its popup button.
+    :param slot: The slot.
+    :param policy: What a click does while an asynchronous slot is running.
+    """
+    if is_async_slot(slot):
+        from snakeribbon.asyncslots import RibbonAsyncCommand
+
+        RibbonAsyncCommand(buttons, slot, policy)
+    else:
+        for button in buttons:
+            button.clicked.connect(slot)  # type: ignore
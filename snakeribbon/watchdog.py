@@ -0,0 +1,260 @@
+from __feature__ import snake_case
+
+import collections
+import sys
+import threading
+import time
+import typing
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+from snakeribbon.category import RibbonCategory
+from snakeribbon.gallery import RibbonGallery
+from snakeribbon.panel import RibbonPanel, RibbonPanelOptionButton
+
+#: Events starting a command, their target is the widget the stall is attributed to
+_command_events = (
+    QtCore.QEvent.Type.MouseButtonRelease,
+    QtCore.QEvent.Type.KeyPress,
+    QtCore.QEvent.Type.Shortcut,
+)
+
+
+def command_target(watched: QtCore.QObject) -> typing.Optional[str]:
+    """Return the path of the ribbon command a widget or a shortcut triggers.
+
+    :param watched: The receiver of a mouse, key or shortcut event.
+    :return: The path, e.g. ``"Home / Clipboard / Paste"``, None if the receiver does not trigger a command.
+    """
+    if isinstance(watched, QtGui.QShortcut):
+        return f"shortcut {watched.key().to_string()}"
+    if isinstance(watched, QtWidgets.QMenu):
+        action = watched.active_action()
+        name = f"action {action.text()!r}" if action is not None else None
+    elif isinstance(watched, RibbonPanelOptionButton):
+        name = "panel option"
+    elif isinstance(watched, QtWidgets.QAbstractButton):
+        name = watched.text() or watched.tool_tip() or watched.object_name() or type(watched).__name__
+    else:
+        return None
+    if name is None:
+        return None
+    path = [name]
+    widget = watched.parent_widget()
+    while widget is not None:
+        if isinstance(widget, RibbonGallery):
+            path.append("gallery")
+        elif isinstance(widget, RibbonPanel):
+            path.append(widget.title())
+        elif isinstance(widget, RibbonCategory):
+            path.append(widget.title())
+        widget = widget.parent_widget()
+    return " / ".join(reversed(path))
+
+
+def _describe(frame) -> str:
+    """Return the qualified name and location of the code of a frame."""
+    code = frame.f_code
+    return f"{getattr(code, 'co_qualname', code.co_name)} ({code.co_filename}:{code.co_firstlineno})"
+
+
+def _location(frame) -> str:
+    """Return the line a frame is executing."""
+    return f"{getattr(frame.f_code, 'co_qualname', frame.f_code.co_name)} {frame.f_code.co_filename}:{frame.f_lineno}"
+
+
+class _SlotStalls(object):
+    """Stalls of a slot."""
+
+    __slots__ = ("stalls", "samples", "total", "longest", "lines")
+
+    def __init__(self):
+        self.stalls = 0
+        self.samples = 0
+        self.total = 0.0
+        self.longest = 0.0
+        self.lines = collections.Counter()  # type: typing.Counter[str]
+
+
+class RibbonStallWatchdog(QtCore.QObject):
+    """Detect the stalls of the GUI thread and attribute them to the ribbon commands.
+
+    A timer beats on the event loop. A monitoring thread checks the beats, and while one is late by more than
+    the threshold it samples the Python stack of the GUI thread with :func:`sys._current_frames`. The samples
+    of a stall are attributed to the slot called from the event loop, the outermost frame that was not on the
+    stack when the watchdog started, and to the ribbon command whose click, key or shortcut started the stall.
+    """
+
+    #: Emitted on the GUI thread after a stall, with its duration in seconds and its command and slot
+    stall_detected = QtCore.Signal(float, str)
+
+    def __init__(self, threshold: int = 100, interval: int = 50, sample_interval: int = 10, parent=None):
+        """Create a new watchdog, it is started with :meth:`start`.
+
+        :param threshold: The delay of a beat, in milliseconds, from which the GUI thread is stalled.
+        :param interval: The interval between two beats, in milliseconds.
+        :param sample_interval: The interval between two samples of the stack, in milliseconds.
+        :param parent: The parent object.
+        """
+        super().__init__(parent)
+        self._threshold = threshold / 1000
+        self._interval = interval / 1000
+        self._sample_interval = sample_interval / 1000
+        self._heartbeat = QtCore.QTimer(self)
+        self._heartbeat.set_timer_type(QtCore.Qt.TimerType.PreciseTimer)
+        self._heartbeat.set_interval(interval)
+        self._heartbeat.timeout.connect(self._beat)  # type: ignore
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None  # type: typing.Optional[threading.Thread]
+        self._gui_thread = 0
+        self._base_codes = frozenset()  # type: typing.FrozenSet
+        self._last_beat = 0.0
+        self._target = None  # type: typing.Optional[str]
+        self._slots = {}  # type: typing.Dict[typing.Tuple[str, str], _SlotStalls]
+
+    def threshold(self) -> int:
+        """Return the delay of a beat from which the GUI thread is stalled.
+
+        :return: The threshold in milliseconds.
+        """
+        return round(self._threshold * 1000)
+
+    def is_running(self) -> bool:
+        """Return whether the GUI thread is watched.
+
+        :return: Whether the watchdog is started.
+        """
+        return self._thread is not None
+
+    def start(self):
+        """Start watching the GUI thread, it must be called from the GUI thread or a RuntimeError is raised."""
+        if QtCore.QThread.current_thread() != QtWidgets.QApplication.instance().thread():
+            raise RuntimeError("The watchdog must be started from the GUI thread")
+        if self._thread is not None:
+            return
+        self._gui_thread = threading.get_ident()
+        frame, codes = sys._getframe(), set()
+        while frame is not None:
+            codes.add(frame.f_code)
+            frame = frame.f_back
+        self._base_codes = frozenset(codes)
+        self._last_beat = time.monotonic()
+        self._target = None
+        QtWidgets.QApplication.instance().install_event_filter(self)
+        self._heartbeat.start()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._monitor, name="snakeribbon-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop watching the GUI thread, the stalls are kept."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._heartbeat.stop()
+        QtWidgets.QApplication.instance().remove_event_filter(self)
+
+    def reset(self):
+        """Drop the stalls."""
+        with self._lock:
+            self._slots.clear()
+
+    def stalls(self, limit: int = 10) -> typing.List[typing.Dict[str, typing.Any]]:
+        """Return the slots that stalled the GUI thread the longest.
+
+        :param limit: The number of slots returned.
+        :return: The stalls by command and slot, with their count, number of samples, total and longest
+                 durations in seconds, and the lines sampled the most.
+        """
+        with self._lock:
+            slots = sorted(self._slots.items(), key=lambda item: item[1].total, reverse=True)[:limit]
+            return [
+                {
+                    "command": command,
+                    "slot": slot,
+                    "stalls": stalls.stalls,
+                    "samples": stalls.samples,
+                    "total": stalls.total,
+                    "longest": stalls.longest,
+                    "lines": stalls.lines.most_common(3),
+                }
+                for (command, slot), stalls in slots
+            ]
+
+    def report(self, limit: int = 10) -> str:
+        """Return the slots that stalled the GUI thread the longest, as text.
+
+        :param limit: The number of slots listed.
+        :return: The report.
+        """
+        lines = []
+        for rank, stall in enumerate(self.stalls(limit), 1):
+            lines.append(
+                f"{rank}. {stall['command']} -> {stall['slot']}: {stall['stalls']} stalls, "
+                f"{stall['total'] * 1000:.0f} ms total, {stall['longest'] * 1000:.0f} ms longest"
+            )
+            lines.extend(f"     {count:>4} samples at {line}" for line, count in stall["lines"])
+        return "\n".join(lines)
+
+    def event_filter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        """Record the command the event loop is about to run."""
+        if self._target is None and event.type() in _command_events:
+            self._target = command_target(watched)
+        return False
+
+    def _beat(self):
+        """Record that the event loop is running."""
+        self._last_beat = time.monotonic()
+        self._target = None
+
+    def _sample(self) -> typing.Optional[typing.Tuple[str, str]]:
+        """Return the slot and the line the GUI thread is running."""
+        frame = sys._current_frames().get(self._gui_thread)
+        if frame is None:
+            return None
+        innermost, entry = frame, None
+        while frame is not None:
+            if frame.f_code not in self._base_codes:
+                entry = frame
+            frame = frame.f_back
+        return (_describe(entry) if entry is not None else "<event loop>"), _location(innermost)
+
+    def _monitor(self):
+        """Sample the GUI thread while its beats are late."""
+        late = self._interval + self._threshold
+        stall_beat = None  # type: typing.Optional[float]
+        target, samples = None, []  # type: typing.Optional[str], typing.List[typing.Tuple[str, str]]
+        while not self._stop.wait(self._sample_interval):
+            beat = self._last_beat
+            if time.monotonic() - beat < late:
+                if stall_beat is not None and beat != stall_beat:
+                    self._record(target, samples, beat - stall_beat - self._interval)
+                    stall_beat = None
+                continue
+            if stall_beat is None:
+                stall_beat, target, samples = beat, self._target, []
+            sample = self._sample()
+            if sample is not None:
+                samples.append(sample)
+        if stall_beat is not None:
+            self._record(target, samples, time.monotonic() - stall_beat - self._interval)
+
+    def _record(self, target: typing.Optional[str], samples: typing.List[typing.Tuple[str, str]], duration: float):
+        """Attribute a stall to the slot sampled the most."""
+        if not samples:
+            return
+        slot = collections.Counter(slot for slot, _ in samples).most_common(1)[0][0]
+        key = (target or "<no command>", slot)
+        with self._lock:
+            stalls = self._slots.get(key)
+            if stalls is None:
+                stalls = self._slots[key] = _SlotStalls()
+            stalls.stalls += 1
+            stalls.samples += len(samples)
+            stalls.total += duration
+            stalls.longest = max(stalls.longest, duration)
+            stalls.lines.update(line for sampled, line in samples if sampled == slot)
+        self.stall_detected.emit(duration, f"{key[0]} -> {slot}")